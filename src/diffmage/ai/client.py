@@ -1,15 +1,39 @@
-import litellm
-from litellm import completion
-from litellm.types.utils import ModelResponse
-from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
-from typing import Union
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Generator, Optional, Union
+from pydantic import BaseModel
 from diffmage.ai.models import get_model_by_name
 from diffmage.ai.prompt_manager import (
     get_generation_system_prompt,
     get_evaluation_system_prompt,
 )
 
-litellm.enable_json_schema_validation = True
+if TYPE_CHECKING:
+    from litellm.types.utils import ModelResponse
+    from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+
+
+def _litellm() -> ModuleType:
+    """Import litellm on first use, since importing it dominates CLI start-up"""
+    import litellm
+
+    litellm.enable_json_schema_validation = True
+    return litellm
+
+
+def completion(**kwargs: Any) -> Union["ModelResponse", "CustomStreamWrapper"]:
+    """litellm.completion, importing litellm lazily"""
+    response: Union[ModelResponse, CustomStreamWrapper] = _litellm().completion(
+        **kwargs
+    )
+    return response
+
+
+async def acompletion(**kwargs: Any) -> Union["ModelResponse", "CustomStreamWrapper"]:
+    """litellm.acompletion, importing litellm lazily"""
+    response: Union[ModelResponse, CustomStreamWrapper] = await _litellm().acompletion(
+        **kwargs
+    )
+    return response
 
 
 class AIClient:
@@ -18,7 +42,10 @@ class AIClient:
 
     Methods:
         - generate_commit_message: Generate a commit message from a git analysis
+        - agenerate_commit_message: Async variant of generate_commit_message
         - evaluate_with_llm: Evaluate commit message quality using Chain of Thought reasoning
+        - aevaluate_with_llm: Async variant of evaluate_with_llm for concurrent evaluations
+        - evaluate_with_llm_stream: Streaming variant of evaluate_with_llm yielding text as it is generated
     """
 
     def __init__(
@@ -32,28 +59,33 @@ class AIClient:
         """Generate commit message from git analysis"""
 
         try:
-            response: Union[ModelResponse, CustomStreamWrapper] = completion(
-                model=self.model_config.name,
-                messages=[
-                    {"role": "system", "content": get_generation_system_prompt()},
-                    {"role": "user", "content": commit_prompt},
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                stream=False,
-            )
+            response = completion(**self._generation_request(commit_prompt))
+            return _message_content(response)
 
-            return response.choices[0].message.content.strip()  # type: ignore
+        except Exception as e:
+            raise ValueError(f"Error generating commit message: {e}")
+
+    async def agenerate_commit_message(self, commit_prompt: str) -> str:
+        """Async variant of generate_commit_message built on litellm's acompletion"""
+
+        try:
+            response = await acompletion(**self._generation_request(commit_prompt))
+            return _message_content(response)
 
         except Exception as e:
             raise ValueError(f"Error generating commit message: {e}")
 
-    def evaluate_with_llm(self, evaluation_prompt: str) -> str:
+    def evaluate_with_llm(
+        self,
+        evaluation_prompt: str,
+        response_format: Optional[type[BaseModel]] = None,
+    ) -> str:
         """
         Execute LLM call for commit message evaluation with structured JSON output.
 
         Args:
             evaluation_prompt: Complete evaluation prompt with a provided commit message and git diff
+            response_format: Structured output schema, defaults to EvaluationResponse
 
         Returns:
             str: JSON response that can be parsed into EvaluationResult
@@ -63,52 +95,181 @@ class AIClient:
         """
 
         try:
-            from diffmage.evaluation.models import EvaluationResponse
-
-            response: Union[ModelResponse, CustomStreamWrapper] = completion(
-                model=self.model_config.name,
-                messages=[
-                    {"role": "system", "content": get_evaluation_system_prompt()},
-                    {"role": "user", "content": evaluation_prompt},
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                stream=False,
-                response_format=EvaluationResponse,
+            response = completion(
+                **self._evaluation_request(evaluation_prompt, response_format)
             )
+            return _evaluation_content(response)
+
+        except Exception as e:
+            # If structured output fails, fall back to regular completion
+            try:
+                fallback_response = completion(
+                    **self._evaluation_request(evaluation_prompt, structured=False)
+                )
+                return _evaluation_content(fallback_response)
+
+            except Exception as fallback_error:
+                raise _evaluation_error(e, fallback_error)
+
+    async def aevaluate_with_llm(
+        self,
+        evaluation_prompt: str,
+        response_format: Optional[type[BaseModel]] = None,
+    ) -> str:
+        """
+        Async variant of evaluate_with_llm built on litellm's acompletion.
 
-            content = response.choices[0].message.content.strip()  # type: ignore
-            if not content:
-                raise ValueError("Empty response from model")
+        Lets callers keep several evaluations in flight at once, since each
+        call is bound by network latency rather than local compute.
 
-            return content
+        Args:
+            evaluation_prompt: Complete evaluation prompt with a provided commit message and git diff
+            response_format: Structured output schema, defaults to EvaluationResponse
+
+        Returns:
+            str: JSON response that can be parsed into EvaluationResult
+
+        Raises:
+            ValueError: If LLM request fails
+        """
+
+        try:
+            response = await acompletion(
+                **self._evaluation_request(evaluation_prompt, response_format)
+            )
+            return _evaluation_content(response)
 
         except Exception as e:
             # If structured output fails, fall back to regular completion
             try:
-                fallback_response: Union[ModelResponse, CustomStreamWrapper] = (
-                    completion(
-                        model=self.model_config.name,
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": get_evaluation_system_prompt(),
-                            },
-                            {"role": "user", "content": evaluation_prompt},
-                        ],
-                        temperature=self.temperature,
-                        max_tokens=self.max_tokens,
-                        stream=False,
-                    )
+                fallback_response = await acompletion(
+                    **self._evaluation_request(evaluation_prompt, structured=False)
                 )
+                return _evaluation_content(fallback_response)
+
+            except Exception as fallback_error:
+                raise _evaluation_error(e, fallback_error)
 
-                content = fallback_response.choices[0].message.content.strip()  # type: ignore
-                if not content:
-                    raise ValueError("Empty response from model")
+    def evaluate_with_llm_stream(
+        self,
+        evaluation_prompt: str,
+        response_format: Optional[type[BaseModel]] = None,
+    ) -> Generator[str, None, None]:
+        """
+        Streaming variant of evaluate_with_llm.
 
-                return content
+        Yields the response text in pieces as the model generates it, so the
+        caller can show progress and stop reading once the JSON is complete.
+        Unlike evaluate_with_llm there is no unstructured fallback: fragments
+        may already have been yielded when a request fails, so it is retried
+        by the caller if at all. The stream is closed once reading stops,
+        including when the caller stops early.
 
-            except Exception as fallback_error:
-                raise ValueError(
-                    f"Error evaluating commit message: {e}. Fallback also failed: {fallback_error}"
+        Args:
+            evaluation_prompt: Complete evaluation prompt with a provided commit message and git diff
+            response_format: Structured output schema, defaults to EvaluationResponse
+
+        Yields:
+            str: Consecutive fragments of the JSON response
+
+        Raises:
+            ValueError: If LLM request fails
+        """
+
+        stream: Any = None
+        try:
+            stream = completion(
+                **self._evaluation_request(
+                    evaluation_prompt, response_format, stream=True
                 )
+            )
+
+            for chunk in stream:
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
+
+        except Exception as e:
+            raise ValueError(f"Error evaluating commit message: {e}")
+
+        finally:
+            _close_stream(stream)
+
+    def _generation_request(self, commit_prompt: str) -> dict[str, Any]:
+        """completion() arguments for a commit message generation request"""
+
+        return self._request(get_generation_system_prompt(), commit_prompt)
+
+    def _evaluation_request(
+        self,
+        evaluation_prompt: str,
+        response_format: Optional[type[BaseModel]] = None,
+        structured: bool = True,
+        stream: bool = False,
+    ) -> dict[str, Any]:
+        """
+        completion() arguments for an evaluation request.
+
+        Structured requests ask for response_format, defaulting to
+        EvaluationResponse; the fallback request sends structured=False.
+        """
+
+        request = self._request(
+            get_evaluation_system_prompt(), evaluation_prompt, stream=stream
+        )
+        if structured:
+            from diffmage.evaluation.models import EvaluationResponse
+
+            request["response_format"] = response_format or EvaluationResponse
+        return request
+
+    def _request(
+        self, system_prompt: str, user_prompt: str, stream: bool = False
+    ) -> dict[str, Any]:
+        """completion() arguments shared by every request this client makes"""
+
+        return {
+            "model": self.model_config.name,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "stream": stream,
+        }
+
+
+def _message_content(response: Any) -> str:
+    """Stripped text of a non-streamed completion response"""
+    content: str = response.choices[0].message.content.strip()
+    return content
+
+
+def _evaluation_content(response: Any) -> str:
+    """Evaluation response text, rejecting empty responses"""
+    content = _message_content(response)
+    if not content:
+        raise ValueError("Empty response from model")
+    return content
+
+
+def _evaluation_error(error: Exception, fallback_error: Exception) -> ValueError:
+    """Error raised when both the structured and fallback evaluations fail"""
+    return ValueError(
+        f"Error evaluating commit message: {error}. Fallback also failed: {fallback_error}"
+    )
+
+
+def _close_stream(stream: Any) -> None:
+    """
+    Release a streamed response's connection.
+
+    litellm's sync stream wrapper has no close() of its own, so the provider
+    stream it wraps is closed instead.
+    """
+    for candidate in (stream, getattr(stream, "completion_stream", None)):
+        close = getattr(candidate, "close", None)
+        if callable(close):
+            close()
+            return
@@ -7,6 +7,9 @@ class ModelConfig:
     name: str
     display_name: str
     description: str
+    # Conservative token limit for prompt plus completion, used to keep
+    # oversize prompts from being sent at all
+    context_window: int = 128_000
 
 
 class SupportedModels(Enum):
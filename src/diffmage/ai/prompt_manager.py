@@ -6,6 +6,26 @@ from typing import Optional
 
 # Generation prompts
 
+# Static instructions lead the prompt and the per-commit data follows, so
+# every request shares an identical prefix that providers can cache
+_COMMIT_INSTRUCTIONS = """Generate a concise commit message for the <git_diff> at the end of this prompt.
+
+    Instructions:
+    - Use conventional commits format:<type>(<optional scope>): <description>
+    - Only return the commit message, nothing else.
+    - Use imperative mood ("add", "fix", "update", not "added", "fixed", "updated")
+    - Focus on WHAT changed and WHY, not HOW. Consider WHAT was impacted and WHY it was needed.
+
+    Common types:
+    - feat: New feature, enhancement, or functionality
+    - fix: Bug fix or error correction
+    - refactor: Code restructuring for readability, performance, or maintainability
+    - docs: Documentation changes only
+    - test: Adding or updating tests
+    - chore: Maintenance, dependencies, build changes
+
+"""
+
 
 def get_commit_prompt(
     diff_content: str,
@@ -28,22 +48,8 @@ def get_commit_prompt(
 
     context_info = f" ({', '.join(context_parts)})" if context_parts else ""
 
-    prompt = f"""Analyze the following <git_diff> and generate a concise commit message {context_info}:
-
-    Instructions:
-    - Use conventional commits format:<type>(<optional scope>): <description>
-    - Only return the commit message, nothing else.
-    - Use imperative mood ("add", "fix", "update", not "added", "fixed", "updated")
-    - Focus on WHAT changed and WHY, not HOW. Consider WHAT was impacted and WHY it was needed.
-
-    Common types:
-    - feat: New feature, enhancement, or functionality
-    - fix: Bug fix or error correction
-    - refactor: Code restructuring for readability, performance, or maintainability
-    - docs: Documentation changes only
-    - test: Adding or updating tests
-    - chore: Maintenance, dependencies, build changes
-
+    prompt = f"""{_COMMIT_INSTRUCTIONS}
+    Analyze the following <git_diff>{context_info}:
 
     <git_diff>
     {diff_content}
@@ -74,11 +80,7 @@ def get_generation_system_prompt() -> str:
     """
 
 
-def get_why_context_prompt(preliminary_message: str, why_context: str) -> str:
-    """
-    Build the prompt for enhancing an existing commit message with external 'why' context.
-    """
-    return f"""You are a Git expert. Your task is to decide whether to enhance a commit message with external context.
+_WHY_CONTEXT_INSTRUCTIONS = """You are a Git expert. Your task is to decide whether to enhance a commit message with external context.
 
     STRICT EVALUATION CRITERIA:
     - Does the <EXTERNAL_CONTEXT> explain a USER PROBLEM or BUSINESS NEED that's not obvious from the code changes or <ORIGINAL_COMMIT_MESSAGE>?
@@ -88,14 +90,6 @@ def get_why_context_prompt(preliminary_message: str, why_context: str) -> str:
 
     If any of these are true, return the <ORIGINAL_COMMIT_MESSAGE> EXACTLY as provided.
 
-    <ORIGINAL_COMMIT_MESSAGE>
-    {preliminary_message}
-    </ORIGINAL_COMMIT_MESSAGE>
-
-    <EXTERNAL_CONTEXT>
-    {why_context}
-    </EXTERNAL_CONTEXT>
-
     <INSTRUCTIONS>
     1. First decide: Does this <EXTERNAL_CONTEXT> add valuable WHY information that explains user problems, business needs, or meaningful impact that is not already clear from the <ORIGINAL_COMMIT_MESSAGE>?
 
@@ -109,6 +103,21 @@ def get_why_context_prompt(preliminary_message: str, why_context: str) -> str:
     - Keep it under 150 words total addition
     - DO NOT make up information that is not in the <EXTERNAL_CONTEXT> or that can not be inferred directly from the <ORIGINAL_COMMIT_MESSAGE> + <EXTERNAL_CONTEXT>
     </INSTRUCTIONS>
+"""
+
+
+def get_why_context_prompt(preliminary_message: str, why_context: str) -> str:
+    """
+    Build the prompt for enhancing an existing commit message with external 'why' context.
+    """
+    return f"""{_WHY_CONTEXT_INSTRUCTIONS}
+    <ORIGINAL_COMMIT_MESSAGE>
+    {preliminary_message}
+    </ORIGINAL_COMMIT_MESSAGE>
+
+    <EXTERNAL_CONTEXT>
+    {why_context}
+    </EXTERNAL_CONTEXT>
 
     ONLY RETURN THE FINAL COMMIT MESSAGE that will be submitted to the git commit. DO NOT INCLUDE YOUR REASONING OR ANYTHING ELSE.
 
@@ -132,12 +141,7 @@ def get_evaluation_system_prompt() -> str:
     """
 
 
-def get_evaluation_prompt(commit_message: str, git_diff: str) -> str:
-    """
-    Chain of Thought evaluation prompt with few-shot examples.
-    """
-
-    return f"""You are an expert code reviewer evaluating commit message quality using Chain-of-Though reasoning.
+_EVALUATION_GUIDELINES = """You are an expert code reviewer evaluating commit message quality using Chain-of-Though reasoning.
 
     If the commit message is untruthful, inaccurate, or misrepresents the code changes, return a score of 1 for both WHAT and WHY.
 
@@ -300,16 +304,9 @@ def get_evaluation_prompt(commit_message: str, git_diff: str) -> str:
     - WHAT: 3/5 - Core changes described: test addition for password utility, some important details missing about test coverage
     - WHY: 2/5 - Minimal reasoning: no explanation of why tests were needed or what problems they prevent
     </EXAMPLES>
-    NOW EVALUATE THE FOLLOWING COMMIT MESSAGE:
-    <COMMIT_MESSAGE>
-    {commit_message}
-    </COMMIT_MESSAGE>
-
-    <GIT_DIFF>
-    {git_diff}
-    </GIT_DIFF>
+"""
 
-    <CHAIN-OF-THOUGHT EVALUATION>
+_EVALUATION_CHAIN_OF_THOUGHT = """    <CHAIN-OF-THOUGHT EVALUATION>
     1. What changes do I see in the diff? Analyze ALL of them.
     2. How accurately and completely does the commit message describe these changes? (WHAT score)
     3. What purpose/goal do these changes serve?
@@ -324,7 +321,24 @@ def get_evaluation_prompt(commit_message: str, git_diff: str) -> str:
     - Be specific about what makes it good or bad
     - Ensure to define and mention the what and the why
     - Keep it concise (3-5 sentences)
-    </REASONING_INSTRUCTIONS>
+    </REASONING_INSTRUCTIONS>"""
+
+
+def get_evaluation_prompt(commit_message: str, git_diff: str) -> str:
+    """
+    Chain of Thought evaluation prompt with few-shot examples.
+    """
+
+    return f"""{_EVALUATION_GUIDELINES}    NOW EVALUATE THE FOLLOWING COMMIT MESSAGE:
+    <COMMIT_MESSAGE>
+    {commit_message}
+    </COMMIT_MESSAGE>
+
+    <GIT_DIFF>
+    {git_diff}
+    </GIT_DIFF>
+
+{_EVALUATION_CHAIN_OF_THOUGHT}
 
     ONLY RETURN THE JSON RESPONSE, NOTHING ELSE.
 
@@ -335,3 +349,46 @@ def get_evaluation_prompt(commit_message: str, git_diff: str) -> str:
         "reasoning": "<reasoning>",
         "confidence": <0.0-1.0>
     }}"""
+
+
+def get_evaluation_prompt_batch(pairs: list[tuple[str, str]]) -> str:
+    """
+    Chain of Thought evaluation prompt scoring several commits in one request.
+
+    Args:
+        pairs: (commit_message, git_diff) tuples. Each commit is tagged with its
+               index in the list so the response can be matched back to it.
+    """
+
+    commits = "\n\n".join(
+        f"""    <COMMIT id="{index}">
+    <COMMIT_MESSAGE>
+    {commit_message}
+    </COMMIT_MESSAGE>
+
+    <GIT_DIFF>
+    {git_diff}
+    </GIT_DIFF>
+    </COMMIT>"""
+        for index, (commit_message, git_diff) in enumerate(pairs)
+    )
+
+    return f"""{_EVALUATION_GUIDELINES}    NOW EVALUATE EACH OF THE FOLLOWING {len(pairs)} COMMITS INDEPENDENTLY:
+{commits}
+
+{_EVALUATION_CHAIN_OF_THOUGHT}
+
+    ONLY RETURN THE JSON RESPONSE, NOTHING ELSE. Include exactly one evaluation per commit id.
+
+    REQUIRED JSON RESPONSE:
+    {{
+        "evaluations": [
+            {{
+                "id": <commit id>,
+                "what_score": <1-5>,
+                "why_score": <1-5>,
+                "reasoning": "<reasoning>",
+                "confidence": <0.0-1.0>
+            }}
+        ]
+    }}"""
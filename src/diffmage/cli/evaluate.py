@@ -15,6 +15,9 @@ def evaluate(
         str, "--model", "-m", help="AI model to use for evaluation"
     ),
     repo_path: str = typer.Option(".", "--repo", "-r"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-evaluate instead of using a cached result"
+    ),
 ) -> None:
     """Evaluate a commit message and display the results to the console"""
 
@@ -22,7 +25,7 @@ def evaluate(
         model = get_default_model().name
 
     if commit_hash:
-        service = EvaluationService(model_name=model)
+        service = EvaluationService(model_name=model, use_cache=not no_cache)
         result, message = service.evaluate_commit(commit_hash, repo_path)
 
     else:
@@ -30,7 +33,7 @@ def evaluate(
             console.print("[red]Error: Commit message or commit hash is required[/red]")
             raise typer.Exit(1)
 
-        service = EvaluationService(model_name=model)
+        service = EvaluationService(model_name=model, use_cache=not no_cache)
         result, message = service.evaluate_staged_changes(message, repo_path)
 
     formatter = EvaluationDisplayFormatter(console)
@@ -1,3 +1,4 @@
+import functools
 import typer
 from rich.table import Table
 from diffmage.ai.models import SupportedModels, get_default_model, get_model_by_name
@@ -44,6 +45,13 @@ def generate(
 def _display_available_models() -> None:
     """Display all available models"""
 
+    console.print(_models_table())
+
+
+@functools.cache
+def _models_table() -> Table:
+    """Table of all available models, built once since SupportedModels is static"""
+
     table = Table(title="Available AI Models")
     table.add_column("Name", style="bold")
     table.add_column("Path", style="cyan", no_wrap=False)
@@ -55,4 +63,4 @@ def _display_available_models() -> None:
             model_config.display_name, model_config.name, model_config.description
         )
 
-    console.print(table)
+    return table
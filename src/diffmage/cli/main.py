@@ -1,4 +1,3 @@
-import json
 import typer
 from diffmage.core.models import CommitAnalysis
 from rich.table import Table
@@ -25,7 +24,7 @@ def analyze(
         analysis = parser.parse_staged_changes()
 
         if output_format == "json":
-            click.echo(json.dumps(analysis.to_ai_context(), indent=2))
+            click.echo(analysis.to_ai_bytes())
         elif output_format == "table":
             display_table_output(analysis)
         else:
@@ -25,19 +25,29 @@ def batch_report(
     export_json: bool = typer.Option(
         False, "--json", "-j", help="Export results to JSON"
     ),
+    concurrency: int = typer.Option(
+        10, "--concurrency", help="Maximum number of LLM requests in flight at once"
+    ),
+    batch_size: int = typer.Option(
+        1, "--batch-size", "-b", help="Number of commits evaluated per LLM request"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-evaluate commits instead of using cached results"
+    ),
 ) -> None:
     """Generate a report for a batch of commits"""
 
-    service = EvaluationService()
+    service = EvaluationService(model_name=model_name, use_cache=not no_cache)
 
     try:
-        reporter = EvaluationReport(service)
+        reporter = EvaluationReport(service, console)
 
         results = reporter.batch_evaluate_commits(
             from_commit,
             to_commit,
             repo_path,
-            model_name,
+            max_concurrency=concurrency,
+            batch_size=batch_size,
         )
 
         if export_csv:
@@ -64,6 +74,9 @@ def benchmark_stability(
     repo_path: str = typer.Option(
         ".", "--repo-path", "-r", help="Path to git repository"
     ),
+    concurrency: int = typer.Option(
+        10, "--concurrency", help="Maximum number of runs evaluated concurrently"
+    ),
 ) -> None:
     """Evaluate the stability of a commit message"""
 
@@ -78,9 +91,15 @@ def benchmark_stability(
             diff = analysis.get_combined_diff()
 
         evaluator = CommitMessageEvaluator(model_name)
-        benchmarks = EvaluationBenchmarks(evaluator)
-
-        result = benchmarks.stability_test(message, diff, runs, variance_threshold=0.2)
+        benchmarks = EvaluationBenchmarks(evaluator, console)
+
+        result = benchmarks.stability_test(
+            message,
+            diff,
+            runs,
+            variance_threshold=0.2,
+            max_concurrency=concurrency,
+        )
 
         if result["is_stable"]:
             console.print(
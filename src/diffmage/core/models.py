@@ -1,8 +1,12 @@
-from typing import Dict, Any
-from pydantic import BaseModel
+from typing import Dict, Any, Iterable, Iterator, NamedTuple
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import compress
+from pydantic import BaseModel, ConfigDict, model_validator
 from typing import Optional
 from enum import Enum
 from datetime import datetime
+import orjson
 
 
 class ChangeType(str, Enum):
@@ -20,46 +24,118 @@ class FileType(str, Enum):
     UNKNOWN = "unknown"
 
 
-class HunkLine(BaseModel):
+class HunkLine(NamedTuple):
     """Represents a line in a hunk"""
 
-    line_type: str
-    is_removed: bool
-    is_added: bool
-    is_context: bool
+    line_type: str  # '+', '-', or ' '
     content: str
     old_line_number: Optional[int]
     new_line_number: Optional[int]
 
+    @property
+    def is_added(self) -> bool:
+        return self.line_type == "+"
+
+    @property
+    def is_removed(self) -> bool:
+        return self.line_type == "-"
+
+    @property
+    def is_context(self) -> bool:
+        return self.line_type == " "
+
+
+@dataclass(frozen=True, slots=True)
+class DiffHunk:
+    """Represents a hunk in a diff
 
-class DiffHunk(BaseModel):
-    """Represents a hunk in a diff"""
+    Lines are stored column-wise: line_types holds one line type character
+    per line, aligned index-by-index with contents and the line number lists.
+    """
 
     old_start_line: int
     old_lines_count: int
     new_start_line: int
     new_lines_count: int
     section_header: str
-    lines: list[HunkLine]
+    line_types: str
+    contents: list[str]
+    old_line_numbers: list[Optional[int]]
+    new_line_numbers: list[Optional[int]]
+
+    @classmethod
+    def from_lines(
+        cls,
+        old_start_line: int,
+        old_lines_count: int,
+        new_start_line: int,
+        new_lines_count: int,
+        section_header: str,
+        lines: Iterable[HunkLine],
+    ) -> "DiffHunk":
+        """Build a hunk from individual HunkLine rows"""
+        line_types: list[str] = []
+        contents: list[str] = []
+        old_line_numbers: list[Optional[int]] = []
+        new_line_numbers: list[Optional[int]] = []
+
+        for line in lines:
+            line_types.append(line.line_type)
+            contents.append(line.content)
+            old_line_numbers.append(line.old_line_number)
+            new_line_numbers.append(line.new_line_number)
+
+        return cls(
+            old_start_line=old_start_line,
+            old_lines_count=old_lines_count,
+            new_start_line=new_start_line,
+            new_lines_count=new_lines_count,
+            section_header=section_header,
+            line_types="".join(line_types),
+            contents=contents,
+            old_line_numbers=old_line_numbers,
+            new_line_numbers=new_line_numbers,
+        )
+
+    @property
+    def lines(self) -> list[HunkLine]:
+        """Get the hunk lines as HunkLine rows"""
+        return [
+            HunkLine(*row)
+            for row in zip(
+                self.line_types,
+                self.contents,
+                self.old_line_numbers,
+                self.new_line_numbers,
+            )
+        ]
 
     @property
     def added_lines(self) -> list[str]:
         """Get only the added lines content of the hunk"""
-        return [line.content for line in self.lines if line.is_added]
+        return self._contents_of("+")
 
     @property
     def removed_lines(self) -> list[str]:
         """Get only the removed lines content of the hunk"""
-        return [line.content for line in self.lines if line.is_removed]
+        return self._contents_of("-")
 
     @property
     def context_lines(self) -> list[str]:
         """Get only the context lines (unchanged) of the hunk"""
-        return [line.content for line in self.lines if line.is_context]
+        return self._contents_of(" ")
+
+    def _contents_of(self, line_type: str) -> list[str]:
+        """Get the content of every line with the given line type"""
+        return list(compress(self.contents, map(line_type.__eq__, self.line_types)))
 
 
-class FileDiff(BaseModel):
-    """Represents changes to a single file in a git commit"""
+@dataclass(frozen=True)
+class FileDiff:
+    """Represents changes to a single file in a git commit
+
+    Not slotted so the rendered ai_context can be cached on the instance.
+    """
 
     old_path: Optional[str]
     new_path: Optional[str]
@@ -69,22 +145,17 @@ class FileDiff(BaseModel):
     lines_added: int
     lines_removed: int
     hunks: list[DiffHunk]
+    is_truncated: bool = False  # hunks omitted as too large or generated
 
     @property
     def all_added_content(self) -> str:
         """Get all added content across all hunks"""
-        lines = []
-        for hunk in self.hunks:
-            lines.extend(hunk.added_lines)
-        return "\n".join(lines)
+        return "\n".join(line for hunk in self.hunks for line in hunk.added_lines)
 
     @property
     def all_removed_content(self) -> str:
         """Get all removed content across all hunks"""
-        lines = []
-        for hunk in self.hunks:
-            lines.extend(hunk.removed_lines)
-        return "\n".join(lines)
+        return "\n".join(line for hunk in self.hunks for line in hunk.removed_lines)
 
     def get_ai_context(self) -> str:
         """Get context format for AI commit message generation
@@ -92,21 +163,29 @@ class FileDiff(BaseModel):
         Returns minimal git diff format focused on actual changes,
         not git plubming metadata.
         """
+        return self.ai_context
 
-        if not self.hunks:
-            return ""
+    @cached_property
+    def ai_context(self) -> str:
+        """Diff text for AI processing, built once per (immutable) FileDiff"""
+        return "\n".join(self.iter_ai_context())
 
-        lines = []
+    def iter_ai_context(self) -> Iterator[str]:
+        """Yield the lines of get_ai_context without joining them"""
+
+        if not self.hunks and not self.is_truncated:
+            return
 
         # Essential file info - what actually changed
-        old_path = self.old_path or "/dev/null"
-        new_path = self.new_path or "/dev/null"
-        lines.extend(
-            [
-                f"--- {old_path}",
-                f"+++ {new_path}",
-            ]
-        )
+        yield f"--- {self.old_path or '/dev/null'}"
+        yield f"+++ {self.new_path or '/dev/null'}"
+
+        if self.is_truncated:
+            yield (
+                f"... diff omitted ({self.lines_added} lines added, "
+                f"{self.lines_removed} lines removed)"
+            )
+            return
 
         # Diff content
         for hunk in self.hunks:
@@ -114,44 +193,53 @@ class FileDiff(BaseModel):
             header = f"@@ -{hunk.old_start_line},{hunk.old_lines_count} +{hunk.new_start_line},{hunk.new_lines_count} @@"
             if hunk.section_header:
                 header += f" {hunk.section_header}"
-            lines.append(header)
+            yield header
 
             # Context, Removed, and Added lines
-            for line in hunk.lines:
-                lines.append(f"{line.line_type}{line.content}")
-
-        return "\n".join(lines)
+            yield from map(str.__add__, hunk.line_types, hunk.contents)
 
 
 class CommitAnalysis(BaseModel):
     """Analysis of git commit changes for AI processing"""
 
+    model_config = ConfigDict(frozen=True)
+
     files: list[FileDiff]
-    total_files: int
-    total_lines_added: int
-    total_lines_removed: int
+    total_files: int = 0
+    total_lines_added: int = 0
+    total_lines_removed: int = 0
     branch_name: str
 
+    @model_validator(mode="before")
+    @classmethod
+    def _aggregate_totals(cls, data: Any) -> Any:
+        """Fill in any totals not given explicitly from the file diffs"""
+        if isinstance(data, dict) and "files" in data:
+            files = data["files"]
+            data = dict(data)
+            data.setdefault("total_files", len(files))
+            data.setdefault(
+                "total_lines_added", sum(file.lines_added for file in files)
+            )
+            data.setdefault(
+                "total_lines_removed", sum(file.lines_removed for file in files)
+            )
+        return data
+
     def to_ai_context(self) -> Dict[str, Any]:
-        """Export structured data for AI processing"""
+        """
+        Export structured data for AI processing.
+
+        Each call returns a new dict timestamped at the call, so callers may
+        modify it freely; only the per-file entries are built once.
+        """
         return {
             "summary": {
                 "files_changed": self.total_files,
                 "lines_added": self.total_lines_added,
                 "lines_removed": self.total_lines_removed,
             },
-            "files": [
-                {
-                    "path": file_diff.new_path,
-                    "diff_content": file_diff.get_ai_context,
-                    "type": file_diff.file_type.value,
-                    "change_type": file_diff.change_type.value,
-                    "lines_added": file_diff.lines_added,
-                    "lines_removed": file_diff.lines_removed,
-                    "is_binary": file_diff.is_binary,
-                }
-                for file_diff in self.files
-            ],
+            "files": [dict(file_context) for file_context in self.file_contexts],
             "context": {
                 # TODO: Add more context about the repository
                 "repository_context": f"Git repository analysis for branch {self.branch_name}",
@@ -159,17 +247,45 @@ class CommitAnalysis(BaseModel):
             },
         }
 
+    @cached_property
+    def file_contexts(self) -> tuple[Dict[str, Any], ...]:
+        """Per-file entries of to_ai_context, built once per (immutable) analysis"""
+        return tuple(
+            {
+                "path": file_diff.new_path,
+                "diff_content": file_diff.ai_context,
+                "type": file_diff.file_type.value,
+                "change_type": file_diff.change_type.value,
+                "lines_added": file_diff.lines_added,
+                "lines_removed": file_diff.lines_removed,
+                "is_binary": file_diff.is_binary,
+            }
+            for file_diff in self.files
+        )
+
+    def to_ai_bytes(self) -> bytes:
+        """Export to_ai_context as indented JSON bytes"""
+        return orjson.dumps(self.to_ai_context(), option=orjson.OPT_INDENT_2)
+
     def get_combined_diff(self) -> str:
         """Get all file diffs combined into a single git diff format"""
+        return self.combined_diff
+
+    @cached_property
+    def combined_diff(self) -> str:
+        """Combined diff text, built once per (immutable) CommitAnalysis"""
+        return "\n".join(self.iter_combined_diff())
 
-        if not self.files:
-            return ""
+    def iter_combined_diff(self) -> Iterator[str]:
+        """Yield the lines of get_combined_diff, with a blank line between files"""
 
-        all_diffs = []
+        first = True
         for file_diff in self.files:
-            if not file_diff.is_binary:
-                diff_content = file_diff.get_ai_context()
-                if diff_content:
-                    all_diffs.append(diff_content)
+            if file_diff.is_binary or not (file_diff.hunks or file_diff.is_truncated):
+                continue
+
+            if not first:
+                yield ""
+            first = False
 
-        return "\n\n".join(all_diffs)
+            yield from file_diff.iter_ai_context()
@@ -1,11 +1,14 @@
-from typing import TypedDict
+from typing import Optional, TypedDict
+import asyncio
+import math
 import time
-import statistics
 from datetime import datetime
 from rich.table import Table
 from rich.console import Console
 from diffmage.evaluation.commit_message_evaluator import CommitMessageEvaluator
-from rich.progress import Progress
+from diffmage.evaluation.models import EvaluationResult
+from diffmage.utils import event_loop
+from rich.progress import Progress, TaskID
 
 
 class ScoreStats(TypedDict):
@@ -56,31 +59,44 @@ class EvaluationBenchmarks:
     Benchmarking and validation tools for LLM based commit message evaluation.
     """
 
-    def __init__(self, evaluator: CommitMessageEvaluator):
-        self.console = Console()
+    def __init__(
+        self, evaluator: CommitMessageEvaluator, console: Optional[Console] = None
+    ):
+        self.console = console or Console()
         self.evaluator = evaluator
 
     def stability_test(
-        self, message: str, diff: str, runs: int = 3, variance_threshold: float = 0.2
+        self,
+        message: str,
+        diff: str,
+        runs: int = 3,
+        variance_threshold: float = 0.2,
+        max_concurrency: int = 10,
     ) -> StabilityTestResult:
         """
         Run a stability test on the evaluator.
+
+        Runs are evaluated concurrently (at most max_concurrency in flight), so
+        per-run execution times include any queueing at the provider rather
+        than isolated single-request latency.
         """
         if not message or not diff:
             raise ValueError("Message and diff are required for stability test")
 
-        results: list[RunResult] = []
-        execution_times: list[float] = []
         with Progress(console=self.console) as progress:
             task = progress.add_task("Evaluating...", total=runs)
-            for run in range(runs):
-                start_time = time.time()
-                result = self.evaluator.evaluate_commit_message(message, diff)
-
-                execution_time = time.time() - start_time
-                execution_times.append(execution_time)
+            evaluations = event_loop.run(
+                self._evaluate_runs(
+                    message, diff, runs, max_concurrency, progress, task
+                )
+            )
 
-                run_data: RunResult = {
+        results: list[RunResult] = []
+        execution_times: list[float] = []
+        for run, (result, execution_time) in enumerate(evaluations):
+            execution_times.append(execution_time)
+            results.append(
+                {
                     "run": run + 1,
                     "what_score": result.what_score,
                     "why_score": result.why_score,
@@ -88,12 +104,7 @@ class EvaluationBenchmarks:
                     "confidence": result.confidence,
                     "execution_time": execution_time,
                 }
-                results.append(run_data)
-
-                progress.update(task, advance=1)
-                self.console.print(
-                    f"   Run {run + 1}: WHAT={result.what_score:.1f}, WHY={result.why_score:.1f}, OVERALL={result.overall_score:.1f} completed in {execution_time}s"
-                )
+            )
 
         stats = self._calculate_statistics(results, execution_times)
         max_variance = self._determine_stability(stats)
@@ -112,6 +123,37 @@ class EvaluationBenchmarks:
             "timestamp": datetime.now().isoformat(),
         }
 
+    async def _evaluate_runs(
+        self,
+        message: str,
+        diff: str,
+        runs: int,
+        max_concurrency: int,
+        progress: Progress,
+        task: TaskID,
+    ) -> list[tuple[EvaluationResult, float]]:
+        """
+        Evaluate the same message and diff runs times concurrently.
+
+        Returns (result, execution_time) tuples in run order.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def evaluate_run(run: int) -> tuple[EvaluationResult, float]:
+            async with semaphore:
+                start_time = time.perf_counter()
+                result = await self.evaluator.aevaluate_commit_message(message, diff)
+                execution_time = time.perf_counter() - start_time
+
+            progress.update(task, advance=1)
+            self.console.print(
+                f"   Run {run + 1}: WHAT={result.what_score:.1f}, WHY={result.why_score:.1f}, OVERALL={result.overall_score:.1f} completed in {execution_time}s"
+            )
+
+            return result, execution_time
+
+        return await asyncio.gather(*(evaluate_run(run) for run in range(runs)))
+
     def _calculate_statistics(
         self, results: list[RunResult], execution_times: list[float]
     ) -> BenchmarkStats:
@@ -122,15 +164,23 @@ class EvaluationBenchmarks:
         why_scores = [r["why_score"] for r in results]
         overall_scores = [r["overall_score"] for r in results]
 
+        count = len(execution_times)
+        mean_time = math.fsum(execution_times) / count
+        std_time = (
+            math.sqrt(
+                math.fsum((t - mean_time) ** 2 for t in execution_times) / (count - 1)
+            )
+            if count > 1
+            else 0.0
+        )
+
         return {
             "what": self._calculate_score_variance(what_scores),
             "why": self._calculate_score_variance(why_scores),
             "overall": self._calculate_score_variance(overall_scores),
             "execution_time": {
-                "mean": statistics.mean(execution_times),
-                "std": statistics.stdev(execution_times)
-                if len(execution_times) > 1
-                else 0,
+                "mean": mean_time,
+                "std": std_time,
                 "min": min(execution_times),
                 "max": max(execution_times),
             },
@@ -158,13 +208,30 @@ class EvaluationBenchmarks:
                 "range": 0.0,
             }
 
+        # One sort gives min, max and median; mean and std reuse the sorted list
+        ordered = sorted(scores)
+        count = len(ordered)
+        middle = count // 2
+
+        mean = math.fsum(ordered) / count
+        median = (
+            ordered[middle]
+            if count % 2
+            else (ordered[middle - 1] + ordered[middle]) / 2
+        )
+        std = (
+            math.sqrt(math.fsum((score - mean) ** 2 for score in ordered) / (count - 1))
+            if count > 1
+            else 0.0
+        )
+
         return {
-            "mean": statistics.mean(scores),
-            "median": statistics.median(scores),
-            "std": statistics.stdev(scores) if len(scores) > 1 else 0,
-            "min": min(scores),
-            "max": max(scores),
-            "range": max(scores) - min(scores),
+            "mean": mean,
+            "median": median,
+            "std": std,
+            "min": ordered[0],
+            "max": ordered[-1],
+            "range": ordered[-1] - ordered[0],
         }
 
     def _display_stability_results(
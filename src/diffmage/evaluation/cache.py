@@ -0,0 +1,86 @@
+"""
+Persistent on-disk cache for LLM commit message evaluations.
+"""
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+from diffmage.evaluation.models import EvaluationResult
+
+
+def get_default_cache_dir() -> Path:
+    """Directory holding diffmage's evaluation cache (honours XDG_CACHE_HOME)"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "diffmage" / "eval"
+
+
+def is_cache_enabled() -> bool:
+    """Whether the evaluation cache may be used (DIFFMAGE_EVAL_CACHE=0 disables it)"""
+    return os.environ.get("DIFFMAGE_EVAL_CACHE", "1").strip() != "0"
+
+
+class EvaluationCache:
+    """
+    SQLite backed memoization of evaluation results.
+
+    Entries are keyed by a hash of (model, commit message, git diff), so the
+    same commit evaluated again with the same model skips the LLM round-trip.
+    Cache errors are never fatal: a failed read is a miss, a failed write is
+    ignored.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path or get_default_cache_dir() / "evaluations.sqlite3"
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(model_name: str, commit_message: str, git_diff: str) -> str:
+        """Build the cache key for an evaluation"""
+        payload = f"{model_name}\0{commit_message}\0{git_diff}".encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[EvaluationResult]:
+        """Return the cached result for key, or None on a miss"""
+        try:
+            row = (
+                self._connect()
+                .execute("SELECT result FROM evaluations WHERE key = ?", (key,))
+                .fetchone()
+            )
+        except (sqlite3.Error, OSError):
+            return None
+
+        if row is None:
+            return None
+
+        try:
+            return EvaluationResult.model_validate_json(row[0])
+        except Exception:
+            return None
+
+    def set(self, key: str, result: EvaluationResult) -> None:
+        """Store result under key"""
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO evaluations (key, result) VALUES (?, ?)",
+                    (key, result.model_dump_json()),
+                )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database on first use"""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations "
+                "(key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+            )
+            self._connection = connection
+        return self._connection
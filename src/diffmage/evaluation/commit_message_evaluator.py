@@ -6,13 +6,24 @@ Evaluating Generated Commit Messages with Large Language Models:
 https://arxiv.org/pdf/2507.10906
 """
 
+import asyncio
 import json
 
-from diffmage.ai.prompt_manager import get_evaluation_prompt
-from diffmage.evaluation.models import EvaluationResult
+from diffmage.ai.prompt_manager import (
+    get_evaluation_prompt,
+    get_evaluation_prompt_batch,
+)
+from diffmage.evaluation.cache import EvaluationCache
+from diffmage.evaluation.models import (
+    EvaluationBatchResponse,
+    EvaluationResponse,
+    EvaluationResult,
+)
 from diffmage.ai.models import get_default_model
 from diffmage.ai.client import AIClient
-from typing import Optional
+from diffmage.utils.batching import chunked
+from diffmage.utils.json_stream import read_json_object
+from typing import Any, Callable, Iterator, Optional
 
 
 class CommitMessageEvaluator:
@@ -25,7 +36,13 @@ class CommitMessageEvaluator:
 
     """
 
-    def __init__(self, model_name: Optional[str] = None, temperature: float = 0.0):
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        temperature: float = 0.0,
+        cache: Optional[EvaluationCache] = None,
+        ai_client: Optional[AIClient] = None,
+    ):
         """
         Initialize the LLM evaluator.
 
@@ -33,6 +50,8 @@ class CommitMessageEvaluator:
             model_name: LLM model to use for evaluation.
             temperature: Sampling temperature (0.0-1.0).
                         Low values (0.1) recommended for consistent evaluation.
+            cache: Optional persistent cache of previous evaluations.
+            ai_client: Existing client to share; one is created when omitted.
         """
 
         if model_name is None:
@@ -40,7 +59,10 @@ class CommitMessageEvaluator:
         else:
             self.model_name = model_name
 
-        self.ai_client = AIClient(model_name=self.model_name, temperature=temperature)
+        self.ai_client = ai_client or AIClient(
+            model_name=self.model_name, temperature=temperature
+        )
+        self.cache = cache
 
     def evaluate_commit_message(
         self, commit_message: str, git_diff: str
@@ -55,6 +77,215 @@ class CommitMessageEvaluator:
             git_diff: Git diff in unified format showing the actual changes.
         """
 
+        known_result = self._evaluate_without_llm(commit_message, git_diff)
+        if known_result is not None:
+            return known_result
+
+        try:
+            evaluation_prompt = get_evaluation_prompt(commit_message, git_diff)
+            response = self.ai_client.evaluate_with_llm(evaluation_prompt)
+        except Exception as e:
+            raise ValueError(f"Failed to evaluate commit message: {e}")
+
+        result = self._parse_evaluation_response(response)
+        self._cache_result(commit_message, git_diff, result)
+
+        return result
+
+    def evaluate_commit_message_stream(
+        self,
+        commit_message: str,
+        git_diff: str,
+        on_chunk: Optional[Callable[[str], None]] = None,
+    ) -> EvaluationResult:
+        """
+        Streaming variant of evaluate_commit_message.
+
+        The response is read as it is generated and parsed as soon as its
+        JSON object closes, without waiting for the stream to finish.
+
+        Args:
+            commit_message: The commit message to evaluate.
+            git_diff: Git diff in unified format showing the actual changes.
+            on_chunk: Called with each piece of the response as it arrives,
+                      e.g. to display progress.
+        """
+
+        known_result = self._evaluate_without_llm(commit_message, git_diff)
+        if known_result is not None:
+            return known_result
+
+        try:
+            evaluation_prompt = get_evaluation_prompt(commit_message, git_diff)
+            chunks: Iterator[str] = self.ai_client.evaluate_with_llm_stream(
+                evaluation_prompt
+            )
+            if on_chunk is not None:
+                chunks = _tap(chunks, on_chunk)
+            response = read_json_object(chunks)
+        except Exception as e:
+            raise ValueError(f"Failed to evaluate commit message: {e}")
+
+        result = self._parse_evaluation_response(response)
+        self._cache_result(commit_message, git_diff, result)
+
+        return result
+
+    async def aevaluate_commit_message(
+        self, commit_message: str, git_diff: str
+    ) -> EvaluationResult:
+        """
+        Async variant of evaluate_commit_message.
+
+        Args:
+            commit_message: The commit message to evaluate.
+            git_diff: Git diff in unified format showing the actual changes.
+        """
+
+        known_result = self._evaluate_without_llm(commit_message, git_diff)
+        if known_result is not None:
+            return known_result
+
+        try:
+            evaluation_prompt = get_evaluation_prompt(commit_message, git_diff)
+            response = await self.ai_client.aevaluate_with_llm(evaluation_prompt)
+        except Exception as e:
+            raise ValueError(f"Failed to evaluate commit message: {e}")
+
+        result = self._parse_evaluation_response(response)
+        self._cache_result(commit_message, git_diff, result)
+
+        return result
+
+    def evaluate_batch(
+        self, pairs: list[tuple[str, str]], batch_size: int = 8
+    ) -> list[EvaluationResult]:
+        """
+        Evaluate several commits, packing up to batch_size of them into each
+        LLM request to amortize the fixed per-request prompt and HTTP cost.
+
+        Args:
+            pairs: (commit_message, git_diff) tuples to evaluate.
+            batch_size: Maximum number of commits per LLM request.
+
+        Returns:
+            Evaluation results in the same order as pairs.
+        """
+
+        results: list[EvaluationResult] = []
+        for chunk in chunked(pairs, batch_size):
+            results.extend(self._evaluate_chunk(chunk))
+
+        return results
+
+    async def aevaluate_batch(
+        self, pairs: list[tuple[str, str]], batch_size: int = 8
+    ) -> list[EvaluationResult]:
+        """
+        Async variant of evaluate_batch. Batches are sent concurrently.
+
+        Args:
+            pairs: (commit_message, git_diff) tuples to evaluate.
+            batch_size: Maximum number of commits per LLM request.
+
+        Returns:
+            Evaluation results in the same order as pairs.
+        """
+
+        chunk_results = await asyncio.gather(
+            *(self._aevaluate_chunk(chunk) for chunk in chunked(pairs, batch_size))
+        )
+
+        return [result for results in chunk_results for result in results]
+
+    def _evaluate_chunk(self, chunk: list[tuple[str, str]]) -> list[EvaluationResult]:
+        """Evaluate one batch of commits with a single LLM request"""
+
+        chunk_results, pending = self._prepare_chunk(chunk)
+
+        if len(pending) == 1:
+            chunk_results[pending[0]] = self.evaluate_commit_message(*chunk[pending[0]])
+        elif pending:
+            try:
+                response = self.ai_client.evaluate_with_llm(
+                    self._batch_prompt(chunk, pending),
+                    response_format=EvaluationBatchResponse,
+                )
+            except Exception as e:
+                raise ValueError(f"Failed to evaluate commit messages: {e}")
+
+            self._apply_batch_response(chunk, chunk_results, pending, response)
+
+        return self._completed(chunk_results)
+
+    async def _aevaluate_chunk(
+        self, chunk: list[tuple[str, str]]
+    ) -> list[EvaluationResult]:
+        """Async variant of _evaluate_chunk"""
+
+        chunk_results, pending = self._prepare_chunk(chunk)
+
+        if len(pending) == 1:
+            chunk_results[pending[0]] = await self.aevaluate_commit_message(
+                *chunk[pending[0]]
+            )
+        elif pending:
+            try:
+                response = await self.ai_client.aevaluate_with_llm(
+                    self._batch_prompt(chunk, pending),
+                    response_format=EvaluationBatchResponse,
+                )
+            except Exception as e:
+                raise ValueError(f"Failed to evaluate commit messages: {e}")
+
+            self._apply_batch_response(chunk, chunk_results, pending, response)
+
+        return self._completed(chunk_results)
+
+    def _batch_prompt(self, chunk: list[tuple[str, str]], pending: list[int]) -> str:
+        """Batched evaluation prompt for the pending commits of a chunk"""
+
+        return get_evaluation_prompt_batch([chunk[i] for i in pending])
+
+    def _apply_batch_response(
+        self,
+        chunk: list[tuple[str, str]],
+        chunk_results: list[Optional[EvaluationResult]],
+        pending: list[int],
+        response: str,
+    ) -> None:
+        """Parse a batched response into chunk_results and cache each result"""
+
+        parsed = self._parse_batch_evaluation_response(response, len(pending))
+        for index, result in zip(pending, parsed):
+            chunk_results[index] = result
+            self._cache_result(*chunk[index], result)
+
+    def _prepare_chunk(
+        self, chunk: list[tuple[str, str]]
+    ) -> tuple[list[Optional[EvaluationResult]], list[int]]:
+        """Resolve trivial and cached inputs, returning the indices needing the LLM"""
+
+        chunk_results = [
+            self._evaluate_without_llm(message, diff) for message, diff in chunk
+        ]
+        pending = [i for i, result in enumerate(chunk_results) if result is None]
+
+        return chunk_results, pending
+
+    def _completed(
+        self, chunk_results: list[Optional[EvaluationResult]]
+    ) -> list[EvaluationResult]:
+        """Narrow a fully evaluated chunk to its results"""
+
+        return [result for result in chunk_results if result is not None]
+
+    def _evaluate_without_llm(
+        self, commit_message: str, git_diff: str
+    ) -> Optional[EvaluationResult]:
+        """Score empty messages or diffs, or return a cached result, without
+        calling the LLM"""
+
         if not commit_message.strip():
             return EvaluationResult(
                 what_score=1.0,
@@ -73,21 +304,66 @@ class CommitMessageEvaluator:
                 model_used=self.model_name,
             )
 
-        try:
-            evaluation_prompt = get_evaluation_prompt(commit_message, git_diff)
-            response = self.ai_client.evaluate_with_llm(evaluation_prompt)
-        except Exception as e:
-            raise ValueError(f"Failed to evaluate commit message: {e}")
+        if self.cache is not None:
+            key = EvaluationCache.make_key(self.model_name, commit_message, git_diff)
+            return self.cache.get(key)
 
-        return self._parse_evaluation_response(response)
+        return None
+
+    def _cache_result(
+        self, commit_message: str, git_diff: str, result: EvaluationResult
+    ) -> None:
+        """Persist an LLM evaluation result when caching is enabled"""
+
+        if self.cache is not None:
+            key = EvaluationCache.make_key(self.model_name, commit_message, git_diff)
+            self.cache.set(key, result)
 
     def _parse_evaluation_response(self, response: str) -> EvaluationResult:
         """Parse LLM JSON response into EvaluationResult"""
 
         try:
-            data = json.loads(response)
-            data["model_used"] = self.model_name
+            # Parse and validate in one pass through Pydantic's core, then attach
+            # the model name without re-validating the already checked fields
+            evaluation = EvaluationResponse.model_validate_json(response)
 
-            return EvaluationResult(**data)
+            return EvaluationResult.model_construct(
+                **dict(evaluation), model_used=self.model_name
+            )
         except Exception as e:
             raise ValueError(f"Failed to parse evaluation response: {e}")
+
+    def _parse_batch_evaluation_response(
+        self, response: str, expected_count: int
+    ) -> list[EvaluationResult]:
+        """Parse a batched LLM JSON response into EvaluationResults ordered by id"""
+
+        try:
+            data: Any = json.loads(response)
+            items = data["evaluations"] if isinstance(data, dict) else data
+
+            by_id: dict[int, EvaluationResult] = {}
+            for item in items:
+                item = dict(item)
+                evaluation_id = int(item.pop("id"))
+                if evaluation_id in by_id:
+                    raise ValueError(f"Duplicate evaluation for id {evaluation_id}")
+                if not 0 <= evaluation_id < expected_count:
+                    raise ValueError(f"Unexpected evaluation id {evaluation_id}")
+                item["model_used"] = self.model_name
+                by_id[evaluation_id] = EvaluationResult(**item)
+
+            missing = [i for i in range(expected_count) if i not in by_id]
+            if missing:
+                raise ValueError(f"Missing evaluations for ids {missing}")
+
+            return [by_id[i] for i in range(expected_count)]
+        except Exception as e:
+            raise ValueError(f"Failed to parse batch evaluation response: {e}")
+
+
+def _tap(chunks: Iterator[str], callback: Callable[[str], None]) -> Iterator[str]:
+    """Pass each chunk to callback as it flows through"""
+    for chunk in chunks:
+        callback(chunk)
+        yield chunk
@@ -1,4 +1,4 @@
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
@@ -6,6 +6,9 @@ from rich.box import SIMPLE
 
 from .models import EvaluationResult, QualityRater
 
+COMMIT_MESSAGE_TITLE = "[bold blue]Commit Message[/bold blue]"
+REASONING_TITLE = "[bold yellow]LLM Reasoning[/bold yellow]"
+
 
 class EvaluationDisplayFormatter:
     def __init__(self, console: Console) -> None:
@@ -23,39 +26,36 @@ class EvaluationDisplayFormatter:
 
         overall_rating: str = result.quality_level
 
-        # Display components
-        self._display_commit_message(message)
-        self._display_quality_overview(result, overall_rating)
-        self._display_score_breakdown(result)
-        self._display_analysis(result)
-        self._display_metadata(result)
-
-    def _display_commit_message(self, message: str) -> None:
-        """Display the commit message panel"""
-        panel = Panel(
-            Text(message, style="white"),
-            title="[bold blue]Commit Message[/bold blue]",
-            border_style="blue",
-            padding=(0, 1),
+        # Display components, rendered with a single print
+        self.console.print(
+            Group(
+                self._build_commit_message(message),
+                self._build_quality_overview(result, overall_rating),
+                self._build_score_breakdown(result),
+                self._build_analysis(result),
+                self._build_metadata(result),
+            )
         )
-        self.console.print(panel)
 
-    def _display_quality_overview(self, result: EvaluationResult, rating: str) -> None:
-        """Display the quality overview panel"""
-        quality_text = Text()
+    def _build_commit_message(self, message: str) -> Panel:
+        """Build the commit message panel"""
+        return _panel(message, COMMIT_MESSAGE_TITLE, "blue")
+
+    def _build_quality_overview(self, result: EvaluationResult, rating: str) -> Text:
+        """Build the quality overview line"""
+        overall_score = result.overall_score
+        color = QualityRater.get_rating_color(overall_score)
+
+        quality_text = Text("\n")
         quality_text.append("Overall quality: ", style="bold")
-        quality_text.append(
-            rating, style=f"bold {QualityRater.get_rating_color(result.overall_score)}"
-        )
-        quality_text.append(
-            f" ({result.overall_score:.1f}/5)",
-            style=QualityRater.get_rating_color(result.overall_score),
-        )
+        quality_text.append(rating, style=f"bold {color}")
+        quality_text.append(f" ({overall_score:.1f}/5)", style=color)
+        quality_text.append("\n")
 
-        self.console.print(f"\n{quality_text}\n")
+        return quality_text
 
-    def _display_score_breakdown(self, result: EvaluationResult) -> None:
-        """Display the detailed score breakdown table"""
+    def _build_score_breakdown(self, result: EvaluationResult) -> Table:
+        """Build the detailed score breakdown table"""
         table = Table(show_header=True, header_style="bold cyan", box=SIMPLE)
         table.add_column("Score", justify="right", width=8)
         table.add_column("Rating", width=12)
@@ -66,8 +66,8 @@ class EvaluationDisplayFormatter:
         what_rating = QualityRater.get_quality_level(result.what_score)
         table.add_row(
             "WHAT",
-            f"[{what_color}]{result.what_score:.1f}[/{what_color}]",
-            f"[{what_color}]{what_rating}[/{what_color}]",
+            Text(f"{result.what_score:.1f}", style=what_color),
+            Text(what_rating, style=what_color),
         )
 
         # WHY score row
@@ -75,24 +75,29 @@ class EvaluationDisplayFormatter:
         why_rating = QualityRater.get_quality_level(result.why_score)
         table.add_row(
             "WHY",
-            f"[{why_color}]{result.why_score:.1f}[/{why_color}]",
-            f"[{why_color}]{why_rating}[/{why_color}]",
+            Text(f"{result.why_score:.1f}", style=why_color),
+            Text(why_rating, style=why_color),
         )
 
-        self.console.print(table)
+        return table
 
-    def _display_analysis(self, result: EvaluationResult) -> None:
-        """Display the LLM reasoning for the evaluation"""
-        panel = Panel(
-            Text(result.reasoning, style="white"),
-            title="[bold yellow]LLM Reasoning[/bold yellow]",
-            border_style="yellow",
-            padding=(0, 1),
-        )
-        self.console.print(panel)
+    def _build_analysis(self, result: EvaluationResult) -> Panel:
+        """Build the panel with the LLM reasoning for the evaluation"""
+        return _panel(result.reasoning, REASONING_TITLE, "yellow")
 
-    def _display_metadata(self, result: EvaluationResult) -> None:
-        """Display subtle metadata"""
-        self.console.print(
-            f"\n[dim]Confidence: {result.confidence:.1f} • Model: {result.model_used}[/dim]"
+    def _build_metadata(self, result: EvaluationResult) -> Text:
+        """Build the subtle metadata line"""
+        return Text(
+            f"\nConfidence: {result.confidence:.1f} • Model: {result.model_used}",
+            style="dim",
         )
+
+
+def _panel(body: str, title: str, color: str) -> Panel:
+    """Bordered panel around plain body text, which is not parsed as markup"""
+    return Panel(
+        Text(body, style="white"),
+        title=title,
+        border_style=color,
+        padding=(0, 1),
+    )
@@ -1,19 +1,25 @@
 from typing import Any, Optional
-from rich.console import Console
+from rich.console import Console, Group, NewLine
+from rich.status import Status
 from rich.panel import Panel
 from rich.text import Text
 from diffmage.evaluation.service import EvaluationService
 from diffmage.evaluation.models import EvaluationResult, QualityRater
 from collections import Counter
-from statistics import mean, median
+import math
 from rich.table import Table
 from rich import box
 from pathlib import Path
+import asyncio
 import csv
-import json
 from datetime import datetime
 import git
-from diffmage.ai.models import get_default_model
+import orjson
+from diffmage.utils import event_loop
+from diffmage.utils.batching import chunked
+
+# Quality levels from best to worst, as listed in the distribution table
+QUALITY_ORDER = ("Excellent", "Good", "Average", "Poor", "Very Poor")
 
 
 class EvaluationReport:
@@ -21,105 +27,113 @@ class EvaluationReport:
     Report for evaluation results
     """
 
-    def __init__(self, service: EvaluationService):
+    def __init__(self, service: EvaluationService, console: Optional[Console] = None):
         self.service = service
-        self.console = Console()
+        self.console = console or Console()
+        # Statistics of the last results reported on, keyed by the (frozen)
+        # result objects, so the report, batch summary and exports share one
+        # computation
+        self._statistics: Optional[
+            tuple[tuple[EvaluationResult, ...], dict[str, Any]]
+        ] = None
 
     def generate_quality_report(
         self,
         results: list[tuple[EvaluationResult, str]],
         title: str = "Commit Message Quality Report",
-    ) -> str:
+    ) -> None:
         """
         Generate rich formatted quality report for console display
 
         Args:
           results: List of (EvaluationResult, commit message) tuples
           title: Optional title for the report
-
-          Returns:
-            Formatted report string
         """
         if not results:
             raise ValueError("No evaluation results to report")
 
-        statistics = self._calculate_report_statistics(results)
+        statistics = self._get_report_statistics(results)
+        sorted_results = sorted(results, key=_by_overall_score, reverse=True)
 
         #### --Displays-- ####
 
-        # Header
+        # Rendered with a single print so the console lays out the report once
         self.console.print(
-            Panel(
-                Text(title, justify="center", style="bold white"),
-                style="blue",
-                padding=(1, 2),
+            Group(
+                # Header
+                Panel(
+                    Text(title, justify="center", style="bold white"),
+                    style="blue",
+                    padding=(1, 2),
+                ),
+                # Summary
+                self._build_summary_table(statistics),
+                NewLine(),
+                # Quality Distribution
+                self._build_quality_distribution_table(statistics),
+                # Top and Bottom Performers
+                self._build_top_and_bottom_performers(sorted_results),
+                # Detailed Results
+                self._build_detailed_results(sorted_results),
             )
         )
 
-        # Summary
-        self._display_summary_table(statistics)
-
-        # Quality Distribution
-        self._display_quality_distribution_table(statistics)
-
-        # Top and Bottom Performers
-        self._display_top_and_bottom_performers(results)
-
-        # Detailed Results
-        self._display_detailed_results(results)
+    def _get_report_statistics(
+        self, results: list[tuple[EvaluationResult, str]]
+    ) -> dict[str, Any]:
+        """Statistics for results, reused while the same result objects are
+        reported on again"""
+        evaluations = tuple(result for result, _ in results)
+        if self._statistics is not None:
+            cached_evaluations, statistics = self._statistics
+            # Results are frozen, so the same objects mean the same statistics;
+            # holding them also keeps their identities from being reused
+            if len(cached_evaluations) == len(evaluations) and all(
+                cached is current
+                for cached, current in zip(cached_evaluations, evaluations)
+            ):
+                return statistics
 
-        return f"Report generated successfully for {len(results)} evaluation{'' if len(results) == 1 else 's'}"
+        statistics = self._calculate_report_statistics(results)
+        self._statistics = (evaluations, statistics)
+        return statistics
 
     def _calculate_report_statistics(
         self, results: list[tuple[EvaluationResult, str]]
     ) -> dict[str, Any]:
-        """Calculate statistics for the report"""
-        what_scores = [r[0].what_score for r in results]
-        why_scores = [r[0].why_score for r in results]
-        overall_scores = [r[0].overall_score for r in results]
-        confidence = [r[0].confidence for r in results]
-
-        quality_counts = Counter(result[0].quality_level for result in results)
-        model_usage = Counter(result[0].model_used for result in results)
+        """Calculate statistics for the report from a single pass over results"""
+        what_scores: list[float] = []
+        why_scores: list[float] = []
+        overall_scores: list[float] = []
+        confidence: list[float] = []
+        models: list[Optional[str]] = []
+
+        for result, _ in results:
+            what_scores.append(result.what_score)
+            why_scores.append(result.why_score)
+            overall_scores.append(result.overall_score)
+            confidence.append(result.confidence)
+            models.append(result.model_used)
+
+        # Counting whole columns keeps the per-key increments in C
+        quality_counts = Counter(map(QualityRater.get_quality_level, overall_scores))
+        model_usage = Counter(models)
+        high_quality_count = sum(map(QualityRater.is_high_quality, overall_scores))
 
         return {
             "total_evaluations": len(results),
-            "what_scores": {
-                "mean": round(mean(what_scores), 2),
-                "median": round(median(what_scores), 2),
-                "min": round(min(what_scores), 2),
-                "max": round(max(what_scores), 2),
-            },
-            "why_scores": {
-                "mean": round(mean(why_scores), 2),
-                "median": round(median(why_scores), 2),
-                "min": round(min(why_scores), 2),
-                "max": round(max(why_scores), 2),
-            },
-            "overall_scores": {
-                "mean": round(mean(overall_scores), 2),
-                "median": round(median(overall_scores), 2),
-                "min": round(min(overall_scores), 2),
-                "max": round(max(overall_scores), 2),
-            },
-            "confidence": {
-                "mean": mean(confidence),
-                "median": median(confidence),
-                "min": min(confidence),
-                "max": max(confidence),
-            },
+            "what_scores": _describe(what_scores, digits=2),
+            "why_scores": _describe(why_scores, digits=2),
+            "overall_scores": _describe(overall_scores, digits=2),
+            "confidence": _describe(confidence),
             "quality_distribution": quality_counts,
             "model_usage": model_usage,
-            "high_quality_count": sum(
-                1 for result in results if result[0].is_high_quality
-            ),
-            "low_quality_count": sum(
-                1 for result in results if not result[0].is_high_quality
-            ),
+            "high_quality_count": high_quality_count,
+            "low_quality_count": len(results) - high_quality_count,
         }
 
-    def _display_summary_table(self, stats: dict[str, dict[str, Any]]) -> None:
-        """Display a summary table of the statistics"""
+    def _build_summary_table(self, stats: dict[str, dict[str, Any]]) -> Table:
+        """Build a summary table of the statistics"""
 
         table = Table(title="Summary Statistics", box=box.SIMPLE)
         table.add_column("Metric", style="cyan")
@@ -148,13 +162,12 @@ class EvaluationReport:
             f"{stats['overall_scores']['min']:.1f} - {stats['overall_scores']['max']:.1f}",
         )
 
-        self.console.print(table)
-        self.console.print()
+        return table
 
-    def _display_quality_distribution_table(
+    def _build_quality_distribution_table(
         self, stats: dict[str, dict[str, Any]]
-    ) -> None:
-        """Display a table of the quality distribution"""
+    ) -> Table:
+        """Build a table of the quality distribution"""
 
         table = Table(title="Quality Distribution", box=box.SIMPLE)
         table.add_column("Quality", style="cyan")
@@ -162,123 +175,120 @@ class EvaluationReport:
         table.add_column("Percentage", justify="center")
 
         total = stats["total_evaluations"]
+        quality_distribution = stats["quality_distribution"]
 
-        quality_order = ["Excellent", "Good", "Average", "Poor", "Very Poor"]
-
-        for quality in quality_order:
-            count = stats["quality_distribution"].get(quality, 0)
-            percentage = round((count / total) * 100, 1)
+        for quality in QUALITY_ORDER:
+            count = quality_distribution.get(quality, 0)
+            percentage = round((count / total) * 100, 1) if total else 0.0
             table.add_row(quality, str(count), f"{percentage}%")
 
-        self.console.print(table)
+        return table
 
     def get_top_performers(
         self, results: list[tuple[EvaluationResult, str]], count: int = 3
     ) -> list[tuple[EvaluationResult, str]]:
         """Get top performing results by overall score"""
-        if not results:
-            return []
-
-        sorted_results = sorted(results, key=lambda x: x[0].overall_score, reverse=True)
-        return sorted_results[: min(count, len(sorted_results))]
+        return self.get_top_and_bottom_performers(results, count)[0]
 
     def get_bottom_performers(
         self, results: list[tuple[EvaluationResult, str]], count: int = 3
     ) -> list[tuple[EvaluationResult, str]]:
         """Get bottom performing results by overall score, excluding overlap with top performers"""
-        if len(results) <= 1:
-            return []
-
-        sorted_results = sorted(results, key=lambda x: x[0].overall_score, reverse=True)
-
-        # Get top performer indices to avoid overlap
-        num_top = min(count, len(sorted_results))
-        top_indices = set(range(num_top))
-
-        # Get bottom performers, excluding those already in top
-        num_bottom = min(count, len(sorted_results))
-        bottom_performers = [
-            sorted_results[i]
-            for i in range(len(sorted_results) - num_bottom, len(sorted_results))
-            if i not in top_indices
-        ]
-
-        # Sort bottom performers ascending (worst to best)
-        return sorted(bottom_performers, key=lambda x: x[0].overall_score)
+        return self.get_top_and_bottom_performers(results, count)[1]
 
     def get_top_and_bottom_performers(
         self, results: list[tuple[EvaluationResult, str]], count: int = 3
     ) -> tuple[list[tuple[EvaluationResult, str]], list[tuple[EvaluationResult, str]]]:
         """Get top and bottom performers ensuring no overlap between them"""
-        top_performers = self.get_top_performers(results, count)
-        bottom_performers = self.get_bottom_performers(results, count)
+        return self._split_top_and_bottom(
+            sorted(results, key=_by_overall_score, reverse=True), count
+        )
 
-        # Ensure no overlap by checking actual instances
-        top_instances = set(id(item) for item in top_performers)
-        bottom_performers = [
-            item for item in bottom_performers if id(item) not in top_instances
-        ]
+    def _split_top_and_bottom(
+        self, sorted_results: list[tuple[EvaluationResult, str]], count: int = 3
+    ) -> tuple[list[tuple[EvaluationResult, str]], list[tuple[EvaluationResult, str]]]:
+        """
+        Slice top and bottom performers out of results already sorted best
+        first. Bottom performers never overlap the top ones and are ordered
+        worst to best.
+        """
+        top_performers = sorted_results[:count]
+        if len(sorted_results) <= 1:
+            return top_performers, []
+
+        bottom_start = max(count, len(sorted_results) - count)
+        bottom_performers = sorted(sorted_results[bottom_start:], key=_by_overall_score)
 
         return top_performers, bottom_performers
 
-    def _display_top_and_bottom_performers(
-        self, results: list[tuple[EvaluationResult, str]]
-    ) -> None:
-        """Display the top and bottom performers"""
+    def _build_top_and_bottom_performers(
+        self, sorted_results: list[tuple[EvaluationResult, str]]
+    ) -> Text:
+        """Build the top and bottom performers listing as a single Text
 
-        top_performers, bottom_performers = self.get_top_and_bottom_performers(results)
+        Expects results sorted best first.
+        """
+
+        top_performers, bottom_performers = self._split_top_and_bottom(sorted_results)
 
-        # Display top performers
-        self.console.print("[bold green]🏆 Top Performing Messages:[/bold green]")
-        self.console.print()
+        # Messages are appended as plain text so brackets in them aren't markup
+        text = Text()
+
+        # Top performers
+        text.append("🏆 Top Performing Messages:", style="bold green")
+        text.append("\n\n")
 
         for i, (result, message) in enumerate(top_performers, 1):
-            self.console.print(f"  {i}. [{result.overall_score:.1f}/5] {message}")
-            self.console.print()
+            text.append(f"  {i}. [{result.overall_score:.1f}/5] {message}\n\n")
 
-        self.console.print()
+        text.append("\n")
 
-        # Display bottom performers if we have any
+        # Bottom performers if we have any
         if bottom_performers:
-            self.console.print("[bold red]⚠️  Lowest Performing Messages:[/bold red]")
-            self.console.print()
+            text.append("⚠️  Lowest Performing Messages:", style="bold red")
+            text.append("\n\n")
 
             for i, (result, message) in enumerate(bottom_performers, 1):
-                self.console.print(f"  {i}. [{result.overall_score:.1f}/5] {message}")
-                self.console.print()
+                text.append(f"  {i}. [{result.overall_score:.1f}/5] {message}\n\n")
 
-        self.console.print()
+        return text
 
-    def _display_detailed_results(
-        self, results: list[tuple[EvaluationResult, str]]
-    ) -> None:
-        """Display detailed results"""
+    def _build_detailed_results(
+        self, sorted_results: list[tuple[EvaluationResult, str]]
+    ) -> Table:
+        """Build the detailed results table, expecting results sorted best first"""
 
         table = Table(title="Detailed Results", box=box.SIMPLE, show_lines=True)
-        table.add_column("Message", style="white", width=40)
+        table.add_column(
+            "Message", style="white", width=40, overflow="ellipsis", no_wrap=True
+        )
         table.add_column("WHAT", justify="center", width=6)
         table.add_column("WHY", justify="center", width=6)
         table.add_column("Overall", justify="center", width=8)
         table.add_column("Quality", width=10)
         table.add_column("Confidence", justify="center", width=10)
 
-        sorted_results = sorted(results, key=lambda x: x[0].overall_score, reverse=True)
+        add_row = table.add_row
+        get_rating_color = QualityRater.get_rating_color
 
         for result, message in sorted_results:
-            display_message = message[:37] + "..." if len(message) > 37 else message
-
-            overall_color = QualityRater.get_rating_color(result.overall_score)
-
-            table.add_row(
-                display_message,
+            # overall_score and quality_level are cached on the result
+            overall_score = result.overall_score
+            overall_color = get_rating_color(overall_score)
+
+            add_row(
+                # Rich ellipsizes anything wider than the column; the slice
+                # just keeps long multi-line messages from being laid out.
+                # Text keeps brackets in messages from being read as markup.
+                Text(message[:41]),
                 f"{result.what_score:.1f}",
                 f"{result.why_score:.1f}",
-                f"[{overall_color}]{result.overall_score:.1f}[/{overall_color}]",
-                f"[{overall_color}]{result.quality_level}[/{overall_color}]",
+                Text(f"{overall_score:.1f}", style=overall_color),
+                Text(result.quality_level, style=overall_color),
                 f"{result.confidence:.2f}",
             )
 
-        self.console.print(table)
+        return table
 
     def export_csv_report(
         self,
@@ -297,6 +307,7 @@ class EvaluationReport:
         """
 
         filepath = Path(filename)
+        timestamp = datetime.now().isoformat()
 
         with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
             fieldnames = [
@@ -311,23 +322,24 @@ class EvaluationReport:
                 "timestamp",
             ]
 
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for result, message in results:
-                writer.writerow(
-                    {
-                        "commit_message": message,
-                        "what_score": result.what_score,
-                        "why_score": result.why_score,
-                        "overall_score": result.overall_score,
-                        "quality_level": result.quality_level,
-                        "reasoning": result.reasoning,
-                        "confidence": result.confidence,
-                        "model_used": result.model_used,
-                        "timestamp": datetime.now().isoformat(),
-                    }
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            # Rows are tuples in fieldnames order, skipping DictWriter's
+            # per-row dict building and key lookups
+            writer.writerows(
+                (
+                    message,
+                    result.what_score,
+                    result.why_score,
+                    result.overall_score,
+                    result.quality_level,
+                    result.reasoning,
+                    result.confidence,
+                    result.model_used,
+                    timestamp,
                 )
+                for result, message in results
+            )
 
         return str(filepath.absolute())
 
@@ -339,7 +351,7 @@ class EvaluationReport:
         """Export evaluation data to JSON"""
 
         filepath = Path(filename)
-        stats = self._calculate_report_statistics(results)
+        stats = self._get_report_statistics(results)
 
         report_data = {
             "metadata": {
@@ -353,8 +365,11 @@ class EvaluationReport:
             ],
         }
 
-        with open(filepath, "w", encoding="utf-8") as jsonfile:
-            json.dump(report_data, jsonfile, indent=2, ensure_ascii=False)
+        filepath.write_bytes(
+            orjson.dumps(
+                report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        )
 
         return str(filepath.absolute())
 
@@ -364,6 +379,8 @@ class EvaluationReport:
         to_commit: str,  # Newer commit (Inclusive)
         repo_path: str = ".",
         model_name: Optional[str] = None,
+        max_concurrency: int = 10,
+        batch_size: int = 1,
     ) -> dict[str, Any]:
         """
         Evaluate multiple commits and generate comprehensive report
@@ -372,15 +389,15 @@ class EvaluationReport:
             from_commit: Start of git commit range (e.g., "HEAD~10", "abc456"). Inclusive.
             to_commit: End of git commit range (e.g., "HEAD", "abc123"). Inclusive.
             repo_path: Path to git repository
-            model_name: AI model to use for evaluation
+            model_name: AI model to use for evaluation. Defaults to the model of
+                        the report's service, which is then reused as-is.
+            max_concurrency: Maximum number of LLM requests in flight at once
+            batch_size: Number of commits packed into each LLM request
 
         Returns:
             Dictionary with evaluation results and statistics
         """
 
-        if not model_name:
-            model_name = get_default_model().name
-
         commit_range = f"{from_commit}~1..{to_commit}"
 
         # Get commit list
@@ -397,24 +414,19 @@ class EvaluationReport:
             f"[blue]Evaluating {len(commits)} commits from range: {commit_range}[/blue]"
         )
 
-        # Evaluate each commit
-        service = EvaluationService(model_name=model_name)
-        results = []
+        # Evaluate commits concurrently
+        service = self.service
+        if model_name and model_name != service.model_name:
+            service = EvaluationService(
+                model_name=model_name, use_cache=self.service.use_cache
+            )
 
         with self.console.status("[bold green]Evaluating commits...") as status:
-            for i, commit in enumerate(commits, 1):
-                status.update(
-                    f"[bold green]Evaluating commit {i}/{len(commits)}: {commit.hexsha[:8]}"
+            results = event_loop.run(
+                self._evaluate_commits_concurrently(
+                    service, commits, repo_path, max_concurrency, batch_size, status
                 )
-
-                try:
-                    result, message = service.evaluate_commit(commit.hexsha, repo_path)
-                    results.append((result, message))
-                except Exception as e:
-                    self.console.print(
-                        f"[red]Warning: Failed to evaluate {commit.hexsha[:8]}: {e}[/red]"
-                    )
-                    continue
+            )
 
         if not results:
             raise ValueError("No commits could be evaluated successfully")
@@ -423,8 +435,8 @@ class EvaluationReport:
         report_title = f"Batch Evaluation Report: {commit_range}"
         self.generate_quality_report(results, report_title)
 
-        # Calculate and return statistics
-        stats = self._calculate_report_statistics(results)
+        # Same statistics the report was built from
+        stats = self._get_report_statistics(results)
 
         return {
             "commit_range": commit_range,
@@ -433,3 +445,98 @@ class EvaluationReport:
             "statistics": stats,
             "results": results,
         }
+
+    async def _evaluate_commits_concurrently(
+        self,
+        service: EvaluationService,
+        commits: list[git.Commit],
+        repo_path: str,
+        max_concurrency: int,
+        batch_size: int,
+        status: Status,
+    ) -> list[tuple[EvaluationResult, str]]:
+        """
+        Evaluate commits in batches of batch_size, with at most max_concurrency
+        LLM requests in flight.
+
+        Results keep the order of the commits. When a batch fails, its commits
+        are retried one at a time so a single bad commit only loses itself;
+        commits that still fail are reported as warnings and skipped.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        completed = 0
+
+        def warn_failed(failed: list[git.Commit], error: Exception) -> None:
+            short_hashes = ", ".join(commit.hexsha[:8] for commit in failed)
+            self.console.print(
+                f"[red]Warning: Failed to evaluate {short_hashes}: {error}[/red]"
+            )
+
+        async def evaluate_one_by_one(
+            batch: list[git.Commit],
+        ) -> list[tuple[EvaluationResult, str]]:
+            results: list[tuple[EvaluationResult, str]] = []
+            for commit in batch:
+                try:
+                    results.append(
+                        await service.aevaluate_commit(commit.hexsha, repo_path)
+                    )
+                except Exception as e:
+                    warn_failed([commit], e)
+            return results
+
+        async def evaluate_batch(
+            batch: list[git.Commit],
+        ) -> list[tuple[EvaluationResult, str]]:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    return await service.aevaluate_commits(
+                        [commit.hexsha for commit in batch], repo_path
+                    )
+                except Exception as e:
+                    if len(batch) == 1:
+                        warn_failed(batch, e)
+                        return []
+                    return await evaluate_one_by_one(batch)
+                finally:
+                    completed += len(batch)
+                    status.update(
+                        f"[bold green]Evaluated {completed}/{len(commits)} commits"
+                    )
+
+        evaluations = await asyncio.gather(
+            *(evaluate_batch(batch) for batch in chunked(commits, max(1, batch_size)))
+        )
+
+        return [evaluation for batch in evaluations for evaluation in batch]
+
+
+def _by_overall_score(item: tuple[EvaluationResult, str]) -> float:
+    """Sort key ranking (result, message) pairs by overall score"""
+    return item[0].overall_score
+
+
+def _describe(values: list[float], digits: Optional[int] = None) -> dict[str, float]:
+    """Mean, median, min and max of values, taken from one sorted copy"""
+    if len(values) == 1:
+        # A single evaluation (the interactive case) is its own summary
+        value = round(values[0], digits) if digits is not None else values[0]
+        return {"mean": value, "median": value, "min": value, "max": value}
+
+    ordered = sorted(values)
+    count = len(ordered)
+    middle = count // 2
+    summary = {
+        "mean": math.fsum(ordered) / count,
+        "median": (
+            ordered[middle]
+            if count % 2
+            else (ordered[middle - 1] + ordered[middle]) / 2
+        ),
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+    if digits is None:
+        return summary
+    return {name: round(value, digits) for name, value in summary.items()}
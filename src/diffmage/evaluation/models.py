@@ -2,8 +2,10 @@
 Data models for commit message evaluation system
 """
 
+from bisect import bisect_right
+from functools import cached_property
 from typing import Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ScoreThresholds:
@@ -15,6 +17,17 @@ class ScoreThresholds:
     POOR = 1.5
 
 
+# Lower bounds of each quality level above "Very Poor", ascending, paired with
+# the level names so a score's level is a single bisect
+_QUALITY_THRESHOLDS = (
+    ScoreThresholds.POOR,
+    ScoreThresholds.AVERAGE,
+    ScoreThresholds.GOOD,
+    ScoreThresholds.EXCELLENT,
+)
+_QUALITY_LEVELS = ("Very Poor", "Poor", "Average", "Good", "Excellent")
+
+
 class QualityRater:
     """Quality Rating"""
 
@@ -29,16 +42,7 @@ class QualityRater:
         - Poor (1.5-2.4)
         - Very Poor (1.0-1.4)
         """
-        if score >= ScoreThresholds.EXCELLENT:  # 4.5-5.0
-            return "Excellent"
-        elif score >= ScoreThresholds.GOOD:  # 3.5-4.4
-            return "Good"
-        elif score >= ScoreThresholds.AVERAGE:  # 2.5-3.4
-            return "Average"
-        elif score >= ScoreThresholds.POOR:  # 1.5-2.4
-            return "Poor"
-        else:  # 1.0-1.4
-            return "Very Poor"
+        return _QUALITY_LEVELS[bisect_right(_QUALITY_THRESHOLDS, score)]
 
     @staticmethod
     def get_rating_color(score: float) -> str:
@@ -71,16 +75,31 @@ class EvaluationResponse(BaseModel):
     )
 
 
+class BatchEvaluationItem(EvaluationResponse):
+    """Single evaluation within a batched LLM response"""
+
+    id: int = Field(ge=0, description="Index of the evaluated commit in the batch")
+
+
+class EvaluationBatchResponse(BaseModel):
+    """Response model for evaluating several commits in one LLM request"""
+
+    evaluations: list[BatchEvaluationItem]
+
+
 class EvaluationResult(EvaluationResponse):
     """Result of LLM based commit message evaluation with validation"""
 
+    # Frozen so the derived scores below can be computed once per result
+    model_config = ConfigDict(frozen=True)
+
     model_used: str = Field(description="Model used for evaluation")
 
-    @property
+    @cached_property
     def overall_score(self) -> float:
         return round((self.what_score + self.why_score) / 2, 2)
 
-    @property
+    @cached_property
     def quality_level(self) -> str:
         """Human readable quality assessment"""
         return QualityRater.get_quality_level(self.overall_score)
@@ -1,4 +1,7 @@
+import asyncio
+import threading
 from typing import Optional
+from diffmage.evaluation.cache import EvaluationCache, is_cache_enabled
 from diffmage.evaluation.models import EvaluationResult
 from diffmage.ai.models import get_default_model
 from diffmage.evaluation.commit_message_evaluator import CommitMessageEvaluator
@@ -8,15 +11,22 @@ from diffmage.git.diff_parser import GitDiffParser
 class EvaluationService:
     """High level service for evaluating commit messages"""
 
-    def __init__(self, model_name: Optional[str] = None) -> None:
+    def __init__(
+        self, model_name: Optional[str] = None, use_cache: bool = False
+    ) -> None:
         self.model_name = model_name or get_default_model().name
-        self.evaluator = CommitMessageEvaluator(model_name=self.model_name)
+        self.use_cache = use_cache
+        self.evaluator = CommitMessageEvaluator(
+            model_name=self.model_name,
+            cache=EvaluationCache() if use_cache and is_cache_enabled() else None,
+        )
+        self._parsers = threading.local()
 
     def evaluate_staged_changes(
         self, message: str, repo_path: str = "."
     ) -> tuple[EvaluationResult, str]:
         """Evaluate the staged changes in the repository"""
-        parser = GitDiffParser(repo_path)
+        parser = self._get_parser(repo_path)
         analysis = parser.parse_staged_changes()
         git_diff = analysis.get_combined_diff()
         result = self.evaluator.evaluate_commit_message(message, git_diff)
@@ -36,9 +46,74 @@ class EvaluationService:
             - EvaluationResult: The evaluation result
             - str: The generated commit message
         """
-        parser = GitDiffParser(repo_path)
+        parser = self._get_parser(repo_path)
         analysis, message = parser.parse_specific_commit(commit_hash)
         git_diff = analysis.get_combined_diff()
         result = self.evaluator.evaluate_commit_message(message, git_diff)
 
         return result, message
+
+    async def aevaluate_commit(
+        self, commit_hash: str, repo_path: str = "."
+    ) -> tuple[EvaluationResult, str]:
+        """Async variant of evaluate_commit
+
+        The diff is parsed in a worker thread so git subprocesses overlap with
+        LLM round-trips already in flight, and multiple commits can be
+        evaluated concurrently.
+        """
+        [(message, git_diff)] = await asyncio.to_thread(
+            self._read_commits, [commit_hash], repo_path
+        )
+        result = await self.evaluator.aevaluate_commit_message(message, git_diff)
+
+        return result, message
+
+    async def aevaluate_commits(
+        self, commit_hashes: list[str], repo_path: str = "."
+    ) -> list[tuple[EvaluationResult, str]]:
+        """Evaluate several commits with a single batched LLM request
+
+        Args:
+            commit_hashes: Hashes of the commits to evaluate together
+            repo_path: The path to the repository
+
+        Returns:
+            (EvaluationResult, commit message) tuples in commit_hashes order
+        """
+        pairs = await asyncio.to_thread(self._read_commits, commit_hashes, repo_path)
+
+        results = await self.evaluator.aevaluate_batch(pairs, batch_size=len(pairs))
+
+        return [(result, message) for result, (message, _) in zip(results, pairs)]
+
+    def _read_commits(
+        self, commit_hashes: list[str], repo_path: str
+    ) -> list[tuple[str, str]]:
+        """(commit message, combined diff) for each commit, in order"""
+        parser = self._get_parser(repo_path)
+        if len(commit_hashes) == 1:
+            # Single commits go through the per-commit diff cache
+            analysis, message = parser.parse_specific_commit(commit_hashes[0])
+            return [(message, analysis.get_combined_diff())]
+
+        return [
+            (message, analysis.get_combined_diff())
+            for analysis, message in parser.parse_commits(commit_hashes)
+        ]
+
+    def _get_parser(self, repo_path: str) -> GitDiffParser:
+        """
+        GitDiffParser for repo_path, opened once per thread and reused.
+
+        Opening a repository reads its config and refs, so it is done once
+        rather than per commit. GitPython repositories are not thread safe,
+        so each worker thread keeps its own.
+        """
+        parsers: dict[str, GitDiffParser] = self._parsers.__dict__.setdefault(
+            "by_path", {}
+        )
+        parser = parsers.get(repo_path)
+        if parser is None:
+            parser = parsers[repo_path] = GitDiffParser(repo_path)
+        return parser
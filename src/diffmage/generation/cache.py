@@ -0,0 +1,82 @@
+"""
+Persistent on-disk cache for generated commit messages.
+"""
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+
+def get_default_cache_dir() -> Path:
+    """Directory holding diffmage's generation cache (honours XDG_CACHE_HOME)"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "diffmage" / "generation"
+
+
+def is_cache_enabled() -> bool:
+    """Whether generated messages are cached (opt in with DIFFMAGE_GENERATION_CACHE=1)"""
+    return os.environ.get("DIFFMAGE_GENERATION_CACHE", "0").strip() == "1"
+
+
+class GenerationCache:
+    """
+    SQLite backed memoization of generated commit messages.
+
+    Entries are keyed by a hash of the model and the generation prompt with
+    trailing whitespace and line endings normalized, so regenerating for the
+    same diff (after an amend or rebase, or on a CRLF checkout) skips the LLM
+    round-trip. Indentation inside diff lines is part of the key, since an
+    indentation-only change is a change of its own.
+    Cache errors are never fatal: a failed read is a miss, a failed write is
+    ignored.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path or get_default_cache_dir() / "messages.sqlite3"
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str) -> str:
+        """Build the cache key for a generation prompt"""
+        normalized = "\n".join(line.rstrip() for line in prompt.splitlines())
+        payload = f"{model_name}\0{normalized}".encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached message for key, or None on a miss"""
+        try:
+            row = (
+                self._connect()
+                .execute("SELECT message FROM messages WHERE key = ?", (key,))
+                .fetchone()
+            )
+        except (sqlite3.Error, OSError):
+            return None
+
+        return None if row is None else str(row[0])
+
+    def set(self, key: str, message: str) -> None:
+        """Store message under key"""
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO messages (key, message) VALUES (?, ?)",
+                    (key, message),
+                )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database on first use"""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS messages "
+                "(key TEXT PRIMARY KEY, message TEXT NOT NULL)"
+            )
+            self._connection = connection
+        return self._connection
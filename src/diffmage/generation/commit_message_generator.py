@@ -4,8 +4,15 @@ from typing import Optional
 from diffmage.ai.client import AIClient
 from diffmage.ai.models import get_default_model
 from diffmage.ai.prompt_manager import get_commit_prompt, get_why_context_prompt
+from diffmage.generation.cache import GenerationCache, is_cache_enabled
 from diffmage.generation.models import GenerationResult
 
+# Rough size of a token in characters, for budgeting prompts without a tokenizer
+CHARS_PER_TOKEN = 4
+
+# Lines kept from the start of each hunk when a diff has to be summarized
+SUMMARY_HUNK_LINES = 20
+
 
 class CommitMessageGenerator:
     """
@@ -14,16 +21,28 @@ class CommitMessageGenerator:
     This specialist focuses solely on the generation logic and prompt handling
     """
 
-    def __init__(self, model_name: Optional[str] = None, temperature: float = 0.0):
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        temperature: float = 0.0,
+        client: Optional[AIClient] = None,
+        cache: Optional[GenerationCache] = None,
+    ):
         """
         Initialize the LLM Generator
 
         Args:
           model_name: The name of the model to use for generation
           temperature: The temperature to use for generation
+          client: Existing AIClient to share; one is created when omitted
+          cache: Persistent cache of generated messages; when omitted, one is
+                 used if DIFFMAGE_GENERATION_CACHE=1
         """
         self.model_name = model_name or get_default_model().name
-        self.client = AIClient(model_name=self.model_name, temperature=temperature)
+        self.client = client or AIClient(
+            model_name=self.model_name, temperature=temperature
+        )
+        self.cache = cache or (GenerationCache() if is_cache_enabled() else None)
 
     def generate_commit_message(
         self,
@@ -43,18 +62,47 @@ class CommitMessageGenerator:
             GenerationResult with message and metadata
         """
 
-        if not git_diff.strip():
-            raise ValueError("No changes found in git diff")
-
-        prompt = self._build_prompt(git_diff, file_count, lines_added, lines_removed)
+        prompt = self._prepare_prompt(git_diff, file_count, lines_added, lines_removed)
+        key = self._cache_key(prompt)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
 
         try:
             message = self.client.generate_commit_message(prompt)
-            return GenerationResult(message=message.strip())
+            result = GenerationResult(message=message.strip())
 
         except Exception as e:
             raise ValueError(f"Error generating commit message: {e}")
 
+        self._set_cached(key, result)
+        return result
+
+    async def agenerate_commit_message(
+        self,
+        git_diff: str,
+        file_count: int = 0,
+        lines_added: int = 0,
+        lines_removed: int = 0,
+    ) -> GenerationResult:
+        """Async variant of generate_commit_message"""
+
+        prompt = self._prepare_prompt(git_diff, file_count, lines_added, lines_removed)
+        key = self._cache_key(prompt)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        try:
+            message = await self.client.agenerate_commit_message(prompt)
+            result = GenerationResult(message=message.strip())
+
+        except Exception as e:
+            raise ValueError(f"Error generating commit message: {e}")
+
+        self._set_cached(key, result)
+        return result
+
     def enhance_with_why_context(
         self, result: GenerationResult, why_context: str
     ) -> GenerationResult:
@@ -78,6 +126,53 @@ class CommitMessageGenerator:
         except Exception as e:
             raise ValueError(f"Error enhancing commit message with why context: {e}")
 
+    async def aenhance_with_why_context(
+        self, result: GenerationResult, why_context: str
+    ) -> GenerationResult:
+        """Async variant of enhance_with_why_context"""
+        if not why_context:
+            return result
+
+        prompt = get_why_context_prompt(result.message, why_context)
+        try:
+            message = await self.client.agenerate_commit_message(prompt)
+            return GenerationResult(message=message.strip())
+        except Exception as e:
+            raise ValueError(f"Error enhancing commit message with why context: {e}")
+
+    def _prepare_prompt(
+        self, git_diff: str, file_count: int, lines_added: int, lines_removed: int
+    ) -> str:
+        """
+        Build the generation prompt, summarizing the diff if it would not fit
+        in the model's context window.
+
+        Raises:
+            ValueError: If there are no changes, or too many even when summarized
+        """
+        if not git_diff.strip():
+            raise ValueError("No changes found in git diff")
+
+        prompt = self._build_prompt(git_diff, file_count, lines_added, lines_removed)
+
+        # Diffs too large for the model would fail (or be truncated) only after
+        # a full round-trip, so shrink them first or fail fast
+        max_prompt_chars = self._max_prompt_chars()
+        if len(prompt) > max_prompt_chars:
+            prompt = self._build_prompt(
+                _summarize_diff(git_diff, SUMMARY_HUNK_LINES),
+                file_count,
+                lines_added,
+                lines_removed,
+            )
+            if len(prompt) > max_prompt_chars:
+                raise ValueError(
+                    "Changes are too large to generate a commit message; "
+                    "consider committing them in smaller pieces"
+                )
+
+        return prompt
+
     def _build_prompt(
         self, git_diff: str, file_count: int, lines_added: int, lines_removed: int
     ) -> str:
@@ -91,3 +186,55 @@ class CommitMessageGenerator:
             lines_added=lines_added,
             lines_removed=lines_removed,
         )
+
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """Cache key for prompt, or None when caching is off"""
+        if self.cache is None:
+            return None
+        return GenerationCache.make_key(self.model_name, prompt)
+
+    def _get_cached(self, key: Optional[str]) -> Optional[GenerationResult]:
+        """Previously generated result for key, if any"""
+        if self.cache is None or key is None:
+            return None
+        message = self.cache.get(key)
+        return None if message is None else GenerationResult(message=message)
+
+    def _set_cached(self, key: Optional[str], result: GenerationResult) -> None:
+        """Remember result for key"""
+        if self.cache is not None and key is not None:
+            self.cache.set(key, result.message)
+
+    def _max_prompt_chars(self) -> int:
+        """Prompt size budget in characters, leaving room for the completion"""
+        tokens = self.client.model_config.context_window - self.client.max_tokens
+        return tokens * CHARS_PER_TOKEN
+
+
+def _summarize_diff(git_diff: str, max_hunk_lines: int) -> str:
+    """
+    Shrink a combined diff by keeping every file and hunk header but only the
+    first max_hunk_lines lines of each hunk body.
+    """
+    summary = []
+    in_hunk = False
+    kept = hidden = 0
+
+    for line in git_diff.split("\n"):
+        # Hunk bodies are prefixed with " ", "+" or "-", so a line starting
+        # with "@@ " is a hunk header and an empty line separates two files
+        if line.startswith("@@ ") or not line:
+            if hidden:
+                summary.append(f"... {hidden} more lines")
+            in_hunk = bool(line)
+            kept = hidden = 0
+        elif in_hunk:
+            if kept == max_hunk_lines:
+                hidden += 1
+                continue
+            kept += 1
+        summary.append(line)
+
+    if hidden:
+        summary.append(f"... {hidden} more lines")
+    return "\n".join(summary)
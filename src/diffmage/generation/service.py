@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional
 
 from diffmage.git.diff_parser import GitDiffParser
@@ -42,3 +43,27 @@ class GenerationService:
             return self.generator.enhance_with_why_context(result, why_context)
 
         return result
+
+    async def agenerate_commit_message(
+        self, request: GenerationRequest, why_context: Optional[str] = None
+    ) -> GenerationResult:
+        """
+        Async variant of generate_commit_message
+
+        The staged diff is parsed in a worker thread, so the event loop stays
+        free for other work while git runs.
+        """
+        parser = GitDiffParser(repo_path=request.repo_path)
+        analysis: CommitAnalysis = await asyncio.to_thread(parser.parse_staged_changes)
+
+        result = await self.generator.agenerate_commit_message(
+            analysis.get_combined_diff(),
+            analysis.total_files,
+            analysis.total_lines_added,
+            analysis.total_lines_removed,
+        )
+
+        if why_context:
+            return await self.generator.aenhance_with_why_context(result, why_context)
+
+        return result
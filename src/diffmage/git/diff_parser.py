@@ -1,25 +1,90 @@
+import functools
+import os
+import threading
+from collections import OrderedDict
 from typing import Optional
 import git
-from diffmage.utils.file_detector import FileDetector
-from unidiff import PatchSet, PatchedFile, Hunk
+from diffmage.utils.file_detector import detect_file_type
+from diffmage.git.unified_diff import PatchedFile, parse_unified_diff
 from diffmage.core.models import (
     CommitAnalysis,
     FileDiff,
     ChangeType,
-    HunkLine,
-    DiffHunk,
 )
 
+# Git's well-known empty tree, used to diff a root commit
+EMPTY_TREE_SHA = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+
+# `git log` format for parse_commits: NUL-separated hash and message, with
+# the commit's patch following the last NUL. NULs cannot occur in a text diff
+COMMIT_LOG_FORMAT = "%x00%H%x00%B%x00"
+
+# Files whose hunks are left out of the analysis: changes this large (or
+# machine generated) would crowd the rest of the diff out of the prompt
+MAX_FILE_DIFF_LINES = 2000
+LOCKFILE_NAMES = frozenset(
+    {
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "poetry.lock",
+        "uv.lock",
+        "Pipfile.lock",
+        "Cargo.lock",
+        "Gemfile.lock",
+        "composer.lock",
+        "go.sum",
+    }
+)
+
+
+# Diff texts of recently parsed commits, keyed by (git dir, sha). Keyed on
+# the path rather than the git.Repo so cached entries do not keep repositories
+# (and their persistent `git cat-file` processes) alive
+COMMIT_DIFF_CACHE_SIZE = 256
+_commit_diff_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+_commit_diff_lock = threading.Lock()
+
+
+def _commit_diff_text(repo: git.Repo, hexsha: str, is_root: bool) -> str:
+    """
+    Diff text of a commit against its first parent.
+
+    Commits are immutable, so the result is cached per (git dir, sha) and
+    repeated parses of the same commit skip the git subprocess, across
+    parsers and threads.
+    """
+    key = (os.fspath(repo.git_dir), hexsha)
+    with _commit_diff_lock:
+        cached = _commit_diff_cache.get(key)
+        if cached is not None:
+            _commit_diff_cache.move_to_end(key)
+            return cached
+
+    base = EMPTY_TREE_SHA if is_root else f"{hexsha}~1"
+    diff_text = str(repo.git.diff(base, hexsha, "--no-color"))
+
+    with _commit_diff_lock:
+        _commit_diff_cache[key] = diff_text
+        if len(_commit_diff_cache) > COMMIT_DIFF_CACHE_SIZE:
+            _commit_diff_cache.popitem(last=False)
+
+    return diff_text
+
 
 class GitDiffParser:
     """Parser using git diff to extract and parse file diffs"""
 
     def __init__(self, repo_path: str = "."):
         self.repo = git.Repo(repo_path)
-        self.file_detector = FileDetector()
+
+    @functools.cached_property
+    def branch_name(self) -> str:
+        """Name of the checked out branch, read once per parser"""
+        return str(self.repo.active_branch.name)
 
     def parse_staged_changes(self) -> CommitAnalysis:
-        """Parse staged changes from git using the unidiff library"""
+        """Parse staged changes from git"""
 
         try:
             diff_text = self.repo.git.diff("--cached", "--no-color")
@@ -52,31 +117,73 @@ class GitDiffParser:
         except git.GitCommandError as e:
             raise ValueError(f"Failed to get commit diff: {e}")
 
-        diff_text = self._get_commit_diff_text(commit_hash, commit)
+        try:
+            diff_text = _commit_diff_text(
+                self.repo, commit.hexsha, is_root=not commit.parents
+            )
+        except git.GitCommandError as e:
+            raise ValueError(f"Failed to get commit diff: {e}")
 
         analysis = self._parse_diff_text(diff_text, f"commit {commit_hash}")
 
         return analysis, commit_message
 
-    def _get_commit_diff_text(self, commit_hash: str, commit: git.Commit) -> str:
-        """Get diff text for a specific commit"""
+    def parse_commits(
+        self, commit_hashes: list[str]
+    ) -> list[tuple[CommitAnalysis, str]]:
+        """
+        Parse several commits from git history with a single `git log -p`.
+
+        Equivalent to calling parse_specific_commit for each hash, but runs
+        two git subprocesses in total rather than one per commit.
+
+        Args:
+            commit_hashes: Git commit hashes or revisions, in the order wanted
+
+        Returns:
+            List of (CommitAnalysis, commit_message), one per commit_hashes entry
+
+        Raises:
+            ValueError: If a commit doesn't exist or has no changes
+        """
+        if not commit_hashes:
+            return []
+
         try:
-            # Get diff between previous commit and specified commit
-            return str(
-                self.repo.git.diff(f"{commit_hash}~1", commit_hash, "--no-color")
-            )
+            hexshas = str(
+                self.repo.git.rev_parse(*(f"{h}^{{commit}}" for h in commit_hashes))
+            ).split()
         except git.GitCommandError:
-            # Probably initial commit - compare to empty tree
-            if len(commit.parents) == 0:
-                return str(
-                    self.repo.git.diff(
-                        "4b825dc642cb6eb9a060e54bf8d69288fbee4904",
-                        commit_hash,
-                        "--no-color",
-                    )
+            raise ValueError(f"Invalid commit hash in: {', '.join(commit_hashes)}")
+
+        try:
+            log_text = str(
+                self.repo.git.log(
+                    "--no-walk=unsorted",
+                    "-p",
+                    "--no-color",
+                    # Diff merges against their first parent, like `git diff A~1 A`
+                    "--diff-merges=first-parent",
+                    f"--format={COMMIT_LOG_FORMAT}",
+                    *dict.fromkeys(hexshas),
                 )
-            else:
-                raise
+            )
+        except git.GitCommandError as e:
+            raise ValueError(f"Failed to get commit diffs: {e}")
+
+        fields = log_text.split("\0")
+        commits = {
+            fields[index]: (fields[index + 1], fields[index + 2])
+            for index in range(1, len(fields) - 2, 3)
+        }
+
+        results = []
+        for commit_hash, hexsha in zip(commit_hashes, hexshas):
+            message, diff_text = commits[hexsha]
+            analysis = self._parse_diff_text(diff_text, f"commit {commit_hash}")
+            results.append((analysis, message.strip()))
+
+        return results
 
     def _parse_diff_text(
         self, diff_text: str, source_description: str
@@ -88,46 +195,36 @@ class GitDiffParser:
             diff_text: Raw git diff output
             source_description: Description for error messages (e.g., "staged changes", "commit abc123")
         """
-        if not diff_text.strip():
+        # isspace() scans in place, where strip() would copy the whole diff
+        if not diff_text or diff_text.isspace():
             raise ValueError(f"No changes found in {source_description}")
 
         try:
-            patch_set = PatchSet(diff_text)
+            patched_files = parse_unified_diff(diff_text)
         except Exception as e:
             raise ValueError(f"Failed to parse {source_description}: {e}")
 
         files = []
-        total_lines_added = 0
-        total_lines_removed = 0
-
-        for patched_file in patch_set:
+        for patched_file in patched_files:
             file_diff = self._convert_patched_file(patched_file)
             if file_diff:
                 files.append(file_diff)
-                total_lines_added += file_diff.lines_added
-                total_lines_removed += file_diff.lines_removed
 
-        return CommitAnalysis(
-            files=files,
-            total_files=len(files),
-            total_lines_added=total_lines_added,
-            total_lines_removed=total_lines_removed,
-            branch_name=self.repo.active_branch.name,
-        )
+        # Totals are aggregated from the files by CommitAnalysis itself
+        return CommitAnalysis(files=files, branch_name=self.branch_name)
 
     def _convert_patched_file(self, patched_file: PatchedFile) -> Optional[FileDiff]:
-        """Convert a unidiff PatchedFile to a FileDiff object"""
+        """Convert a PatchedFile to a FileDiff object"""
 
         try:
             change_type = self._determine_change_type(patched_file)
-            file_type = self.file_detector.detect_file_type(patched_file.path)
+            file_type = detect_file_type(patched_file.path)
 
-            hunks = []
-            if not patched_file.is_binary_file:
-                for hunk in patched_file:
-                    diff_hunk = self._convert_hunk(hunk)
-                    if diff_hunk:
-                        hunks.append(diff_hunk)
+            # Hunks come out of parse_unified_diff already converted
+            hunks = [] if patched_file.is_binary_file else patched_file.hunks
+            is_truncated = bool(hunks) and self._is_too_large(patched_file)
+            if is_truncated:
+                hunks = []
 
             return FileDiff(
                 old_path=(
@@ -146,11 +243,18 @@ class GitDiffParser:
                 lines_added=patched_file.added,
                 lines_removed=patched_file.removed,
                 hunks=hunks,
+                is_truncated=is_truncated,
             )
         except Exception:
             # Skip files that we can't convert
             return None
 
+    def _is_too_large(self, patched_file: PatchedFile) -> bool:
+        """Whether a file's hunks should be summarized rather than kept"""
+        if patched_file.added + patched_file.removed > MAX_FILE_DIFF_LINES:
+            return True
+        return patched_file.path.rsplit("/", 1)[-1] in LOCKFILE_NAMES
+
     def _determine_change_type(self, patched_file: PatchedFile) -> ChangeType:
         """Detect the change type of a patched file"""
         # For files that are both renamed and modified,
@@ -162,35 +266,3 @@ class GitDiffParser:
         if patched_file.is_removed_file:
             return ChangeType.DELETED
         return ChangeType.MODIFIED
-
-    def _convert_hunk(self, hunk: Hunk) -> Optional[DiffHunk]:
-        """Convert a unidiff Hunk to a DiffHunk object with line by line content"""
-        try:
-            lines = []
-
-            for line in hunk:
-                hunk_line = HunkLine(
-                    line_type=line.line_type,  # '+', '-', or ' '
-                    is_removed=line.is_removed,
-                    is_added=line.is_added,
-                    is_context=line.is_context,  # True if line is not a change
-                    content=line.value.rstrip("\n"),  # Remove trailing newline
-                    old_line_number=line.source_line_no
-                    if line.source_line_no
-                    else None,
-                    new_line_number=line.target_line_no
-                    if line.target_line_no
-                    else None,
-                )
-                lines.append(hunk_line)
-
-            return DiffHunk(
-                old_start_line=hunk.source_start,
-                old_lines_count=hunk.source_length,
-                new_start_line=hunk.target_start,
-                new_lines_count=hunk.target_length,
-                section_header=hunk.section_header,
-                lines=lines,
-            )
-        except Exception:
-            return None
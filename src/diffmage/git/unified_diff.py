@@ -0,0 +1,228 @@
+"""
+Single pass parser for the unified diffs produced by `git diff`.
+
+Splits the diff text once and builds each hunk's columns (see DiffHunk)
+directly, rather than building a line object per diff line first. The
+file level properties follow unidiff's PatchedFile, which this replaces.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+from diffmage.core.models import DiffHunk
+
+DEV_NULL = "/dev/null"
+
+# Same header forms unidiff accepts: a/ b/ prefixed, URI-like, then unprefixed
+DIFF_GIT_HEADERS = (
+    re.compile(r'^diff --git (?P<source>"?a/[^\t\n]+"?) (?P<target>"?b/[^\t\n]+"?)'),
+    re.compile(r"^diff --git (?P<source>.*://[^\t\n]+) (?P<target>.*://[^\t\n]+)"),
+    re.compile(r"^diff --git (?P<source>[^\t\n]+) (?P<target>[^\t\n]+)"),
+)
+
+HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@[ ]?(.*)")
+
+# git's a/ b/ prefixes, the diff.mnemonicPrefix ones, and --no-index's 1/ 2/
+PATH_PREFIX = re.compile(r"^[abciow12]/")
+
+
+@dataclass(slots=True)
+class PatchedFile:
+    """One file's section of a diff, with its hunks already converted"""
+
+    source_file: str
+    target_file: str
+    is_binary_file: bool = False
+    hunks: list[DiffHunk] = field(default_factory=list)
+    added: int = 0
+    removed: int = 0
+
+    @property
+    def path(self) -> str:
+        """File path without the a/ b/ prefix, preferring the target of a rename"""
+        filepath = self.source_file
+        if filepath == DEV_NULL or (self.is_rename and self.target_file != DEV_NULL):
+            filepath = self.target_file
+
+        stripped = _strip_path(filepath)
+        return f'"{stripped}"' if _is_quoted(filepath) else stripped
+
+    @property
+    def is_rename(self) -> bool:
+        return (
+            self.source_file != DEV_NULL
+            and self.target_file != DEV_NULL
+            and _strip_path(self.source_file) != _strip_path(self.target_file)
+        )
+
+    @property
+    def is_added_file(self) -> bool:
+        if self.source_file == DEV_NULL:
+            return True
+        return (
+            len(self.hunks) == 1
+            and self.hunks[0].old_start_line == 0
+            and self.hunks[0].old_lines_count == 0
+        )
+
+    @property
+    def is_removed_file(self) -> bool:
+        if self.target_file == DEV_NULL:
+            return True
+        return (
+            len(self.hunks) == 1
+            and self.hunks[0].new_start_line == 0
+            and self.hunks[0].new_lines_count == 0
+        )
+
+
+def _is_quoted(filepath: str) -> bool:
+    """Whether git quoted filepath (it contains special characters)"""
+    return len(filepath) > 1 and filepath.startswith('"') and filepath.endswith('"')
+
+
+def _strip_path(filepath: str) -> str:
+    """filepath without git's quotes or its a/ b/ style prefix"""
+    if _is_quoted(filepath):
+        filepath = filepath[1:-1]
+    if PATH_PREFIX.match(filepath):
+        filepath = filepath[2:]
+    return filepath
+
+
+def parse_unified_diff(diff_text: str) -> list[PatchedFile]:
+    """
+    Parse `git diff` output into PatchedFiles.
+
+    Raises:
+        ValueError: If a hunk is malformed or does not match its header
+    """
+    lines = diff_text.split("\n")
+    files: list[PatchedFile] = []
+    current: Optional[PatchedFile] = None
+
+    index = 0
+    count = len(lines)
+    while index < count:
+        line = lines[index]
+        index += 1
+
+        if line.startswith("@@ "):
+            if current is None:
+                raise ValueError(f"Unexpected hunk found: {line}")
+            index = _parse_hunk(lines, index, line, current)
+        elif line.startswith("diff --git "):
+            current = _start_file(line)
+            files.append(current)
+        elif current is None:
+            continue
+        elif line.startswith("new file mode "):
+            current.source_file = DEV_NULL
+        elif line.startswith("deleted file mode "):
+            current.target_file = DEV_NULL
+        elif line.startswith("Binary files ") or line == "GIT binary patch":
+            current.is_binary_file = True
+
+        # Anything else is header detail (index, mode, rename and ---/+++
+        # lines) that the diff --git line already covers
+
+    return files
+
+
+def _start_file(header: str) -> PatchedFile:
+    """PatchedFile for a `diff --git` header line"""
+    for pattern in DIFF_GIT_HEADERS:
+        match = pattern.match(header)
+        if match:
+            return PatchedFile(match.group("source"), match.group("target"))
+    raise ValueError(f"Malformed diff header: {header}")
+
+
+def _parse_hunk(lines: list[str], start: int, header: str, file: PatchedFile) -> int:
+    """
+    Parse the hunk whose header precedes lines[start] into file.
+
+    The body is delimited by the line counts in the header, so removed or
+    added lines that look like headers ("--- x", "+++ y") are read as content.
+
+    Returns:
+        Index of the first line after the hunk
+    """
+    match = HUNK_HEADER.match(header)
+    if match is None:
+        raise ValueError(f"Malformed hunk header: {header}")
+
+    old_start, old_count, new_start, new_count, section_header = match.groups()
+    old_start_line = int(old_start)
+    new_start_line = int(new_start)
+    old_lines_count = 1 if old_count is None else int(old_count)
+    new_lines_count = 1 if new_count is None else int(new_count)
+
+    old_line_numbers: list[Optional[int]] = []
+    new_line_numbers: list[Optional[int]] = []
+    old_number = old_start_line
+    new_number = new_start_line
+    old_end = old_start_line + old_lines_count
+    new_end = new_start_line + new_lines_count
+    added = removed = 0
+
+    index = start
+    total = len(lines)
+    while old_number < old_end or new_number < new_end:
+        if index == total:
+            raise ValueError("Hunk is shorter than expected")
+
+        line_type = lines[index][:1]
+        if line_type == "+":
+            old_line_numbers.append(None)
+            new_line_numbers.append(new_number)
+            new_number += 1
+            added += 1
+        elif line_type == "-":
+            old_line_numbers.append(old_number)
+            new_line_numbers.append(None)
+            old_number += 1
+            removed += 1
+        elif line_type == " " or line_type == "" or line_type == "\r":
+            if line_type != " ":
+                # A bare (possibly DOS) line ending is an empty context line
+                lines[index] = " " + lines[index]
+            old_line_numbers.append(old_number)
+            new_line_numbers.append(new_number)
+            old_number += 1
+            new_number += 1
+        elif line_type == "\\":
+            # "\ No newline at end of file" belongs to neither side
+            old_line_numbers.append(None)
+            new_line_numbers.append(None)
+        else:
+            raise ValueError(f"Hunk diff line expected: {lines[index]}")
+
+        if old_number > old_end or new_number > new_end:
+            raise ValueError("Hunk is longer than expected")
+        index += 1
+
+    # A no-newline marker can also follow the hunk's last line
+    while index < total and lines[index].startswith("\\"):
+        old_line_numbers.append(None)
+        new_line_numbers.append(None)
+        index += 1
+
+    body = lines[start:index]
+    file.hunks.append(
+        DiffHunk(
+            old_start_line=old_start_line,
+            old_lines_count=old_lines_count,
+            new_start_line=new_start_line,
+            new_lines_count=new_lines_count,
+            section_header=section_header,
+            line_types="".join([line[0] for line in body]),
+            contents=[line[1:] for line in body],
+            old_line_numbers=old_line_numbers,
+            new_line_numbers=new_line_numbers,
+        )
+    )
+    file.added += added
+    file.removed += removed
+
+    return index
@@ -0,0 +1,14 @@
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split items into consecutive lists of at most size elements"""
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
@@ -1,110 +1,91 @@
-from pathlib import Path
+import re
 from diffmage.core.models import FileType
 
-
-class FileDetector:
-    """Detects file types based on path, extension, and content patterns"""
-
-    def __init__(self) -> None:
-        pass
-
-    def detect_file_type(self, file_path: str) -> FileType:
-        """Detect file type with clear delegation to specialized methods."""
-        path = Path(file_path)
-
-        # Test files
-        if self._is_test_file(path):
-            return FileType.TEST_CODE
-
-        # Configuration files
-        if self._is_config_file(path):
-            return FileType.CONFIG
-
-        # Source code
-        if self._is_source_code_file(path):
-            return FileType.SOURCE_CODE
-
-        # Documentation
-        if self._is_documentation_file(path):
-            return FileType.DOCUMENTATION
-
-        # Binary docs
-        if self._is_binary_file(path):
-            return FileType.DOCUMENTATION
-
-        return FileType.UNKNOWN
-
-    def _is_test_file(self, path: Path) -> bool:
-        """Check if a file is a test file based on path and name patterns"""
-        name = path.name.lower()
-        parts = path.parts
-
-        return (
-            any(part in ["test", "tests", "__tests__"] for part in parts)
-            or name.startswith("test_")
-            or name.endswith("_test")
-            or name.endswith("_spec")
-            or "_test." in name
-            or "_test_" in name
-            or ".test." in name
-            or "_spec." in name
-            or "_spec_" in name
-            or ".spec." in name
-        )
-
-    def _is_config_file(self, path: Path) -> bool:
-        """Check if a file is a configuration file based on path and name patterns"""
-        ext = path.suffix.lower()
-        name = path.name.lower()
-
-        return ext in {
-            ".yml",
-            ".yaml",
-            ".json",
-            ".toml",
-            ".ini",
-            ".conf",
-        } or name in {
-            "dockerfile",
-            "docker-compose.yml",
-            "docker-compose.yaml",
-            ".dockerignore",
-            ".dockerfile",
-            ".env",
-            ".env.local",
-        }
-
-    def _is_source_code_file(self, path: Path) -> bool:
-        """Check if a file is a source code file based on path and name patterns"""
-        ext = path.suffix.lower()
-
-        return ext in {
-            ".py",
-            ".js",
-            ".ts",
-            ".jsx",
-            ".tsx",
-            ".java",
-            ".cpp",
-            ".c",
-            ".h",
-            ".rb",
-            ".erb",
-            ".go",
-            ".rs",
-            ".php",
-            ".cs",
-            ".swift",
-        }
-
-    def _is_documentation_file(self, path: Path) -> bool:
-        """Check if a file is a documentation file based on path and name patterns"""
-        ext = path.suffix.lower()
-
-        return ext in {".md", ".txt", ".rst", ".tex"}
-
-    def _is_binary_file(self, path: Path) -> bool:
-        """Check if a file is a binary file based on path and name patterns"""
-        ext = path.suffix.lower()
-
-        return ext in {".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx"}
+# Directory names whose contents are tests
+TEST_DIRS = frozenset({"test", "tests", "__tests__"})
+
+# test_*, *_test, *_spec, or containing _test. _test_ .test. _spec. _spec_
+# .spec. -- matched against the lower-cased file name in a single scan
+TEST_NAME_PATTERN = re.compile(r"^test_|_(?:test|spec)(?:$|[._])|\.(?:test|spec)\.")
+
+CONFIG_EXTENSIONS = frozenset({".yml", ".yaml", ".json", ".toml", ".ini", ".conf"})
+
+CONFIG_NAMES = frozenset(
+    {
+        "dockerfile",
+        "docker-compose.yml",
+        "docker-compose.yaml",
+        ".dockerignore",
+        ".dockerfile",
+        ".env",
+        ".env.local",
+    }
+)
+
+SOURCE_CODE_EXTENSIONS = frozenset(
+    {
+        ".py",
+        ".js",
+        ".ts",
+        ".jsx",
+        ".tsx",
+        ".java",
+        ".cpp",
+        ".c",
+        ".h",
+        ".rb",
+        ".erb",
+        ".go",
+        ".rs",
+        ".php",
+        ".cs",
+        ".swift",
+    }
+)
+
+DOCUMENTATION_EXTENSIONS = frozenset({".md", ".txt", ".rst", ".tex"})
+
+BINARY_DOCUMENT_EXTENSIONS = frozenset(
+    {".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx"}
+)
+
+
+# File type by lower-cased extension. The extension sets are disjoint, so one
+# lookup replaces checking each set in turn
+EXTENSION_FILE_TYPES: dict[str, FileType] = {
+    **dict.fromkeys(CONFIG_EXTENSIONS, FileType.CONFIG),
+    **dict.fromkeys(SOURCE_CODE_EXTENSIONS, FileType.SOURCE_CODE),
+    **dict.fromkeys(DOCUMENTATION_EXTENSIONS, FileType.DOCUMENTATION),
+    **dict.fromkeys(BINARY_DOCUMENT_EXTENSIONS, FileType.DOCUMENTATION),
+}
+
+
+def detect_file_type(file_path: str) -> FileType:
+    """Detect file type: test files first, then by extension, then by name"""
+    # Plain string slicing rather than pathlib.Path: git paths are always
+    # "/"-separated and relative, and this runs once per changed file
+    parts = file_path.split("/")
+    name = parts[-1].lower()
+
+    # Test files, whatever their extension
+    if _is_test_file(parts, name):
+        return FileType.TEST_CODE
+
+    # Config, source code, documentation and binary docs by extension.
+    # Like Path.suffix, a leading or trailing dot is not an extension
+    dot = name.rfind(".")
+    suffix = name[dot:] if 0 < dot < len(name) - 1 else ""
+    file_type = EXTENSION_FILE_TYPES.get(suffix)
+    if file_type is not None:
+        return file_type
+
+    # Extensionless configuration files (Dockerfile, .env, ...)
+    if name in CONFIG_NAMES:
+        return FileType.CONFIG
+
+    return FileType.UNKNOWN
+
+
+def _is_test_file(parts: list[str], name: str) -> bool:
+    """Check if a file is a test file based on its path parts and lower-cased name"""
+    return not TEST_DIRS.isdisjoint(parts) or bool(TEST_NAME_PATTERN.search(name))
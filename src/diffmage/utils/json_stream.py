@@ -0,0 +1,43 @@
+from typing import Iterable
+
+
+def read_json_object(chunks: Iterable[str]) -> str:
+    """
+    Accumulate streamed text until the first top-level JSON object closes.
+
+    Braces inside JSON strings are ignored. Consumption stops as soon as the
+    object is complete, so trailing output is never waited for. If the
+    stream ends first, everything received is returned for the caller to
+    report as invalid.
+    """
+    parts: list[str] = []
+    received = 0
+    start = -1
+    depth = 0
+    in_string = escaped = False
+
+    for chunk in chunks:
+        parts.append(chunk)
+        for index, char in enumerate(chunk):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif start < 0:
+                if char == "{":
+                    start = received + index
+                    depth = 1
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return "".join(parts)[start : received + index + 1]
+        received += len(chunk)
+
+    return "".join(parts)
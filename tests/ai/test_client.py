@@ -1,5 +1,10 @@
+import subprocess
+import sys
+
+import orjson
 import pytest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 from diffmage.ai.client import AIClient
 from diffmage.core.models import (
     CommitAnalysis,
@@ -12,20 +17,40 @@ from diffmage.core.models import (
 from diffmage.ai.models import get_default_model
 
 
+def make_response(content: str) -> SimpleNamespace:
+    """Build a completion response exposing only choices[0].message.content."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+
+
+@pytest.fixture
+def mock_completion(monkeypatch):
+    """Replace the client's completion call with a mock."""
+    mock = MagicMock()
+    monkeypatch.setattr("diffmage.ai.client.completion", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_acompletion(monkeypatch):
+    """Replace the client's acompletion call with an async mock."""
+    mock = AsyncMock()
+    monkeypatch.setattr("diffmage.ai.client.acompletion", mock)
+    return mock
+
+
 @pytest.fixture
 def mock_commit_analysis():
     """Create a mock CommitAnalysis for testing."""
     hunk_line = HunkLine(
         line_type="+",
-        is_removed=False,
-        is_added=True,
-        is_context=False,
         content="def new_function():",
         old_line_number=None,
         new_line_number=1,
     )
 
-    hunk = DiffHunk(
+    hunk = DiffHunk.from_lines(
         old_start_line=1,
         old_lines_count=0,
         new_start_line=1,
@@ -57,10 +82,16 @@ def mock_commit_analysis():
 @pytest.fixture
 def mock_ai_response():
     """Create a mock AI response."""
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message.content = "feat: add new feature"
-    return mock_response
+    return make_response("feat: add new feature")
+
+
+def test_cli_import_does_not_load_litellm():
+    """Test litellm is only imported once a model request is made."""
+    code = "import sys, diffmage.cli; assert 'litellm' not in sys.modules"
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+
+    assert result.returncode == 0, result.stderr.decode()
 
 
 def test_ai_client_initialization():
@@ -91,7 +122,6 @@ def test_ai_client_initialization_uses_default_model():
     assert client.model_config.name == default_model.name
 
 
-@patch("diffmage.ai.client.completion")
 def test_generate_commit_message_success(mock_completion, mock_ai_response):
     """Test successful commit message generation."""
     # Setup mock
@@ -120,7 +150,6 @@ def test_generate_commit_message_success(mock_completion, mock_ai_response):
     assert messages[1]["role"] == "user"
 
 
-@patch("diffmage.ai.client.completion")
 def test_generate_commit_message_ai_error(mock_completion, mock_commit_analysis):
     """Test commit message generation when AI service fails."""
     # Setup mock to raise exception
@@ -134,7 +163,6 @@ def test_generate_commit_message_ai_error(mock_completion, mock_commit_analysis)
         client.generate_commit_message(mock_commit_analysis)
 
 
-@patch("diffmage.ai.client.completion")
 def test_generate_commit_message_with_custom_params(
     mock_completion, mock_commit_analysis, mock_ai_response
 ):
@@ -159,15 +187,12 @@ def test_generate_commit_message_with_custom_params(
     assert call_args[1]["max_tokens"] == 1500
 
 
-@patch("diffmage.ai.client.completion")
 def test_generate_commit_message_strips_whitespace(
     mock_completion, mock_commit_analysis
 ):
     """Test that generated commit message has whitespace stripped."""
     # Setup mock with whitespace
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message.content = "  feat: add new feature  \n"
+    mock_response = make_response("  feat: add new feature  \n")
     mock_completion.return_value = mock_response
 
     client = AIClient(model_name="openai/gpt-4o-mini")
@@ -180,9 +205,7 @@ def test_generate_commit_message_strips_whitespace(
 @pytest.fixture
 def mock_evaluation_response():
     """Create a mock evaluation response."""
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message.content = """{
+    return make_response("""{
         "what_score": 4,
         "why_score": 5,
         "overall_score": 4.5,
@@ -190,11 +213,9 @@ def mock_evaluation_response():
         "confidence": 0.9,
         "model_used": "openai/gpt-4o-mini",
         "dimension": "unified"
-    }"""
-    return mock_response
+    }""")
 
 
-@patch("diffmage.ai.client.completion")
 def test_evaluate_with_llm_success(mock_completion, mock_evaluation_response):
     """Test successful commit message evaluation."""
     # Setup mock
@@ -206,10 +227,11 @@ def test_evaluate_with_llm_success(mock_completion, mock_evaluation_response):
     result = client.evaluate_with_llm(evaluation_prompt)
 
     # Verify result
-    assert '"what_score": 4' in result
-    assert '"why_score": 5' in result
-    assert "reasoning" in result
-    assert "confidence" in result
+    parsed = orjson.loads(result)
+    assert parsed["what_score"] == 4
+    assert parsed["why_score"] == 5
+    assert "reasoning" in parsed
+    assert "confidence" in parsed
 
     # Verify completion was called with correct parameters
     mock_completion.assert_called_once()
@@ -227,7 +249,60 @@ def test_evaluate_with_llm_success(mock_completion, mock_evaluation_response):
     assert evaluation_prompt in messages[1]["content"]
 
 
-@patch("diffmage.ai.client.completion")
+def test_evaluate_with_llm_stream_yields_content(mock_completion):
+    """Test streamed evaluation yields each non-empty content delta."""
+    deltas = ['{"what_score": ', None, "4}"]
+    mock_completion.return_value = [
+        SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=content))]
+        )
+        for content in deltas
+    ]
+
+    client = AIClient(model_name="openai/gpt-4o-mini")
+    chunks = list(client.evaluate_with_llm_stream("test evaluation prompt"))
+
+    assert chunks == ['{"what_score": ', "4}"]
+    assert mock_completion.call_args[1]["stream"] is True
+
+
+def test_evaluate_with_llm_stream_closes_stream_when_stopped_early(mock_completion):
+    """Test the wrapped provider stream is closed when the caller stops reading."""
+    chunks = [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+        for text in ['{"what_score": ', "4}"]
+    ]
+    provider_stream = MagicMock()
+    stream = MagicMock(spec=["__iter__", "completion_stream"])
+    stream.__iter__.return_value = iter(chunks)
+    stream.completion_stream = provider_stream
+    mock_completion.return_value = stream
+
+    client = AIClient(model_name="openai/gpt-4o-mini")
+    fragments = client.evaluate_with_llm_stream("test evaluation prompt")
+    assert next(fragments) == '{"what_score": '
+    fragments.close()
+
+    provider_stream.close.assert_called_once()
+
+
+def test_evaluate_with_llm_falls_back_to_unstructured_request(mock_completion):
+    """Test a failed structured request is retried without response_format."""
+    mock_completion.side_effect = [
+        Exception("structured output unsupported"),
+        make_response('{"what_score": 4}'),
+    ]
+
+    client = AIClient(model_name="openai/gpt-4o-mini")
+    result = client.evaluate_with_llm("test evaluation prompt")
+
+    assert result == '{"what_score": 4}'
+    structured, fallback = mock_completion.call_args_list
+    assert "response_format" in structured[1]
+    assert "response_format" not in fallback[1]
+    assert fallback[1]["messages"] == structured[1]["messages"]
+
+
 def test_evaluate_with_llm_ai_error(mock_completion):
     """Test commit message evaluation when AI service fails."""
     # Setup mock to raise exception
@@ -242,13 +317,10 @@ def test_evaluate_with_llm_ai_error(mock_completion):
         client.evaluate_with_llm(evaluation_prompt)
 
 
-@patch("diffmage.ai.client.completion")
 def test_evaluate_with_llm_strips_whitespace(mock_completion):
     """Test that evaluation response has whitespace stripped."""
     # Setup mock with whitespace
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message.content = '  {"what_score": 4}  \n'
+    mock_response = make_response('  {"what_score": 4}  \n')
     mock_completion.return_value = mock_response
 
     client = AIClient(model_name="openai/gpt-4o-mini")
@@ -259,7 +331,6 @@ def test_evaluate_with_llm_strips_whitespace(mock_completion):
     assert result == '{"what_score": 4}'
 
 
-@patch("diffmage.ai.client.completion")
 def test_evaluate_with_llm_with_custom_params(
     mock_completion, mock_evaluation_response
 ):
@@ -275,7 +346,7 @@ def test_evaluate_with_llm_with_custom_params(
     result = client.evaluate_with_llm(evaluation_prompt)
 
     # Verify result
-    assert '"what_score": 4' in result
+    assert orjson.loads(result)["what_score"] == 4
 
     # Verify completion was called with custom parameters
     mock_completion.assert_called_once()
@@ -283,3 +354,43 @@ def test_evaluate_with_llm_with_custom_params(
     assert call_args[1]["model"] == "anthropic/claude-haiku"
     assert call_args[1]["temperature"] == 0.0
     assert call_args[1]["max_tokens"] == 1500
+
+
+@pytest.mark.asyncio
+async def test_agenerate_commit_message_success(mock_acompletion, mock_ai_response):
+    """Test successful async commit message generation."""
+    mock_acompletion.return_value = mock_ai_response
+
+    client = AIClient(model_name="openai/gpt-4o-mini")
+    result = await client.agenerate_commit_message("test prompt")
+
+    assert result == "feat: add new feature"
+    mock_acompletion.assert_awaited_once()
+    assert mock_acompletion.call_args[1]["model"] == "openai/gpt-4o-mini"
+    assert mock_acompletion.call_args[1]["messages"][1]["content"] == "test prompt"
+
+
+@pytest.mark.asyncio
+async def test_aevaluate_with_llm_success(mock_acompletion, mock_evaluation_response):
+    """Test successful async commit message evaluation."""
+    mock_acompletion.return_value = mock_evaluation_response
+
+    client = AIClient(model_name="openai/gpt-4o-mini")
+    result = await client.aevaluate_with_llm("test evaluation prompt")
+
+    assert orjson.loads(result)["what_score"] == 4
+    mock_acompletion.assert_awaited_once()
+    assert mock_acompletion.call_args[1]["model"] == "openai/gpt-4o-mini"
+
+
+@pytest.mark.asyncio
+async def test_aevaluate_with_llm_ai_error(mock_acompletion):
+    """Test async commit message evaluation when AI service fails."""
+    mock_acompletion.side_effect = Exception("AI service unavailable")
+
+    client = AIClient(model_name="openai/gpt-4o-mini")
+
+    with pytest.raises(
+        ValueError, match="Error evaluating commit message: AI service unavailable"
+    ):
+        await client.aevaluate_with_llm("test evaluation prompt")
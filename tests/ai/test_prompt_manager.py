@@ -1,10 +1,16 @@
+import re
+
+import pytest
 from diffmage.ai.prompt_manager import (
     get_commit_prompt,
     get_generation_system_prompt,
     get_evaluation_system_prompt,
     get_evaluation_prompt,
+    get_why_context_prompt,
 )
 
+GIT_DIFF_TAGS = re.compile(r"<git_diff>(.*?)</git_diff>", re.S)
+
 
 def test_get_generation_system_prompt():
     """Test that generation system prompt is properly formatted and contains expected content."""
@@ -92,8 +98,8 @@ def test_get_evaluation_prompt_contains_required_sections():
         "JSON RESPONSE",
     ]
 
-    for section in required_sections:
-        assert section in prompt, f"Missing required section: {section}"
+    missing = [section for section in required_sections if section not in prompt]
+    assert not missing, f"Missing required sections: {missing}"
 
 
 def test_get_evaluation_prompt_json_format():
@@ -111,73 +117,57 @@ def test_get_evaluation_prompt_json_format():
     assert "<1-5>" in prompt
 
 
-def test_get_commit_prompt_basic():
-    """Test basic commit prompt generation without context."""
-    diff_content = "--- a/test.py\n+++ b/test.py\n@@ -1,3 +1,4 @@\n def hello():\n-    print('hi')\n+    print('hello')\n"
-
-    prompt = get_commit_prompt(diff_content=diff_content)
-
-    assert isinstance(prompt, str)
-    assert len(prompt) > 0
-    assert diff_content in prompt
-    assert "conventional commits format" in prompt
-    assert "feat:" in prompt
-    assert "fix:" in prompt
-    assert "refactor:" in prompt
-
-
-def test_get_commit_prompt_with_file_count():
-    """Test commit prompt generation with file count context."""
-    diff_content = "--- a/test.py\n+++ b/test.py\n@@ -1,3 +1,4 @@\n def hello():\n-    print('hi')\n+    print('hello')\n"
-
-    prompt = get_commit_prompt(diff_content=diff_content, file_count=1)
-
-    assert "1 file" in prompt
-    assert diff_content in prompt
-
-
-def test_get_commit_prompt_with_multiple_files():
-    """Test commit prompt generation with multiple files context."""
-    diff_content = "--- a/test.py\n+++ b/test.py\n@@ -1,3 +1,4 @@\n def hello():\n-    print('hi')\n+    print('hello')\n"
-
-    prompt = get_commit_prompt(diff_content=diff_content, file_count=3)
-
-    assert "3 files" in prompt
-    assert diff_content in prompt
-
-
-def test_get_commit_prompt_with_line_changes():
-    """Test commit prompt generation with line changes context."""
-    diff_content = "--- a/test.py\n+++ b/test.py\n@@ -1,3 +1,4 @@\n def hello():\n-    print('hi')\n+    print('hello')\n"
-
-    prompt = get_commit_prompt(
-        diff_content=diff_content, lines_added=5, lines_removed=2
-    )
-
-    assert "5 lines added, 2 lines removed" in prompt
-    assert diff_content in prompt
-
-
-def test_get_commit_prompt_with_full_context():
-    """Test commit prompt generation with all context parameters."""
-    diff_content = "--- a/test.py\n+++ b/test.py\n@@ -1,3 +1,4 @@\n def hello():\n-    print('hi')\n+    print('hello')\n"
-
-    prompt = get_commit_prompt(
-        diff_content=diff_content, file_count=2, lines_added=10, lines_removed=3
-    )
-
-    assert "2 files, 10 lines added, 3 lines removed" in prompt
-    assert diff_content in prompt
-
-
-def test_get_commit_prompt_empty_diff():
-    """Test commit prompt generation with empty diff content."""
-    prompt = get_commit_prompt(diff_content="")
+SAMPLE_DIFF = "--- a/test.py\n+++ b/test.py\n@@ -1,3 +1,4 @@\n def hello():\n-    print('hi')\n+    print('hello')\n"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        pytest.param(
+            {"diff_content": SAMPLE_DIFF},
+            ["conventional commits format", "feat:", "fix:", "refactor:"],
+            id="basic",
+        ),
+        pytest.param(
+            {"diff_content": SAMPLE_DIFF, "file_count": 1},
+            ["1 file"],
+            id="file_count",
+        ),
+        pytest.param(
+            {"diff_content": SAMPLE_DIFF, "file_count": 3},
+            ["3 files"],
+            id="multiple_files",
+        ),
+        pytest.param(
+            {"diff_content": SAMPLE_DIFF, "lines_added": 5, "lines_removed": 2},
+            ["5 lines added, 2 lines removed"],
+            id="line_changes",
+        ),
+        pytest.param(
+            {
+                "diff_content": SAMPLE_DIFF,
+                "file_count": 2,
+                "lines_added": 10,
+                "lines_removed": 3,
+            },
+            ["2 files, 10 lines added, 3 lines removed"],
+            id="full_context",
+        ),
+        pytest.param(
+            {"diff_content": ""},
+            ["<git_diff>", "</git_diff>"],
+            id="empty_diff",
+        ),
+    ],
+)
+def test_get_commit_prompt_variants(kwargs, expected):
+    """Test commit prompt generation with each combination of context."""
+    prompt = get_commit_prompt(**kwargs)
 
     assert isinstance(prompt, str)
-    assert len(prompt) > 0
-    assert "<git_diff>" in prompt
-    assert "</git_diff>" in prompt
+    assert kwargs["diff_content"] in prompt
+    for text in expected:
+        assert text in prompt
 
 
 def test_get_commit_prompt_contains_instructions():
@@ -186,15 +176,20 @@ def test_get_commit_prompt_contains_instructions():
     prompt = get_commit_prompt(diff_content=diff_content)
 
     # Check for key instructions
-    assert "conventional commits format" in prompt
-    assert "imperative mood" in prompt
-    assert "WHAT changed and WHY" in prompt
-    assert "feat:" in prompt
-    assert "fix:" in prompt
-    assert "refactor:" in prompt
-    assert "docs:" in prompt
-    assert "test:" in prompt
-    assert "chore:" in prompt
+    required_instructions = [
+        "conventional commits format",
+        "imperative mood",
+        "WHAT changed and WHY",
+        "feat:",
+        "fix:",
+        "refactor:",
+        "docs:",
+        "test:",
+        "chore:",
+    ]
+
+    missing = [text for text in required_instructions if text not in prompt]
+    assert not missing, f"Missing required instructions: {missing}"
 
 
 def test_get_commit_prompt_xml_tags():
@@ -202,12 +197,21 @@ def test_get_commit_prompt_xml_tags():
     diff_content = "some diff content"
     prompt = get_commit_prompt(diff_content=diff_content)
 
-    assert "<git_diff>" in prompt
-    assert "</git_diff>" in prompt
-    # Find the content between the tags
-    start_tag = "<git_diff>"
-    end_tag = "</git_diff>"
-    start_idx = prompt.find(start_tag) + len(start_tag)
-    end_idx = prompt.find(end_tag)
-    content_between_tags = prompt[start_idx:end_idx]
-    assert diff_content in content_between_tags
+    match = GIT_DIFF_TAGS.search(prompt)
+    assert match is not None
+    assert diff_content in match.group(1)
+
+
+def test_generation_prompts_share_static_prefix():
+    """Test per-call data comes after the instructions, keeping the prefix stable."""
+    first = get_commit_prompt("diff one", file_count=1, lines_added=1, lines_removed=0)
+    second = get_commit_prompt("diff two", file_count=3, lines_added=9, lines_removed=4)
+    prefix_length = first.index("(1 file")
+    assert first[:prefix_length] == second[:prefix_length]
+    assert "Common types:" in first[:prefix_length]
+
+    first_why = get_why_context_prompt("feat: add auth", "Security audit")
+    second_why = get_why_context_prompt("fix: crash", "Customer report")
+    prefix_length = first_why.index("feat: add auth")
+    assert first_why[:prefix_length] == second_why[:prefix_length]
+    assert "</INSTRUCTIONS>" in first_why[:prefix_length]
@@ -164,7 +164,7 @@ def test_evaluate_command_with_short_flags(
 
     # Verify correct parameters were used
     mock_evaluation_service_class.assert_called_once_with(
-        model_name="anthropic/claude-sonnet-4"
+        model_name="anthropic/claude-sonnet-4", use_cache=True
     )
     mock_service.evaluate_staged_changes.assert_called_once_with(
         "feat: add new feature", "/custom/path"
@@ -181,6 +181,24 @@ def test_evaluate_command_missing_message_and_commit(runner):
     assert "Error: Commit message or commit hash is required" in result.stdout
 
 
+@patch("diffmage.cli.evaluate.EvaluationService")
+def test_evaluate_command_no_cache(
+    mock_evaluation_service_class, runner, mock_evaluation_result
+):
+    """Test evaluate command disables the evaluation cache with --no-cache."""
+    mock_service = Mock()
+    mock_service.evaluate_staged_changes.return_value = (
+        mock_evaluation_result,
+        "feat: add new feature",
+    )
+    mock_evaluation_service_class.return_value = mock_service
+
+    result = runner.invoke(app, ["evaluate", "feat: add new feature", "--no-cache"])
+
+    assert result.exit_code == 0
+    assert mock_evaluation_service_class.call_args[1]["use_cache"] is False
+
+
 @patch("diffmage.cli.evaluate.EvaluationService")
 def test_evaluate_command_service_error(
     mock_evaluation_service_class, runner, mock_evaluation_result
@@ -11,6 +11,8 @@ from diffmage.core.models import (
     DiffHunk,
 )
 from diffmage.generation.models import GenerationResult
+from diffmage.cli.generate import _models_table
+from diffmage.ai.models import SupportedModels
 
 
 @pytest.fixture
@@ -25,33 +27,24 @@ def mock_commit_analysis():
     # Create a mock hunk with some content
     hunk_line1 = HunkLine(
         line_type=" ",
-        is_removed=False,
-        is_added=False,
-        is_context=True,
         content="def example_function():",
         old_line_number=1,
         new_line_number=1,
     )
     hunk_line2 = HunkLine(
         line_type="+",
-        is_removed=False,
-        is_added=True,
-        is_context=False,
         content="    print('Hello, world!')",
         old_line_number=None,
         new_line_number=2,
     )
     hunk_line3 = HunkLine(
         line_type="-",
-        is_removed=True,
-        is_added=False,
-        is_context=False,
         content="    print('Goodbye, world!')",
         old_line_number=2,
         new_line_number=None,
     )
 
-    hunk = DiffHunk(
+    hunk = DiffHunk.from_lines(
         old_start_line=1,
         old_lines_count=2,
         new_start_line=1,
@@ -238,3 +231,9 @@ def test_generate_command_list_models_short_flag(runner):
     # Verify result
     assert result.exit_code == 0
     assert "Available AI Models" in result.stdout
+
+
+def test_models_table_is_built_once():
+    """Test the available models table is cached between calls."""
+    assert _models_table() is _models_table()
+    assert _models_table().row_count == len(SupportedModels)
@@ -1,3 +1,6 @@
+import json
+import pytest
+from pydantic import ValidationError
 from diffmage.core.models import (
     FileDiff,
     ChangeType,
@@ -81,6 +84,69 @@ def test_commit_analysis_to_ai_context():
     assert "timestamp" in context["context"]
 
 
+def test_commit_analysis_to_ai_context_returns_fresh_dict():
+    """Test each AI context is a new dict, so mutating one cannot leak into the next."""
+    file_diff = FileDiff(
+        old_path="test.py",
+        new_path="test.py",
+        change_type=ChangeType.MODIFIED,
+        file_type=FileType.SOURCE_CODE,
+        is_binary=False,
+        lines_added=1,
+        lines_removed=0,
+        hunks=[],
+    )
+    analysis = CommitAnalysis(files=[file_diff], branch_name="main")
+
+    first = analysis.to_ai_context()
+    first["files"][0]["path"] = "mutated.py"
+    first["context"]["timestamp"] = "mutated"
+    second = analysis.to_ai_context()
+
+    assert second is not first
+    assert second["files"][0]["path"] == "test.py"
+    assert second["context"]["timestamp"] != "mutated"
+
+
+def test_commit_analysis_to_ai_bytes():
+    """Test CommitAnalysis serializes its AI context to JSON bytes."""
+    hunk = DiffHunk.from_lines(
+        old_start_line=1,
+        old_lines_count=0,
+        new_start_line=1,
+        new_lines_count=1,
+        section_header="",
+        lines=[
+            HunkLine(
+                line_type="+", content="x = 1", old_line_number=None, new_line_number=1
+            )
+        ],
+    )
+    file_diff = FileDiff(
+        old_path=None,
+        new_path="test.py",
+        change_type=ChangeType.ADDED,
+        file_type=FileType.SOURCE_CODE,
+        is_binary=False,
+        lines_added=1,
+        lines_removed=0,
+        hunks=[hunk],
+    )
+    analysis = CommitAnalysis(
+        files=[file_diff],
+        total_files=1,
+        total_lines_added=1,
+        total_lines_removed=0,
+        branch_name="main",
+    )
+
+    data = json.loads(analysis.to_ai_bytes())
+
+    assert data["summary"]["files_changed"] == 1
+    assert data["files"][0]["diff_content"] == file_diff.get_ai_context()
+    assert data["files"][0]["type"] == "source_code"
+
+
 def test_commit_analysis_get_combined_diff():
     """Test CommitAnalysis get_combined_diff method."""
     # Test with empty files
@@ -117,15 +183,12 @@ def test_commit_analysis_get_combined_diff():
     # Test with non-binary file with hunks
     hunk_line = HunkLine(
         line_type="+",
-        is_removed=False,
-        is_added=True,
-        is_context=False,
         content="def new_function():",
         old_line_number=None,
         new_line_number=1,
     )
 
-    hunk = DiffHunk(
+    hunk = DiffHunk.from_lines(
         old_start_line=1,
         old_lines_count=0,
         new_start_line=1,
@@ -178,15 +241,12 @@ def test_file_diff_get_ai_context():
     # Test with hunks
     hunk_line = HunkLine(
         line_type="+",
-        is_removed=False,
-        is_added=True,
-        is_context=False,
         content="def new_function():",
         old_line_number=None,
         new_line_number=1,
     )
 
-    hunk = DiffHunk(
+    hunk = DiffHunk.from_lines(
         old_start_line=1,
         old_lines_count=0,
         new_start_line=1,
@@ -218,9 +278,6 @@ def test_file_diff_content_properties():
     # Create test hunks with different line types
     added_line = HunkLine(
         line_type="+",
-        is_removed=False,
-        is_added=True,
-        is_context=False,
         content="def new_function():",
         old_line_number=None,
         new_line_number=1,
@@ -228,9 +285,6 @@ def test_file_diff_content_properties():
 
     removed_line = HunkLine(
         line_type="-",
-        is_removed=True,
-        is_added=False,
-        is_context=False,
         content="def old_function():",
         old_line_number=1,
         new_line_number=None,
@@ -238,15 +292,12 @@ def test_file_diff_content_properties():
 
     context_line = HunkLine(
         line_type=" ",
-        is_removed=False,
-        is_added=False,
-        is_context=True,
         content="",
         old_line_number=2,
         new_line_number=2,
     )
 
-    hunk = DiffHunk(
+    hunk = DiffHunk.from_lines(
         old_start_line=1,
         old_lines_count=2,
         new_start_line=1,
@@ -279,7 +330,7 @@ def test_file_diff_content_properties():
 def test_diff_hunk_properties():
     """Test DiffHunk properties and methods."""
     # Test empty hunk
-    empty_hunk = DiffHunk(
+    empty_hunk = DiffHunk.from_lines(
         old_start_line=1,
         old_lines_count=0,
         new_start_line=1,
@@ -295,34 +346,25 @@ def test_diff_hunk_properties():
     lines = [
         HunkLine(
             line_type="+",
-            is_removed=False,
-            is_added=True,
-            is_context=False,
             content="new line",
             old_line_number=None,
             new_line_number=1,
         ),
         HunkLine(
             line_type="-",
-            is_removed=True,
-            is_added=False,
-            is_context=False,
             content="old line",
             old_line_number=1,
             new_line_number=None,
         ),
         HunkLine(
             line_type=" ",
-            is_removed=False,
-            is_added=False,
-            is_context=True,
             content="context",
             old_line_number=2,
             new_line_number=2,
         ),
     ]
 
-    mixed_hunk = DiffHunk(
+    mixed_hunk = DiffHunk.from_lines(
         old_start_line=1,
         old_lines_count=2,
         new_start_line=1,
@@ -340,9 +382,6 @@ def test_hunk_line_creation():
     # Test added line
     added_line = HunkLine(
         line_type="+",
-        is_removed=False,
-        is_added=True,
-        is_context=False,
         content="new content",
         old_line_number=None,
         new_line_number=1,
@@ -358,9 +397,6 @@ def test_hunk_line_creation():
     # Test removed line
     removed_line = HunkLine(
         line_type="-",
-        is_removed=True,
-        is_added=False,
-        is_context=False,
         content="old content",
         old_line_number=1,
         new_line_number=None,
@@ -376,9 +412,6 @@ def test_hunk_line_creation():
     # Test context line
     context_line = HunkLine(
         line_type=" ",
-        is_removed=False,
-        is_added=False,
-        is_context=True,
         content="context content",
         old_line_number=2,
         new_line_number=2,
@@ -390,3 +423,159 @@ def test_hunk_line_creation():
     assert context_line.content == "context content"
     assert context_line.old_line_number == 2
     assert context_line.new_line_number == 2
+
+
+def test_diff_hunk_from_lines_round_trip():
+    """Test DiffHunk stores lines column-wise and rebuilds HunkLine rows."""
+    lines = [
+        HunkLine(line_type=" ", content="a", old_line_number=1, new_line_number=1),
+        HunkLine(line_type="-", content="b", old_line_number=2, new_line_number=None),
+        HunkLine(line_type="+", content="c", old_line_number=None, new_line_number=2),
+    ]
+
+    hunk = DiffHunk.from_lines(
+        old_start_line=1,
+        old_lines_count=2,
+        new_start_line=1,
+        new_lines_count=2,
+        section_header="",
+        lines=lines,
+    )
+
+    assert hunk.line_types == " -+"
+    assert hunk.contents == ["a", "b", "c"]
+    assert hunk.old_line_numbers == [1, 2, None]
+    assert hunk.new_line_numbers == [1, None, 2]
+    assert hunk.lines == lines
+
+
+def test_commit_analysis_combined_diff_is_cached():
+    """Test diff text is built once and models are immutable."""
+    hunk = DiffHunk.from_lines(
+        old_start_line=1,
+        old_lines_count=0,
+        new_start_line=1,
+        new_lines_count=1,
+        section_header="",
+        lines=[
+            HunkLine(
+                line_type="+", content="x = 1", old_line_number=None, new_line_number=1
+            )
+        ],
+    )
+    file_diff = FileDiff(
+        old_path=None,
+        new_path="test.py",
+        change_type=ChangeType.ADDED,
+        file_type=FileType.SOURCE_CODE,
+        is_binary=False,
+        lines_added=1,
+        lines_removed=0,
+        hunks=[hunk],
+    )
+    analysis = CommitAnalysis(
+        files=[file_diff],
+        total_files=1,
+        total_lines_added=1,
+        total_lines_removed=0,
+        branch_name="main",
+    )
+
+    assert analysis.get_combined_diff() is analysis.get_combined_diff()
+    assert file_diff.get_ai_context() is file_diff.get_ai_context()
+
+    with pytest.raises(ValidationError):
+        analysis.branch_name = "other"
+
+
+def test_commit_analysis_combined_diff_separates_files():
+    """Test combined diff joins text files with a blank line and skips binaries."""
+
+    def make_file(path: str, is_binary: bool = False) -> FileDiff:
+        hunk = DiffHunk.from_lines(
+            old_start_line=1,
+            old_lines_count=0,
+            new_start_line=1,
+            new_lines_count=1,
+            section_header="",
+            lines=[
+                HunkLine(
+                    line_type="+", content=path, old_line_number=None, new_line_number=1
+                )
+            ],
+        )
+        return FileDiff(
+            old_path=None,
+            new_path=path,
+            change_type=ChangeType.ADDED,
+            file_type=FileType.SOURCE_CODE,
+            is_binary=is_binary,
+            lines_added=1,
+            lines_removed=0,
+            hunks=[hunk],
+        )
+
+    files = [make_file("a.py"), make_file("b.bin", is_binary=True), make_file("c.py")]
+    analysis = CommitAnalysis(
+        files=files,
+        total_files=3,
+        total_lines_added=3,
+        total_lines_removed=0,
+        branch_name="main",
+    )
+
+    assert analysis.get_combined_diff() == "\n\n".join(
+        [files[0].get_ai_context(), files[2].get_ai_context()]
+    )
+    assert list(analysis.iter_combined_diff()) == analysis.get_combined_diff().split(
+        "\n"
+    )
+
+
+def test_commit_analysis_aggregates_totals_from_files():
+    """Test totals default to values aggregated from the file diffs."""
+    files = [
+        FileDiff(
+            old_path=None,
+            new_path=f"file_{i}.py",
+            change_type=ChangeType.ADDED,
+            file_type=FileType.SOURCE_CODE,
+            is_binary=False,
+            lines_added=i + 1,
+            lines_removed=i,
+            hunks=[],
+        )
+        for i in range(3)
+    ]
+
+    analysis = CommitAnalysis(files=files, branch_name="main")
+
+    assert analysis.total_files == 3
+    assert analysis.total_lines_added == 6
+    assert analysis.total_lines_removed == 3
+
+    explicit = CommitAnalysis(files=files, total_files=10, branch_name="main")
+    assert explicit.total_files == 10
+    assert explicit.total_lines_added == 6
+
+
+def test_commit_analysis_combined_diff_stubs_truncated_files():
+    """Test files with omitted hunks still appear in the diff with their size"""
+    lockfile = FileDiff(
+        old_path="a/uv.lock",
+        new_path="b/uv.lock",
+        change_type=ChangeType.MODIFIED,
+        file_type=FileType.UNKNOWN,
+        is_binary=False,
+        lines_added=120,
+        lines_removed=80,
+        hunks=[],
+        is_truncated=True,
+    )
+    analysis = CommitAnalysis(files=[lockfile], branch_name="main")
+
+    assert analysis.get_combined_diff() == (
+        "--- a/uv.lock\n"
+        "+++ b/uv.lock\n"
+        "... diff omitted (120 lines added, 80 lines removed)"
+    )
@@ -1,3 +1,5 @@
+import asyncio
+import statistics
 import pytest
 import time
 from rich.progress import Progress
@@ -64,7 +66,7 @@ class TestEvaluationBenchmarks:
         mock_result.confidence = 0.8
 
         with patch.object(
-            benchmarks.evaluator, "evaluate_commit_message", return_value=mock_result
+            benchmarks.evaluator, "aevaluate_commit_message", return_value=mock_result
         ) as mock_evaluate:
             result = benchmarks.stability_test(message=message, diff=diff, runs=runs)
 
@@ -84,7 +86,7 @@ class TestEvaluationBenchmarks:
         mock_result.confidence = 0.8
 
         with patch.object(
-            benchmarks.evaluator, "evaluate_commit_message", return_value=mock_result
+            benchmarks.evaluator, "aevaluate_commit_message", return_value=mock_result
         ):
             result = benchmarks.stability_test(message=message, diff=diff, runs=2)
 
@@ -95,7 +97,7 @@ class TestEvaluationBenchmarks:
             assert "overall" in stats
             assert "execution_time" in stats
 
-    @patch("time.time")
+    @patch("time.perf_counter")
     @patch.object(Progress, "__enter__")
     @patch.object(Progress, "__exit__")
     def test_stability_test_calculates_execution_time_correctly(
@@ -119,7 +121,7 @@ class TestEvaluationBenchmarks:
 
         with patch.object(
             benchmarks.evaluator,
-            "evaluate_commit_message",
+            "aevaluate_commit_message",
             side_effect=[mock_result1, mock_result2],
         ):
             result = benchmarks.stability_test("test message", "test diff", runs=2)
@@ -145,7 +147,7 @@ class TestEvaluationBenchmarks:
 
         with patch.object(
             benchmarks.evaluator,
-            "evaluate_commit_message",
+            "aevaluate_commit_message",
             side_effect=[mock_result1, mock_result2],
         ):
             result = benchmarks.stability_test(
@@ -169,7 +171,7 @@ class TestEvaluationBenchmarks:
 
         with patch.object(
             benchmarks.evaluator,
-            "evaluate_commit_message",
+            "aevaluate_commit_message",
             side_effect=[mock_result1, mock_result2],
         ):
             result = benchmarks.stability_test(
@@ -183,7 +185,7 @@ class TestEvaluationBenchmarks:
         """Test stability test returns variance threshold as is"""
         with patch.object(
             benchmarks.evaluator,
-            "evaluate_commit_message",
+            "aevaluate_commit_message",
             side_effect=[
                 Mock(what_score=4.0, why_score=3.0, overall_score=3.5, confidence=0.8),
                 Mock(what_score=4.0, why_score=3.0, overall_score=3.5, confidence=0.8),
@@ -203,7 +205,7 @@ class TestEvaluationBenchmarks:
         with (
             patch.object(
                 benchmarks.evaluator,
-                "evaluate_commit_message",
+                "aevaluate_commit_message",
                 return_value=mock_result,
             ),
             patch("diffmage.evaluation.benchmarks.Progress"),
@@ -238,7 +240,7 @@ class TestEvaluationBenchmarks:
         with (
             patch.object(
                 benchmarks.evaluator,
-                "evaluate_commit_message",
+                "aevaluate_commit_message",
                 return_value=mock_result,
             ),
             patch("diffmage.evaluation.benchmarks.Progress"),
@@ -264,7 +266,7 @@ class TestEvaluationBenchmarks:
         with (
             patch.object(
                 benchmarks.evaluator,
-                "evaluate_commit_message",
+                "aevaluate_commit_message",
                 return_value=mock_result,
             ),
             patch("diffmage.evaluation.benchmarks.Progress"),
@@ -407,6 +409,17 @@ class TestEvaluationBenchmarks:
         assert result["max"] == 5.0
         assert result["range"] == 4.0
 
+    def test_calculate_score_variance_unsorted_even_count(self, benchmarks):
+        """Test calculate_score_variance matches statistics for unsorted even input"""
+        scores = [4.5, 1.0, 3.5, 2.0]
+        result = benchmarks._calculate_score_variance(scores)
+        assert result["mean"] == pytest.approx(statistics.mean(scores))
+        assert result["median"] == pytest.approx(statistics.median(scores))
+        assert result["std"] == pytest.approx(statistics.stdev(scores))
+        assert result["min"] == 1.0
+        assert result["max"] == 4.5
+        assert result["range"] == 3.5
+
     def test_stability_test_single_run_handles_stdev_gracefully(self, benchmarks):
         """Test single run doesn't crash when calculating standard deviation"""
         mock_result = Mock(
@@ -414,7 +427,7 @@ class TestEvaluationBenchmarks:
         )
 
         with patch.object(
-            benchmarks.evaluator, "evaluate_commit_message", return_value=mock_result
+            benchmarks.evaluator, "aevaluate_commit_message", return_value=mock_result
         ):
             result = benchmarks.stability_test("test", "diff", runs=1)
 
@@ -436,7 +449,7 @@ class TestEvaluationBenchmarks:
 
         with patch.object(
             benchmarks.evaluator,
-            "evaluate_commit_message",
+            "aevaluate_commit_message",
             side_effect=[mock_result1, mock_result2],
         ):
             result = benchmarks.stability_test(
@@ -454,7 +467,7 @@ class TestEvaluationBenchmarks:
 
         with patch.object(
             benchmarks.evaluator,
-            "evaluate_commit_message",
+            "aevaluate_commit_message",
             side_effect=[mock_result3, mock_result4],
         ):
             result = benchmarks.stability_test(
@@ -470,7 +483,7 @@ class TestEvaluationBenchmarks:
         )
 
         with patch.object(
-            benchmarks.evaluator, "evaluate_commit_message", return_value=mock_result
+            benchmarks.evaluator, "aevaluate_commit_message", return_value=mock_result
         ):
             result = benchmarks.stability_test(
                 "test", "diff", runs=2, variance_threshold=-0.1
@@ -482,7 +495,7 @@ class TestEvaluationBenchmarks:
         """Test evaluator exceptions are handled appropriately"""
         with patch.object(
             benchmarks.evaluator,
-            "evaluate_commit_message",
+            "aevaluate_commit_message",
             side_effect=RuntimeError("LLM API error"),
         ):
             with pytest.raises(RuntimeError, match="LLM API error"):
@@ -498,7 +511,7 @@ class TestEvaluationBenchmarks:
 
         with patch.object(
             benchmarks.evaluator,
-            "evaluate_commit_message",
+            "aevaluate_commit_message",
             side_effect=[mock_result, RuntimeError("Network timeout")],
         ):
             with pytest.raises(RuntimeError, match="Network timeout"):
@@ -523,7 +536,7 @@ class TestEvaluationBenchmarks:
         )
 
         with patch.object(
-            benchmarks.evaluator, "evaluate_commit_message", return_value=mock_result
+            benchmarks.evaluator, "aevaluate_commit_message", return_value=mock_result
         ):
             start_time = time.time()
             result = benchmarks.stability_test("test", "diff", runs=100)
@@ -533,6 +546,34 @@ class TestEvaluationBenchmarks:
             assert result["runs"] == 100
             assert execution_time < 5.0
 
+    def test_stability_test_runs_concurrently_in_run_order(self, benchmarks):
+        """Test runs overlap up to max_concurrency and results keep run order"""
+        in_flight = 0
+        max_in_flight = 0
+        scores = iter([1.0, 2.0, 3.0, 4.0])
+
+        async def fake_aevaluate(message, diff):
+            nonlocal in_flight, max_in_flight
+            score = next(scores)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01 * (5 - score))
+            in_flight -= 1
+            return Mock(
+                what_score=score, why_score=score, overall_score=score, confidence=1.0
+            )
+
+        with patch.object(
+            benchmarks.evaluator, "aevaluate_commit_message", side_effect=fake_aevaluate
+        ):
+            result = benchmarks.stability_test(
+                "test", "diff", runs=4, max_concurrency=2
+            )
+
+        assert max_in_flight == 2
+        assert [r["what_score"] for r in result["results"]] == [1.0, 2.0, 3.0, 4.0]
+        assert [r["run"] for r in result["results"]] == [1, 2, 3, 4]
+
     def test_stability_test_extreme_score_values_at_boundaries(self, benchmarks):
         """Test stability test with extreme score values at boundaries"""
         mock_result1 = Mock(
@@ -544,7 +585,7 @@ class TestEvaluationBenchmarks:
 
         with patch.object(
             benchmarks.evaluator,
-            "evaluate_commit_message",
+            "aevaluate_commit_message",
             side_effect=[mock_result1, mock_result2],
         ):
             result = benchmarks.stability_test("test", "diff", runs=2)
@@ -561,7 +602,7 @@ class TestEvaluationBenchmarks:
         )
 
         with patch.object(
-            benchmarks.evaluator, "evaluate_commit_message", return_value=mock_result
+            benchmarks.evaluator, "aevaluate_commit_message", return_value=mock_result
         ):
             result = benchmarks.stability_test("test", "diff", runs=2)
 
@@ -581,7 +622,7 @@ class TestEvaluationBenchmarks:
 
         with patch.object(
             benchmarks.evaluator,
-            "evaluate_commit_message",
+            "aevaluate_commit_message",
             side_effect=[mock_result1, mock_result2],
         ):
             result = benchmarks.stability_test(
@@ -601,7 +642,7 @@ class TestEvaluationBenchmarks:
         )
 
         with patch.object(
-            benchmarks.evaluator, "evaluate_commit_message", return_value=mock_result
+            benchmarks.evaluator, "aevaluate_commit_message", return_value=mock_result
         ):
             result = benchmarks.stability_test(long_message, long_diff, runs=2)
 
@@ -622,7 +663,7 @@ class TestEvaluationBenchmarks:
         )
 
         with patch.object(
-            benchmarks.evaluator, "evaluate_commit_message", return_value=mock_result
+            benchmarks.evaluator, "aevaluate_commit_message", return_value=mock_result
         ):
             result = benchmarks.stability_test(unicode_message, special_diff, runs=2)
 
@@ -639,7 +680,7 @@ class TestEvaluationBenchmarks:
         )
 
         with patch.object(
-            benchmarks.evaluator, "evaluate_commit_message", return_value=mock_result
+            benchmarks.evaluator, "aevaluate_commit_message", return_value=mock_result
         ):
             result = benchmarks.stability_test(control_message, control_diff, runs=2)
 
@@ -0,0 +1,70 @@
+"""
+Tests for the persistent evaluation cache.
+"""
+
+import pytest
+from unittest.mock import patch
+from diffmage.evaluation.cache import EvaluationCache
+from diffmage.evaluation.service import EvaluationService
+from diffmage.evaluation.commit_message_evaluator import CommitMessageEvaluator
+from diffmage.evaluation.models import EvaluationResult
+
+
+class TestEvaluationCache:
+    """Test cases for EvaluationCache class."""
+
+    def test_make_key_depends_on_model_message_and_diff(self):
+        """Test cache keys differ when any part of the input differs."""
+        key = EvaluationCache.make_key("model", "message", "diff")
+
+        assert key == EvaluationCache.make_key("model", "message", "diff")
+        assert key != EvaluationCache.make_key("other", "message", "diff")
+        assert key != EvaluationCache.make_key("model", "other", "diff")
+        assert key != EvaluationCache.make_key("model", "message", "other")
+
+    def test_set_and_get_round_trip(self, tmp_path):
+        """Test a stored result is returned from a fresh cache instance."""
+        result = EvaluationResult(
+            what_score=4,
+            why_score=3,
+            reasoning="Describes the change well",
+            confidence=0.8,
+            model_used="openai/gpt-4o-mini",
+        )
+        path = tmp_path / "cache.sqlite3"
+
+        EvaluationCache(path).set("key", result)
+
+        assert EvaluationCache(path).get("key") == result
+        assert EvaluationCache(path).get("missing") is None
+
+    def test_evaluator_uses_cache_on_repeat_evaluation(self, tmp_path):
+        """Test the evaluator only calls the LLM once for identical inputs."""
+        evaluator = CommitMessageEvaluator(
+            model_name="openai/gpt-4o-mini",
+            cache=EvaluationCache(tmp_path / "cache.sqlite3"),
+        )
+        mock_response = """{
+            "what_score": 4,
+            "why_score": 4,
+            "reasoning": "Clear and accurate commit message",
+            "confidence": 0.9
+        }"""
+
+        with patch.object(
+            evaluator.ai_client, "evaluate_with_llm", return_value=mock_response
+        ) as mock_llm:
+            first = evaluator.evaluate_commit_message("feat: add login", "+login()")
+            second = evaluator.evaluate_commit_message("feat: add login", "+login()")
+
+        mock_llm.assert_called_once()
+        assert first == second
+
+    @pytest.mark.parametrize("value,enabled", [("0", False), ("1", True)])
+    def test_env_var_switches_cache_off(self, monkeypatch, value, enabled):
+        """Test DIFFMAGE_EVAL_CACHE=0 disables the cache even when requested."""
+        monkeypatch.setenv("DIFFMAGE_EVAL_CACHE", value)
+
+        service = EvaluationService(use_cache=True)
+
+        assert (service.evaluator.cache is not None) is enabled
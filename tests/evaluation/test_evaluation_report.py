@@ -1,9 +1,12 @@
+import csv
+import json
+import asyncio
 import pytest
 from rich.console import Console
 from diffmage.evaluation.service import EvaluationService
-from diffmage.evaluation.evaluation_report import EvaluationReport
+from diffmage.evaluation.evaluation_report import EvaluationReport, _describe
 from diffmage.evaluation.models import EvaluationResult
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 
 @pytest.fixture
@@ -63,6 +66,21 @@ class TestEvaluationReport:
         assert report.service == service
         assert isinstance(report.console, Console)
 
+    def test_evaluation_report_uses_given_console(self, service):
+        """Test a caller's console is shared instead of creating a new one"""
+        console = Console()
+
+        assert EvaluationReport(service, console).console is console
+
+    def test_quality_distribution_table_without_evaluations(self, report):
+        """Test the distribution table renders zero percentages for no results"""
+        table = report._build_quality_distribution_table(
+            {"total_evaluations": 0, "quality_distribution": {}}
+        )
+
+        assert table.row_count == 5
+        assert list(table.columns[2].cells) == ["0.0%"] * 5
+
     def test_generate_report_empty_results_raises_error(self, report):
         """Test that empty results raise ValueError"""
         with pytest.raises(ValueError, match="No evaluation results to report"):
@@ -93,8 +111,11 @@ class TestEvaluationReport:
             ),
         ]
 
-        result = report.generate_quality_report(unicode_results)
-        assert "Report generated successfully for 2 evaluations" in result
+        report.console = Console(record=True, width=200)
+        report.generate_quality_report(unicode_results)
+        output = report.console.export_text()
+        assert "添加用户认证功能" in output
+        assert "ñoño café" in output
 
     @pytest.mark.parametrize(
         "what_score,why_score,expected_overall",
@@ -454,6 +475,16 @@ class TestEvaluationReport:
         assert stats["confidence"]["mean"] == 0.85
         assert stats["model_usage"]["gpt-4o"] == 1
 
+    @pytest.mark.parametrize("digits", [None, 2])
+    def test_describe_single_value_matches_general_path(self, digits):
+        """Test the single value fast path agrees with the sorted computation"""
+        value = 3.456789
+
+        single = _describe([value], digits=digits)
+        general = _describe([value, value], digits=digits)
+
+        assert single == general
+
     def test_identical_scores_statistics(self, report):
         """Test when all scores are identical"""
         mock_results = [
@@ -681,6 +712,27 @@ class TestEvaluationReport:
         assert top_performers[0][0].overall_score == 5.0
         assert bottom_performers[0][0].overall_score == 1.0  # worst first
 
+    def test_get_top_and_bottom_performers_ties_match_report(self, report):
+        """Test tied scores keep input order, as in the report's own listing"""
+        scores = [3, 5, 3, 1, 3, 1, 5]
+        results = [
+            (self._create_mock_result(what_score=score, why_score=score)[0], f"c{i}")
+            for i, score in enumerate(scores)
+        ]
+
+        top_performers, bottom_performers = report.get_top_and_bottom_performers(
+            results, count=3
+        )
+
+        assert [message for _, message in top_performers] == ["c1", "c6", "c0"]
+        assert [message for _, message in bottom_performers] == ["c3", "c5", "c4"]
+
+        text = report._build_top_and_bottom_performers(
+            sorted(results, key=lambda item: item[0].overall_score, reverse=True)
+        ).plain
+        listed = [message for message in text.split() if message.startswith("c")]
+        assert listed == ["c1", "c6", "c0", "c3", "c5", "c4"]
+
     def test_get_top_and_bottom_performers_single_result(self, report):
         """Test edge case with single result"""
         single_result = [
@@ -714,6 +766,222 @@ class TestEvaluationReport:
             len(bottom_performers) == 0
         )  # No bottom performers due to overlap exclusion
 
+    def test_generate_quality_report_prints_once(self, report):
+        """Test the whole report is rendered with a single console print"""
+        results = [
+            self._create_mock_result(what_score=5, why_score=5),
+            self._create_mock_result(what_score=1, why_score=2),
+        ]
+
+        with patch.object(report.console, "print") as mock_print:
+            report.generate_quality_report(results)
+
+        mock_print.assert_called_once()
+
+    def test_top_and_bottom_performers_keep_brackets_in_messages(self, report):
+        """Test bracketed text in messages is shown rather than read as markup"""
+        results = [
+            (self._create_mock_result(what_score=5)[0], "fix[parser]: handle tabs"),
+            (self._create_mock_result(what_score=1)[0], "wip [skip ci]"),
+        ]
+
+        text = report._build_top_and_bottom_performers(results)
+
+        assert "fix[parser]: handle tabs" in text.plain
+        assert "wip [skip ci]" in text.plain
+
+    def test_batch_evaluate_commits_runs_concurrently(self, report):
+        """Test commits are evaluated concurrently and keep commit order"""
+        commits = [Mock(hexsha=f"{i:040x}") for i in range(4)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_aevaluate_commits(commit_hashes, repo_path):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if commits[2].hexsha in commit_hashes:
+                raise ValueError("boom")
+            return [(self._create_mock_result()[0], h) for h in commit_hashes]
+
+        with (
+            patch("diffmage.evaluation.evaluation_report.git.Repo") as mock_repo,
+            patch(
+                "diffmage.evaluation.evaluation_report.EvaluationService"
+            ) as mock_service_cls,
+            patch.object(report, "generate_quality_report"),
+        ):
+            mock_repo.return_value.iter_commits.return_value = commits
+            mock_service_cls.return_value.aevaluate_commits = fake_aevaluate_commits
+
+            report_data = report.batch_evaluate_commits(
+                "HEAD~3", "HEAD", model_name="openai/gpt-4o-mini", max_concurrency=2
+            )
+
+        assert max_in_flight == 2
+        assert report_data["total_commits"] == 4
+        assert report_data["successful_evaluations"] == 3
+        assert [message for _, message in report_data["results"]] == [
+            commits[0].hexsha,
+            commits[1].hexsha,
+            commits[3].hexsha,
+        ]
+
+    def test_batch_evaluate_commits_groups_commits_into_batches(self, report):
+        """Test commits are packed into batch_size groups per request"""
+        commits = [Mock(hexsha=f"{i:040x}") for i in range(5)]
+        batches = []
+
+        async def fake_aevaluate_commits(commit_hashes, repo_path):
+            batches.append(commit_hashes)
+            return [(self._create_mock_result()[0], h) for h in commit_hashes]
+
+        with (
+            patch("diffmage.evaluation.evaluation_report.git.Repo") as mock_repo,
+            patch(
+                "diffmage.evaluation.evaluation_report.EvaluationService"
+            ) as mock_service_cls,
+            patch.object(report, "generate_quality_report"),
+        ):
+            mock_repo.return_value.iter_commits.return_value = commits
+            mock_service_cls.return_value.aevaluate_commits = fake_aevaluate_commits
+
+            report_data = report.batch_evaluate_commits(
+                "HEAD~4", "HEAD", model_name="openai/gpt-4o-mini", batch_size=2
+            )
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert report_data["successful_evaluations"] == 5
+
+    def test_batch_evaluate_commits_retries_failed_batch_per_commit(self, report):
+        """Test a failed batch is retried commit by commit, skipping only failures"""
+        commits = [Mock(hexsha=str(i) * 40) for i in range(3)]
+
+        async def fake_aevaluate_commits(commit_hashes, repo_path):
+            raise ValueError("batch failed")
+
+        async def fake_aevaluate_commit(commit_hash, repo_path):
+            if commit_hash == commits[1].hexsha:
+                raise ValueError("boom")
+            return self._create_mock_result()[0], commit_hash
+
+        with (
+            patch("diffmage.evaluation.evaluation_report.git.Repo") as mock_repo,
+            patch(
+                "diffmage.evaluation.evaluation_report.EvaluationService"
+            ) as mock_service_cls,
+            patch.object(report, "generate_quality_report"),
+            patch.object(report.console, "print") as mock_print,
+        ):
+            mock_repo.return_value.iter_commits.return_value = commits
+            mock_service_cls.return_value.aevaluate_commits = fake_aevaluate_commits
+            mock_service_cls.return_value.aevaluate_commit = fake_aevaluate_commit
+
+            report_data = report.batch_evaluate_commits(
+                "HEAD~2", "HEAD", model_name="openai/gpt-4o-mini", batch_size=3
+            )
+
+        assert [message for _, message in report_data["results"]] == [
+            commits[0].hexsha,
+            commits[2].hexsha,
+        ]
+        warnings = [str(call.args[0]) for call in mock_print.call_args_list]
+        assert any(commits[1].hexsha[:8] in warning for warning in warnings)
+        assert not any(commits[0].hexsha[:8] in warning for warning in warnings)
+
+    def test_batch_evaluate_commits_reuses_report_service(self, report):
+        """Test the report's own service is used when no other model is requested"""
+        commits = [Mock(hexsha=f"{i:040x}") for i in range(2)]
+
+        async def fake_aevaluate_commits(commit_hashes, repo_path):
+            return [(self._create_mock_result()[0], h) for h in commit_hashes]
+
+        with (
+            patch("diffmage.evaluation.evaluation_report.git.Repo") as mock_repo,
+            patch(
+                "diffmage.evaluation.evaluation_report.EvaluationService"
+            ) as mock_service_cls,
+            patch.object(report.service, "aevaluate_commits", fake_aevaluate_commits),
+            patch.object(report, "generate_quality_report"),
+        ):
+            mock_repo.return_value.iter_commits.return_value = commits
+
+            report_data = report.batch_evaluate_commits("HEAD~1", "HEAD")
+
+        mock_service_cls.assert_not_called()
+        assert report_data["successful_evaluations"] == 2
+
+    def test_report_statistics_reused_for_json_export(
+        self, report, sample_results, tmp_path
+    ):
+        """Test statistics are computed once when reporting and exporting the same results"""
+        calculate = report._calculate_report_statistics
+
+        with (
+            patch.object(report.console, "print"),
+            patch.object(
+                report, "_calculate_report_statistics", side_effect=calculate
+            ) as mock_calc,
+        ):
+            report.generate_quality_report(sample_results)
+            report.export_json_report(sample_results, str(tmp_path / "report.json"))
+            assert mock_calc.call_count == 1
+
+            # A changed list is recomputed
+            sample_results.append(sample_results[0])
+            report.export_json_report(sample_results, str(tmp_path / "report.json"))
+            assert mock_calc.call_count == 2
+
+            # Including one changed in place without changing its length
+            sample_results[0] = self._create_mock_result(what_score=1, why_score=1)
+            report.export_json_report(sample_results, str(tmp_path / "report.json"))
+            assert mock_calc.call_count == 3
+
+            # An equal copy of the same results is reused
+            report.export_json_report(
+                list(sample_results), str(tmp_path / "report.json")
+            )
+            assert mock_calc.call_count == 3
+
+    def test_export_csv_report_writes_one_row_per_result(self, report, tmp_path):
+        """Test CSV export writes every result stamped with a single export time"""
+        results = [
+            self._create_mock_result(what_score=5, why_score=4),
+            self._create_mock_result(what_score=2, why_score=3),
+        ]
+        filepath = tmp_path / "report.csv"
+
+        report.export_csv_report(results, str(filepath))
+
+        with open(filepath, newline="", encoding="utf-8") as csvfile:
+            rows = list(csv.DictReader(csvfile))
+
+        assert [row["what_score"] for row in rows] == ["5.0", "2.0"]
+        assert rows[0]["commit_message"] == results[0][1]
+        assert rows[0]["timestamp"] == rows[1]["timestamp"]
+
+    def test_export_json_report_writes_statistics_and_evaluations(
+        self, report, tmp_path
+    ):
+        """Test JSON export includes metadata, statistics and every evaluation"""
+        results = [
+            self._create_mock_result(what_score=5, why_score=4),
+            (self._create_mock_result()[0], "feat: ajouter l'été ✨"),
+        ]
+        filepath = tmp_path / "report.json"
+
+        report.export_json_report(results, str(filepath))
+
+        raw = filepath.read_text(encoding="utf-8")
+        data = json.loads(raw)
+        assert "feat: ajouter l'été ✨" in raw
+        assert data["metadata"]["total_evaluations"] == 2
+        assert data["statistics"]["what_scores"]["max"] == 5.0
+        assert data["evaluations"][0]["evaluation"]["scores"]["what"] == 5.0
+        assert data["evaluations"][1]["commit_message"] == "feat: ajouter l'été ✨"
+
     #### Private methods ####
 
     def _create_mock_result(
@@ -2,8 +2,13 @@
 Tests for the LLM-based commit message evaluator.
 """
 
+import asyncio
+import re
+
+import orjson
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
+from diffmage.ai.client import AIClient
 from diffmage.evaluation.commit_message_evaluator import CommitMessageEvaluator
 from diffmage.evaluation.models import EvaluationResult
 
@@ -24,6 +29,15 @@ class TestLLMEvaluator:
 
         assert evaluator.ai_client.temperature == 0.0
 
+    def test_init_with_shared_client(self):
+        """Test LLMEvaluator reuses an AIClient passed in by the caller."""
+        client = AIClient(model_name="openai/gpt-4o-mini")
+        evaluator = CommitMessageEvaluator(
+            model_name="openai/gpt-4o-mini", ai_client=client
+        )
+
+        assert evaluator.ai_client is client
+
     def test_evaluate_commit_message_success(self):
         """Test successful commit message evaluation."""
         evaluator = CommitMessageEvaluator(model_name="openai/gpt-4o-mini")
@@ -55,6 +69,69 @@ class TestLLMEvaluator:
             assert result.confidence == 0.9
             assert result.model_used == "openai/gpt-4o-mini"
 
+    @pytest.mark.asyncio
+    async def test_aevaluate_commit_message_success(self):
+        """Test successful async commit message evaluation."""
+        evaluator = CommitMessageEvaluator(model_name="openai/gpt-4o-mini")
+
+        mock_response = """{
+            "what_score": 4,
+            "why_score": 3,
+            "reasoning": "The commit message describes the changes accurately.",
+            "confidence": 0.8
+        }"""
+
+        with patch.object(
+            evaluator.ai_client,
+            "aevaluate_with_llm",
+            new_callable=AsyncMock,
+            return_value=mock_response,
+        ):
+            result = await evaluator.aevaluate_commit_message(
+                "feat: add user authentication",
+                "--- a/auth.py\n+++ b/auth.py\n@@ -1 +1 @@\n+def login(): pass",
+            )
+
+            assert result.what_score == 4
+            assert result.why_score == 3
+            assert result.model_used == "openai/gpt-4o-mini"
+
+    @pytest.mark.asyncio
+    async def test_aevaluate_commit_message_empty_message(self):
+        """Test async evaluation with empty commit message skips the LLM."""
+        evaluator = CommitMessageEvaluator()
+
+        with patch.object(
+            evaluator.ai_client, "aevaluate_with_llm", new_callable=AsyncMock
+        ) as mock_llm:
+            result = await evaluator.aevaluate_commit_message("", "some diff")
+
+            assert result.overall_score == 1.0
+            mock_llm.assert_not_awaited()
+
+    def test_evaluate_commit_message_stream_stops_at_object_end(self):
+        """Test streamed evaluation is parsed once the JSON object closes."""
+        evaluator = CommitMessageEvaluator(model_name="openai/gpt-4o-mini")
+        chunks = [
+            '{"what_score": 4, "why_score": 3, ',
+            '"reasoning": "Clear {scoped} summary", "confidence": 0.8}',
+            "trailing text",
+        ]
+        received: list[str] = []
+
+        with patch.object(
+            evaluator.ai_client,
+            "evaluate_with_llm_stream",
+            return_value=iter(chunks),
+        ):
+            result = evaluator.evaluate_commit_message_stream(
+                "fix: handle empty config", "diff --git a/x b/x", received.append
+            )
+
+        assert result.what_score == 4
+        assert result.reasoning == "Clear {scoped} summary"
+        assert received == chunks[:2]
+
     def test_evaluate_commit_message_empty_message(self):
         """Test evaluation with empty commit message."""
         evaluator = CommitMessageEvaluator()
@@ -97,6 +174,114 @@ class TestLLMEvaluator:
             with pytest.raises(ValueError, match="Failed to parse evaluation response"):
                 evaluator.evaluate_commit_message("test message", "test diff")
 
+    def test_evaluate_batch_packs_commits_into_one_request(self):
+        """Test batched evaluation sends one request per batch and keeps order."""
+        evaluator = CommitMessageEvaluator(model_name="openai/gpt-4o-mini")
+
+        mock_response = """{"evaluations": [
+            {"id": 1, "what_score": 2, "why_score": 2, "reasoning": "Vague message here", "confidence": 0.7},
+            {"id": 0, "what_score": 5, "why_score": 4, "reasoning": "Precise message here", "confidence": 0.9}
+        ]}"""
+
+        with patch.object(
+            evaluator.ai_client, "evaluate_with_llm", return_value=mock_response
+        ) as mock_llm:
+            results = evaluator.evaluate_batch(
+                [
+                    ("feat: add login", "+def login(): pass"),
+                    ("", "+x = 1"),
+                    ("fix stuff", "-y = 2"),
+                ]
+            )
+
+        mock_llm.assert_called_once()
+        assert [r.what_score for r in results] == [5, 1.0, 2]
+        assert all(r.model_used == "openai/gpt-4o-mini" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_aevaluate_batch_sends_batches_concurrently(self):
+        """Test async batched evaluation overlaps its requests and keeps order."""
+        evaluator = CommitMessageEvaluator(model_name="openai/gpt-4o-mini")
+        pairs = [(f"feat: add step {i}", f"+step_{i}()") for i in range(8)]
+        in_flight = peak = 0
+
+        async def fake_llm(prompt, response_format=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+            steps = [int(step) for step in re.findall(r"feat: add step (\d)", prompt)]
+            return orjson.dumps(
+                {
+                    "evaluations": [
+                        {
+                            "id": index,
+                            "what_score": step % 5 + 1,
+                            "why_score": 3,
+                            "reasoning": f"Evaluated step {step}",
+                            "confidence": 0.8,
+                        }
+                        for index, step in enumerate(steps)
+                    ]
+                }
+            ).decode()
+
+        with patch.object(
+            evaluator.ai_client,
+            "aevaluate_with_llm",
+            new_callable=AsyncMock,
+            side_effect=fake_llm,
+        ) as mock_llm:
+            results = await evaluator.aevaluate_batch(pairs, batch_size=2)
+
+        assert mock_llm.await_count == 4
+        assert peak == 4
+        assert [r.what_score for r in results] == [i % 5 + 1 for i in range(8)]
+
+    def test_evaluate_batch_missing_id_raises_error(self):
+        """Test batched evaluation rejects responses missing a commit."""
+        evaluator = CommitMessageEvaluator()
+
+        mock_response = """[
+            {"id": 0, "what_score": 3, "why_score": 3, "reasoning": "Average message", "confidence": 0.5}
+        ]"""
+
+        with patch.object(
+            evaluator.ai_client, "evaluate_with_llm", return_value=mock_response
+        ):
+            with pytest.raises(
+                ValueError, match="Failed to parse batch evaluation response"
+            ):
+                evaluator.evaluate_batch([("a message", "diff"), ("b message", "diff")])
+
+    @pytest.mark.parametrize(
+        ("ids", "error"),
+        [
+            ([0, 0], "Duplicate evaluation for id 0"),
+            ([0, 2], "Unexpected evaluation id 2"),
+        ],
+    )
+    def test_parse_batch_evaluation_response_rejects_misnumbered_ids(self, ids, error):
+        """Test duplicate or out of range ids cannot be matched to a commit."""
+        evaluator = CommitMessageEvaluator()
+        response = orjson.dumps(
+            [
+                {
+                    "id": evaluation_id,
+                    "what_score": 3,
+                    "why_score": 3,
+                    "reasoning": "Average message",
+                    "confidence": 0.5,
+                }
+                for evaluation_id in ids
+            ]
+        ).decode()
+
+        with pytest.raises(ValueError, match=error):
+            evaluator._parse_batch_evaluation_response(response, 2)
+
     def test_parse_evaluation_response_valid_json(self):
         """Test parsing valid JSON response."""
         evaluator = CommitMessageEvaluator()
@@ -138,3 +323,17 @@ class TestLLMEvaluator:
 
         with pytest.raises(ValueError, match="Failed to parse evaluation response"):
             evaluator._parse_evaluation_response(invalid_json)
+
+    def test_parse_evaluation_response_out_of_range_score(self):
+        """Test parsing rejects scores outside the 1-5 range."""
+        evaluator = CommitMessageEvaluator()
+
+        out_of_range_json = """{
+            "what_score": 7,
+            "why_score": 4,
+            "reasoning": "Test reasoning",
+            "confidence": 0.75
+        }"""
+
+        with pytest.raises(ValueError, match="Failed to parse evaluation response"):
+            evaluator._parse_evaluation_response(out_of_range_json)
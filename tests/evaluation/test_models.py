@@ -38,6 +38,31 @@ class TestEvaluationResult:
 
         assert result.overall_score == 3.5
 
+    def test_evaluation_result_derived_scores_computed_once(self):
+        """Test derived scores are cached and the scores they use are frozen."""
+        result = EvaluationResult(
+            what_score=4.0,
+            why_score=3.0,
+            reasoning="Test reasoning",
+            confidence=0.7,
+            model_used="openai/gpt-4o-mini",
+        )
+
+        assert result.overall_score == 3.5
+        assert result.quality_level == "Good"
+        assert result.__dict__["overall_score"] == 3.5
+
+        with pytest.raises(ValidationError):
+            result.what_score = 5.0
+
+        assert result.model_dump() == {
+            "what_score": 4.0,
+            "why_score": 3.0,
+            "reasoning": "Test reasoning",
+            "confidence": 0.7,
+            "model_used": "openai/gpt-4o-mini",
+        }
+
     def test_evaluation_result_to_dict(self):
         """Test conversion to dictionary."""
         result = EvaluationResult(
@@ -254,6 +279,20 @@ class TestQualityRater:
         assert QualityRater.get_quality_level(1.0) == "Very Poor"
         assert QualityRater.get_quality_level(0.0) == "Very Poor"
 
+    @pytest.mark.parametrize(
+        "score,expected",
+        [
+            (ScoreThresholds.EXCELLENT, "Excellent"),
+            (ScoreThresholds.GOOD, "Good"),
+            (ScoreThresholds.AVERAGE, "Average"),
+            (ScoreThresholds.POOR, "Poor"),
+            (1.49, "Very Poor"),
+        ],
+    )
+    def test_get_quality_level_thresholds_are_inclusive(self, score, expected):
+        """Test a score exactly on a threshold gets that threshold's level."""
+        assert QualityRater.get_quality_level(score) == expected
+
     def test_is_high_quality_true(self):
         """Test is_high_quality for high quality scores."""
         assert QualityRater.is_high_quality(5.0) is True
@@ -0,0 +1,112 @@
+"""
+Tests for the EvaluationService class.
+"""
+
+import threading
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from diffmage.evaluation.service import EvaluationService
+from diffmage.evaluation.models import EvaluationResult
+
+
+@pytest.fixture
+def evaluation_result():
+    """Create an EvaluationResult for testing."""
+    return EvaluationResult(
+        what_score=4.0,
+        why_score=3.0,
+        reasoning="Clear description of the change",
+        confidence=0.9,
+        model_used="openai/gpt-4o-mini",
+    )
+
+
+class TestEvaluationService:
+    """Test cases for EvaluationService class."""
+
+    @pytest.mark.asyncio
+    @patch("diffmage.evaluation.service.GitDiffParser")
+    async def test_aevaluate_commits_parses_diffs_off_the_event_loop(
+        self, mock_parser_class, evaluation_result
+    ):
+        """Test git diffs are read in a worker thread, in commit order"""
+        parse_threads = []
+
+        def parse_commits(commit_hashes):
+            parse_threads.append(threading.get_ident())
+            results = []
+            for commit_hash in commit_hashes:
+                analysis = Mock()
+                analysis.get_combined_diff.return_value = f"diff {commit_hash}"
+                results.append((analysis, f"message {commit_hash}"))
+            return results
+
+        mock_parser_class.return_value.parse_commits.side_effect = parse_commits
+
+        service = EvaluationService()
+        with patch.object(
+            service.evaluator,
+            "aevaluate_batch",
+            AsyncMock(return_value=[evaluation_result, evaluation_result]),
+        ) as mock_batch:
+            results = await service.aevaluate_commits(["abc", "def"], "/repo")
+
+        assert threading.get_ident() not in parse_threads
+        mock_parser_class.assert_called_once_with("/repo")
+        mock_parser_class.return_value.parse_commits.assert_called_once_with(
+            ["abc", "def"]
+        )
+        mock_batch.assert_awaited_once_with(
+            [("message abc", "diff abc"), ("message def", "diff def")],
+            batch_size=2,
+        )
+        assert [message for _, message in results] == ["message abc", "message def"]
+
+    @pytest.mark.asyncio
+    @patch("diffmage.evaluation.service.GitDiffParser")
+    async def test_aevaluate_commit(self, mock_parser_class, evaluation_result):
+        """Test a single commit is parsed and evaluated asynchronously"""
+        analysis = Mock()
+        analysis.get_combined_diff.return_value = "diff"
+        mock_parser_class.return_value.parse_specific_commit.return_value = (
+            analysis,
+            "feat: add thing",
+        )
+
+        service = EvaluationService()
+        with patch.object(
+            service.evaluator,
+            "aevaluate_commit_message",
+            AsyncMock(return_value=evaluation_result),
+        ) as mock_evaluate:
+            result, message = await service.aevaluate_commit("HEAD")
+
+        mock_evaluate.assert_awaited_once_with("feat: add thing", "diff")
+        assert result is evaluation_result
+        assert message == "feat: add thing"
+
+    @patch("diffmage.evaluation.service.GitDiffParser")
+    def test_evaluate_commit_reuses_parser_per_repo(
+        self, mock_parser_class, evaluation_result
+    ):
+        """Test the repository is opened once per path, not once per commit"""
+        analysis = Mock()
+        analysis.get_combined_diff.return_value = "diff"
+        mock_parser_class.return_value.parse_specific_commit.return_value = (
+            analysis,
+            "feat: add thing",
+        )
+
+        service = EvaluationService()
+        with patch.object(
+            service.evaluator,
+            "evaluate_commit_message",
+            return_value=evaluation_result,
+        ):
+            service.evaluate_commit("abc", "/repo")
+            service.evaluate_commit("def", "/repo")
+            service.evaluate_commit("abc", "/other")
+
+        assert mock_parser_class.call_count == 2
+        mock_parser_class.assert_any_call("/repo")
+        mock_parser_class.assert_any_call("/other")
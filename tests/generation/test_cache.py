@@ -0,0 +1,68 @@
+"""
+Tests for the persistent generation cache.
+"""
+
+import pytest
+from unittest.mock import patch
+from diffmage.generation.cache import GenerationCache
+from diffmage.generation.commit_message_generator import CommitMessageGenerator
+
+
+class TestGenerationCache:
+    """Test cases for GenerationCache class."""
+
+    def test_make_key_ignores_trailing_whitespace(self):
+        """Test keys match across trailing whitespace and line endings only."""
+        key = GenerationCache.make_key("model", "+def main():\n+    pass")
+
+        assert key == GenerationCache.make_key("model", "+def main():  \r\n+    pass\n")
+        assert key != GenerationCache.make_key("other", "+def main():\n+    pass")
+        assert key != GenerationCache.make_key("model", "+def main():\n+    return")
+
+    def test_make_key_keeps_indentation(self):
+        """Test opposite indentation-only changes get different keys."""
+        indent = GenerationCache.make_key("model", "-  foo()\n+    foo()")
+        dedent = GenerationCache.make_key("model", "-    foo()\n+  foo()")
+
+        assert indent != dedent
+
+    def test_set_and_get_round_trip(self, tmp_path):
+        """Test a stored message is returned from a fresh cache instance."""
+        path = tmp_path / "cache.sqlite3"
+
+        GenerationCache(path).set("key", "feat: add login")
+
+        assert GenerationCache(path).get("key") == "feat: add login"
+        assert GenerationCache(path).get("missing") is None
+
+    def test_generator_uses_cache_on_repeat_generation(self, tmp_path):
+        """Test the generator only calls the LLM once for the same diff."""
+        generator = CommitMessageGenerator(
+            model_name="openai/gpt-4o-mini",
+            cache=GenerationCache(tmp_path / "cache.sqlite3"),
+        )
+
+        with patch.object(
+            generator.client,
+            "generate_commit_message",
+            return_value="feat: add login",
+        ) as mock_llm:
+            first = generator.generate_commit_message("+login()", 1, 1, 0)
+            second = generator.generate_commit_message("+login()", 1, 1, 0)
+
+        mock_llm.assert_called_once()
+        assert first == second
+
+    @pytest.mark.parametrize(
+        ("env_value", "enabled"), [(None, False), ("0", False), ("1", True)]
+    )
+    def test_generator_cache_env_switch(self, monkeypatch, env_value, enabled):
+        """Test DIFFMAGE_GENERATION_CACHE opts the generator into caching."""
+        if env_value is None:
+            monkeypatch.delenv("DIFFMAGE_GENERATION_CACHE", raising=False)
+        else:
+            monkeypatch.setenv("DIFFMAGE_GENERATION_CACHE", env_value)
+
+        generator = CommitMessageGenerator(model_name="openai/gpt-4o-mini")
+
+        assert (generator.cache is not None) is enabled
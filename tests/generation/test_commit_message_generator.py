@@ -3,8 +3,11 @@ Tests for the CommitMessageGenerator class.
 """
 
 import pytest
-from unittest.mock import Mock, patch
-from diffmage.generation.commit_message_generator import CommitMessageGenerator
+from unittest.mock import AsyncMock, Mock, patch
+from diffmage.generation.commit_message_generator import (
+    CommitMessageGenerator,
+    _summarize_diff,
+)
 from diffmage.generation.models import GenerationResult
 from diffmage.ai.client import AIClient
 
@@ -40,6 +43,15 @@ class TestCommitMessageGenerator:
 
         assert generator.client.temperature == 0.0
 
+    def test_init_with_shared_client(self):
+        """Test CommitMessageGenerator reuses an AIClient passed in by the caller."""
+        client = AIClient(model_name="openai/gpt-4o-mini")
+        generator = CommitMessageGenerator(
+            model_name="openai/gpt-4o-mini", client=client
+        )
+
+        assert generator.client is client
+
     def test_generate_commit_message_success(self):
         """Test successful commit message generation."""
         generator = CommitMessageGenerator(model_name="openai/gpt-4o-mini")
@@ -79,6 +91,52 @@ class TestCommitMessageGenerator:
             with pytest.raises(ValueError, match="Error generating commit message"):
                 generator.generate_commit_message("test diff")
 
+    def test_generate_commit_message_summarizes_oversize_diff(self):
+        """Test a diff over the prompt budget is sent with hunks trimmed."""
+        generator = CommitMessageGenerator(model_name="openai/gpt-4o-mini")
+        body = "\n".join(f"+line {i}" for i in range(500))
+        git_diff = f"--- a.py\n+++ a.py\n@@ -0,0 +1,500 @@\n{body}"
+        budget = len(generator._build_prompt(git_diff, 1, 500, 0)) - 1
+
+        with (
+            patch.object(generator, "_max_prompt_chars", return_value=budget),
+            patch.object(
+                generator.client, "generate_commit_message", return_value="feat: x"
+            ) as mock_generate,
+        ):
+            generator.generate_commit_message(git_diff, 1, 500, 0)
+
+        prompt = mock_generate.call_args[0][0]
+        assert "@@ -0,0 +1,500 @@" in prompt
+        assert "+line 19" in prompt
+        assert "+line 20\n" not in prompt
+        assert "... 480 more lines" in prompt
+
+    def test_generate_commit_message_rejects_diff_too_large_to_summarize(self):
+        """Test the LLM is not called when even the summary exceeds the budget."""
+        generator = CommitMessageGenerator(model_name="openai/gpt-4o-mini")
+
+        with (
+            patch.object(generator, "_max_prompt_chars", return_value=10),
+            patch.object(generator.client, "generate_commit_message") as mock_generate,
+        ):
+            with pytest.raises(ValueError, match="too large"):
+                generator.generate_commit_message("--- a.py\n+++ a.py\n@@ -1 +1 @@\n+x")
+
+        mock_generate.assert_not_called()
+
+    def test_summarize_diff_keeps_headers_and_file_separators(self):
+        """Test summarizing trims each hunk body but keeps every file and hunk."""
+        git_diff = (
+            "--- a.py\n+++ a.py\n@@ -1,4 +1,4 @@\n a\n-b\n+c\n d\n"
+            "\n--- b.py\n+++ b.py\n@@ -1 +1,2 @@\n x\n+y"
+        )
+
+        assert _summarize_diff(git_diff, 2) == (
+            "--- a.py\n+++ a.py\n@@ -1,4 +1,4 @@\n a\n-b\n... 2 more lines\n"
+            "\n--- b.py\n+++ b.py\n@@ -1 +1,2 @@\n x\n+y"
+        )
+
     def test_build_prompt(self):
         """Test prompt building."""
         generator = CommitMessageGenerator()
@@ -152,3 +210,22 @@ class TestCommitMessageGenerator:
                     ValueError, match="Error enhancing commit message with why context"
                 ):
                     generator.enhance_with_why_context(initial_result, why_context)
+
+    @pytest.mark.asyncio
+    async def test_agenerate_commit_message_with_why_context(self):
+        """Test async generation and why context enhancement await the client."""
+        generator = CommitMessageGenerator(model_name="openai/gpt-4o-mini")
+
+        with patch.object(
+            generator.client,
+            "agenerate_commit_message",
+            AsyncMock(side_effect=["feat: add auth  ", "feat: add OAuth2 auth"]),
+        ) as mock_generate:
+            result = await generator.agenerate_commit_message("test diff", 1, 5, 2)
+            enhanced = await generator.aenhance_with_why_context(
+                result, "Security compliance"
+            )
+
+        assert result.message == "feat: add auth"
+        assert enhanced.message == "feat: add OAuth2 auth"
+        assert mock_generate.await_count == 2
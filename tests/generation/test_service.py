@@ -2,8 +2,9 @@
 Tests for the GenerationService class.
 """
 
+import threading
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from diffmage.generation.service import GenerationService
 from diffmage.generation.models import GenerationResult, GenerationRequest
 from diffmage.core.models import (
@@ -25,24 +26,18 @@ class TestGenerationService:
         # Create a mock hunk with some content
         hunk_line1 = HunkLine(
             line_type=" ",
-            is_removed=False,
-            is_added=False,
-            is_context=True,
             content="def example_function():",
             old_line_number=1,
             new_line_number=1,
         )
         hunk_line2 = HunkLine(
             line_type="+",
-            is_removed=False,
-            is_added=True,
-            is_context=False,
             content="    print('Hello, world!')",
             old_line_number=None,
             new_line_number=2,
         )
 
-        hunk = DiffHunk(
+        hunk = DiffHunk.from_lines(
             old_start_line=1,
             old_lines_count=1,
             new_start_line=1,
@@ -176,3 +171,43 @@ class TestGenerationService:
         # Verify enhance was NOT called
         mock_generator.generate_commit_message.assert_called_once()
         mock_generator.enhance_with_why_context.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("diffmage.generation.service.CommitMessageGenerator")
+    @patch("diffmage.generation.service.GitDiffParser")
+    async def test_agenerate_commit_message_with_why_context(
+        self, mock_git_parser_class, mock_generator_class, mock_commit_analysis
+    ):
+        """Test async generation parses off the event loop, then enhances."""
+        parse_threads = []
+
+        def parse_staged_changes():
+            parse_threads.append(threading.get_ident())
+            return mock_commit_analysis
+
+        mock_git_parser_class.return_value.parse_staged_changes.side_effect = (
+            parse_staged_changes
+        )
+
+        initial_result = GenerationResult(message="feat: add new feature")
+        enhanced_result = GenerationResult(message="feat: add auth for security")
+        mock_generator = Mock()
+        mock_generator.agenerate_commit_message = AsyncMock(return_value=initial_result)
+        mock_generator.aenhance_with_why_context = AsyncMock(
+            return_value=enhanced_result
+        )
+        mock_generator_class.return_value = mock_generator
+
+        service = GenerationService(model_name="openai/gpt-4o-mini")
+        result = await service.agenerate_commit_message(
+            GenerationRequest(repo_path="."), why_context="Security"
+        )
+
+        assert result is enhanced_result
+        assert parse_threads and threading.get_ident() not in parse_threads
+        mock_generator.agenerate_commit_message.assert_awaited_once_with(
+            mock_commit_analysis.get_combined_diff(), 1, 1, 0
+        )
+        mock_generator.aenhance_with_why_context.assert_awaited_once_with(
+            initial_result, "Security"
+        )
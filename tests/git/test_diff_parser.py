@@ -1,9 +1,17 @@
+import gc
+import weakref
+from pathlib import Path
+
 import pytest
-from unittest.mock import Mock
-from diffmage.git.diff_parser import GitDiffParser
+from unittest.mock import Mock, PropertyMock
+from diffmage.git.diff_parser import (
+    EMPTY_TREE_SHA,
+    MAX_FILE_DIFF_LINES,
+    GitDiffParser,
+    _commit_diff_text,
+)
 from diffmage.core.models import ChangeType, FileType, FileDiff, CommitAnalysis
 import git
-from unidiff.errors import UnidiffParseError
 
 
 @pytest.fixture
@@ -13,9 +21,9 @@ def parser() -> GitDiffParser:
 
 
 @pytest.fixture
-def mock_repo() -> Mock:
-    """Create a mock git repo for testing."""
-    return Mock()
+def mock_repo(tmp_path: Path) -> Mock:
+    """Create a mock git repo for testing, with its own git dir per test."""
+    return Mock(git_dir=str(tmp_path / ".git"))
 
 
 @pytest.fixture
@@ -47,10 +55,6 @@ def test_convert_patched_file_added_file(parser: GitDiffParser) -> None:
     mock_patched_file.added = 10
     mock_patched_file.removed = 0
     mock_patched_file.hunks = []
-    mock_patched_file.__iter__ = Mock(return_value=iter([]))
-
-    parser.file_detector = Mock()
-    parser.file_detector.detect_file_type = Mock(return_value=FileType.SOURCE_CODE)
 
     file_diff = parser._convert_patched_file(mock_patched_file)
 
@@ -77,10 +81,7 @@ def test_convert_patched_file_modified_file(parser: GitDiffParser) -> None:
     mock_patched_file.is_binary_file = False
     mock_patched_file.added = 5
     mock_patched_file.removed = 3
-    mock_patched_file.__iter__ = Mock(return_value=iter([]))
-
-    parser.file_detector = Mock()
-    parser.file_detector.detect_file_type = Mock(return_value=FileType.SOURCE_CODE)
+    mock_patched_file.hunks = []
 
     file_diff = parser._convert_patched_file(mock_patched_file)
 
@@ -107,10 +108,7 @@ def test_convert_patched_file_deleted_file(parser: GitDiffParser) -> None:
     mock_patched_file.is_binary_file = False
     mock_patched_file.added = 0
     mock_patched_file.removed = 8
-    mock_patched_file.__iter__ = Mock(return_value=iter([]))
-
-    parser.file_detector = Mock()
-    parser.file_detector.detect_file_type = Mock(return_value=FileType.SOURCE_CODE)
+    mock_patched_file.hunks = []
 
     file_diff = parser._convert_patched_file(mock_patched_file)
 
@@ -137,10 +135,7 @@ def test_convert_patched_file_renamed_file(parser: GitDiffParser) -> None:
     mock_patched_file.is_binary_file = False
     mock_patched_file.added = 2
     mock_patched_file.removed = 1
-    mock_patched_file.__iter__ = Mock(return_value=iter([]))
-
-    parser.file_detector = Mock()
-    parser.file_detector.detect_file_type = Mock(return_value=FileType.SOURCE_CODE)
+    mock_patched_file.hunks = []
 
     file_diff = parser._convert_patched_file(mock_patched_file)
 
@@ -159,7 +154,9 @@ def test_convert_patched_file_exception_handling(parser: GitDiffParser) -> None:
 
     mock_patched_file = Mock()
     mock_patched_file.path = "src/file.py"
-    type(mock_patched_file).is_rename = Mock(side_effect=Exception("Test exception"))
+    type(mock_patched_file).is_rename = PropertyMock(
+        side_effect=Exception("Test exception")
+    )
 
     file_diff = parser._convert_patched_file(mock_patched_file)
 
@@ -212,12 +209,13 @@ def test_parse_staged_changes_git_command_error(
         parser.parse_staged_changes()
 
 
+@pytest.mark.parametrize("diff_text", ["", "\n  \n"])
 def test_parse_staged_changes_no_staged_changes(
-    parser: GitDiffParser, mock_repo: Mock
+    parser: GitDiffParser, mock_repo: Mock, diff_text: str
 ) -> None:
     """Test parse_staged_changes when no staged changes are found"""
 
-    mock_repo.git.diff.return_value = ""
+    mock_repo.git.diff.return_value = diff_text
     mock_repo.active_branch.name = "main"
     parser.repo = mock_repo
 
@@ -236,8 +234,8 @@ def test_parse_staged_changes_diff_parsing_error(
 
     with pytest.MonkeyPatch().context() as m:
         m.setattr(
-            "diffmage.git.diff_parser.PatchSet",
-            Mock(side_effect=UnidiffParseError("Parse error")),
+            "diffmage.git.diff_parser.parse_unified_diff",
+            Mock(side_effect=ValueError("Parse error")),
         )
 
         with pytest.raises(ValueError):
@@ -270,3 +268,194 @@ def test_parse_staged_changes_empty_file_list(
     assert result.total_lines_removed == 0
     assert result.branch_name == "main"
     assert len(result.files) == 0
+
+
+def test_parse_specific_commit_caches_diff_text(
+    parser: GitDiffParser, mock_repo: Mock
+) -> None:
+    """Test parsing the same commit twice only runs git diff once"""
+
+    mock_repo.commit.return_value = Mock(
+        hexsha="a" * 40, parents=[Mock()], message="feat: add main\n"
+    )
+    mock_repo.git.diff.return_value = """diff --git a/src/main.py b/src/main.py
+--- a/src/main.py
++++ b/src/main.py
+@@ -1,1 +1,2 @@
+ def main():
++    print("Hello, world!")
+"""
+    mock_repo.active_branch.name = "main"
+    parser.repo = mock_repo
+
+    first, message = parser.parse_specific_commit("HEAD")
+    second, _ = parser.parse_specific_commit("a" * 40)
+
+    mock_repo.git.diff.assert_called_once_with("a" * 40 + "~1", "a" * 40, "--no-color")
+    assert message == "feat: add main"
+    assert first.total_lines_added == second.total_lines_added == 1
+
+
+def test_commit_diff_cache_is_keyed_by_git_dir_not_repo() -> None:
+    """Test repos over the same git dir share entries without being kept alive"""
+
+    def make_repo() -> Mock:
+        repo = Mock(git_dir="/tmp/cache-key-repo/.git")
+        repo.git.diff.return_value = "diff --git a/a.txt b/a.txt\n"
+        return repo
+
+    first_repo = make_repo()
+    second_repo = make_repo()
+
+    _commit_diff_text(first_repo, "c" * 40, is_root=False)
+    _commit_diff_text(second_repo, "c" * 40, is_root=False)
+
+    second_repo.git.diff.assert_not_called()
+
+    repo_ref = weakref.ref(first_repo)
+    del first_repo
+    gc.collect()
+    assert repo_ref() is None
+
+
+def test_parse_specific_commit_root_commit_diffs_empty_tree(
+    parser: GitDiffParser, mock_repo: Mock
+) -> None:
+    """Test a commit without parents is diffed against the empty tree"""
+
+    mock_repo.commit.return_value = Mock(hexsha="b" * 40, parents=[], message="init")
+    mock_repo.git.diff.return_value = """diff --git a/README.md b/README.md
+new file mode 100644
+--- /dev/null
++++ b/README.md
+@@ -0,0 +1 @@
++# Project
+"""
+    mock_repo.active_branch.name = "main"
+    parser.repo = mock_repo
+
+    parser.parse_specific_commit("HEAD")
+
+    mock_repo.git.diff.assert_called_once_with(EMPTY_TREE_SHA, "b" * 40, "--no-color")
+
+
+def test_parse_commits_reads_all_commits_with_one_git_log(
+    parser: GitDiffParser, mock_repo: Mock
+) -> None:
+    """Test several commits are parsed from a single git log, in request order"""
+
+    first, second = "a" * 40, "b" * 40
+    mock_repo.git.rev_parse.return_value = f"{second}\n{first}"
+    mock_repo.git.log.return_value = (
+        f"\0{first}\0feat: add main\n\0\n"
+        "diff --git a/src/main.py b/src/main.py\n"
+        "--- a/src/main.py\n"
+        "+++ b/src/main.py\n"
+        "@@ -1 +1,2 @@\n"
+        " def main():\n"
+        "+    pass\n"
+        f"\0{second}\0fix: drop pass\n\nBody\n\0\n"
+        "diff --git a/src/main.py b/src/main.py\n"
+        "--- a/src/main.py\n"
+        "+++ b/src/main.py\n"
+        "@@ -1,2 +1 @@\n"
+        " def main():\n"
+        "-    pass"
+    )
+    mock_repo.active_branch.name = "main"
+    parser.repo = mock_repo
+
+    results = parser.parse_commits(["HEAD", "HEAD~1"])
+
+    mock_repo.git.log.assert_called_once()
+    assert [message for _, message in results] == [
+        "fix: drop pass\n\nBody",
+        "feat: add main",
+    ]
+    assert [analysis.total_lines_removed for analysis, _ in results] == [1, 0]
+    mock_repo.git.diff.assert_not_called()
+
+
+def test_parse_diff_text_builds_hunk_columns(
+    parser: GitDiffParser, mock_repo: Mock
+) -> None:
+    """Test hunk lines are parsed into aligned type/content/line-number columns"""
+
+    diff_text = (
+        "diff --git a/src/main.py b/src/main.py\n"
+        "index 1234567..89abcde 100644\n"
+        "--- a/src/main.py\n"
+        "+++ b/src/main.py\n"
+        "@@ -1,2 +1,2 @@ def main():\n"
+        " def main():\n"
+        '-    print("Goodbye")\n'
+        '+    print("Hello")\n'
+    )
+    mock_repo.active_branch.name = "main"
+    parser.repo = mock_repo
+
+    result = parser._parse_diff_text(diff_text, "test diff")
+
+    hunk = result.files[0].hunks[0]
+    assert hunk.line_types == " -+"
+    assert hunk.contents == [
+        "def main():",
+        '    print("Goodbye")',
+        '    print("Hello")',
+    ]
+    assert hunk.old_line_numbers == [1, 2, None]
+    assert hunk.new_line_numbers == [1, None, 2]
+    assert hunk.section_header == "def main():"
+    assert hunk.added_lines == ['    print("Hello")']
+    assert hunk.removed_lines == ['    print("Goodbye")']
+
+
+@pytest.mark.parametrize(
+    ("path", "added_lines", "is_truncated"),
+    [
+        ("src/main.py", 3, False),
+        ("frontend/package-lock.json", 3, True),
+        ("src/generated.py", MAX_FILE_DIFF_LINES + 1, True),
+    ],
+)
+def test_parse_diff_text_omits_hunks_of_large_and_lock_files(
+    parser: GitDiffParser,
+    mock_repo: Mock,
+    path: str,
+    added_lines: int,
+    is_truncated: bool,
+) -> None:
+    """Test lockfiles and very large changes keep their counts but not hunks"""
+
+    diff_text = (
+        f"diff --git a/{path} b/{path}\n"
+        f"--- a/{path}\n"
+        f"+++ b/{path}\n"
+        f"@@ -0,0 +1,{added_lines} @@\n" + "+x\n" * added_lines
+    )
+    mock_repo.active_branch.name = "main"
+    parser.repo = mock_repo
+
+    [file_diff] = parser._parse_diff_text(diff_text, "test diff").files
+
+    assert file_diff.is_truncated is is_truncated
+    assert bool(file_diff.hunks) is not is_truncated
+    assert file_diff.lines_added == added_lines
+
+
+def test_branch_name_is_read_once_per_parser(
+    parser: GitDiffParser, mock_repo: Mock
+) -> None:
+    """Test HEAD is resolved once, not on every parse"""
+
+    active_branch = PropertyMock(return_value=Mock())
+    active_branch.return_value.name = "main"
+    type(mock_repo).active_branch = active_branch
+    parser.repo = mock_repo
+    diff_text = "diff --git a/a.py b/a.py\n@@ -1 +1 @@\n-a\n+b\n"
+
+    first = parser._parse_diff_text(diff_text, "first diff")
+    second = parser._parse_diff_text(diff_text, "second diff")
+
+    assert first.branch_name == second.branch_name == "main"
+    active_branch.assert_called_once()
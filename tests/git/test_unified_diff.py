@@ -0,0 +1,150 @@
+import pytest
+from diffmage.git.unified_diff import parse_unified_diff
+
+
+def test_parse_unified_diff_modified_file() -> None:
+    """Test a modified file's hunk is parsed into aligned columns"""
+
+    diff_text = (
+        "diff --git a/src/main.py b/src/main.py\n"
+        "index 1234567..89abcde 100644\n"
+        "--- a/src/main.py\n"
+        "+++ b/src/main.py\n"
+        "@@ -1,3 +1,3 @@ def main():\n"
+        " def main():\n"
+        '-    print("Goodbye")\n'
+        '+    print("Hello")\n'
+        "     return 0\n"
+    )
+
+    [patched_file] = parse_unified_diff(diff_text)
+
+    assert patched_file.path == "src/main.py"
+    assert patched_file.source_file == "a/src/main.py"
+    assert patched_file.target_file == "b/src/main.py"
+    assert (patched_file.added, patched_file.removed) == (1, 1)
+    assert not (
+        patched_file.is_rename
+        or patched_file.is_added_file
+        or patched_file.is_removed_file
+    )
+
+    [hunk] = patched_file.hunks
+    assert hunk.section_header == "def main():"
+    assert hunk.line_types == " -+ "
+    assert hunk.old_line_numbers == [1, 2, None, 3]
+    assert hunk.new_line_numbers == [1, None, 2, 3]
+
+
+def test_parse_unified_diff_header_like_lines_in_hunk() -> None:
+    """Test removed/added lines that look like file headers stay hunk content"""
+
+    diff_text = (
+        "diff --git a/notes.md b/notes.md\n"
+        "--- a/notes.md\n"
+        "+++ b/notes.md\n"
+        "@@ -1,2 +1,2 @@\n"
+        "-- item\n"
+        "+++ item\n"
+        " \n"
+    )
+
+    [patched_file] = parse_unified_diff(diff_text)
+
+    assert patched_file.hunks[0].contents == ["- item", "++ item", ""]
+    assert (patched_file.added, patched_file.removed) == (1, 1)
+
+
+def test_parse_unified_diff_no_newline_marker() -> None:
+    """Test "\\ No newline" markers are kept without line numbers"""
+
+    diff_text = (
+        "diff --git a/a.txt b/a.txt\n"
+        "--- a/a.txt\n"
+        "+++ b/a.txt\n"
+        "@@ -1 +1 @@\n"
+        "-old\n"
+        "\\ No newline at end of file\n"
+        "+new\n"
+        "\\ No newline at end of file\n"
+    )
+
+    [hunk] = parse_unified_diff(diff_text)[0].hunks
+
+    assert hunk.line_types == "-\\+\\"
+    assert hunk.contents[1] == " No newline at end of file"
+    assert hunk.old_line_numbers == [1, None, None, None]
+    assert hunk.new_line_numbers == [None, None, 1, None]
+
+
+def test_parse_unified_diff_file_headers() -> None:
+    """Test added, deleted, renamed and binary files from their git headers"""
+
+    diff_text = (
+        "diff --git a/old.py b/new.py\n"
+        "similarity index 100%\n"
+        "rename from old.py\n"
+        "rename to new.py\n"
+        "diff --git a/logo.png b/logo.png\n"
+        "new file mode 100644\n"
+        "Binary files /dev/null and b/logo.png differ\n"
+        "diff --git a/gone.py b/gone.py\n"
+        "deleted file mode 100644\n"
+        "--- a/gone.py\n"
+        "+++ /dev/null\n"
+        "@@ -1 +0,0 @@\n"
+        "-x = 1\n"
+    )
+
+    renamed, added, deleted = parse_unified_diff(diff_text)
+
+    assert renamed.is_rename
+    assert renamed.path == "new.py"
+    assert renamed.hunks == []
+
+    assert added.is_added_file
+    assert added.is_binary_file
+    assert added.path == "logo.png"
+
+    assert deleted.is_removed_file
+    assert deleted.target_file == "/dev/null"
+    assert deleted.removed == 1
+
+
+@pytest.mark.parametrize(
+    ("header", "is_rename", "path"),
+    [
+        ('diff --git "a/caf\\303\\251.py" b/cafe.py', True, "cafe.py"),
+        ('diff --git "a/my file.py" "b/my file.py"', False, '"my file.py"'),
+        ("diff --git old_a.py new_a.py", True, "new_a.py"),
+        ("diff --git xa.py ya.py", True, "ya.py"),
+        ("diff --git src/main.py src/main.py", False, "src/main.py"),
+        ("diff --git i/main.py w/main.py", False, "main.py"),
+    ],
+)
+def test_parse_unified_diff_rename_detection(
+    header: str, is_rename: bool, path: str
+) -> None:
+    """Test renames are detected from quoted, unprefixed and mnemonic headers"""
+
+    [patched_file] = parse_unified_diff(header + "\n")
+
+    assert patched_file.is_rename is is_rename
+    assert patched_file.path == path
+
+
+@pytest.mark.parametrize(
+    "hunk_body",
+    [
+        " a\n",  # shorter than the header says
+        " a\n-b\n-c\n",  # longer than the header says
+        " a\n?b\n",  # not a diff line
+    ],
+)
+def test_parse_unified_diff_malformed_hunk(hunk_body: str) -> None:
+    """Test hunks that do not match their header are rejected"""
+
+    diff_text = "diff --git a/a.txt b/a.txt\n@@ -1,3 +1,3 @@\n" + hunk_body
+
+    with pytest.raises(ValueError):
+        parse_unified_diff(diff_text)
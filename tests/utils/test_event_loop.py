@@ -0,0 +1,30 @@
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from diffmage.utils import event_loop
+
+
+async def _answer() -> int:
+    await asyncio.sleep(0)
+    return 42
+
+
+def test_run_without_uvloop_uses_default_loop() -> None:
+    """Test coroutines run on asyncio's own loop when uvloop is missing"""
+    with patch.dict(sys.modules, {"uvloop": None}):
+        assert event_loop._loop_factory() is None
+        assert event_loop.run(_answer()) == 42
+
+
+def test_run_uses_uvloop_when_installed() -> None:
+    """Test the uvloop loop factory is used when uvloop can be imported"""
+    new_event_loop = Mock(side_effect=asyncio.new_event_loop)
+
+    with patch.dict(
+        sys.modules, {"uvloop": SimpleNamespace(new_event_loop=new_event_loop)}
+    ):
+        assert event_loop.run(_answer()) == 42
+
+    new_event_loop.assert_called_once()
@@ -0,0 +1,35 @@
+from typing import Iterator
+
+from diffmage.utils.json_stream import read_json_object
+
+
+def test_read_json_object_joins_chunks() -> None:
+    """Test an object split across chunks is reassembled"""
+    chunks = ['{"what_', 'score": 4, "reasoning": ', '"ok"}']
+
+    assert read_json_object(chunks) == '{"what_score": 4, "reasoning": "ok"}'
+
+
+def test_read_json_object_ignores_braces_in_strings() -> None:
+    """Test braces and escaped quotes inside strings do not end the object"""
+    text = '{"reasoning": "uses {braces} and \\"quotes}\\"", "nested": {"a": 1}}'
+
+    assert read_json_object([text[:20], text[20:]]) == text
+
+
+def test_read_json_object_stops_after_object_closes() -> None:
+    """Test the stream is not consumed past the end of the object"""
+    consumed: list[str] = []
+
+    def chunks() -> Iterator[str]:
+        for chunk in ["Sure! ", '{"a": 1}', " trailing", " text"]:
+            consumed.append(chunk)
+            yield chunk
+
+    assert read_json_object(chunks()) == '{"a": 1}'
+    assert consumed == ["Sure! ", '{"a": 1}']
+
+
+def test_read_json_object_returns_partial_text_when_unterminated() -> None:
+    """Test an incomplete stream is returned as received"""
+    assert read_json_object(['{"a": ', "1"]) == '{"a": 1'